@@ -0,0 +1,69 @@
+"""Benchmark LoggerMixin throughput, with and without the log queue,
+with several threads logging at once.
+
+Usage: python profiling/logging_throughput.py [threads] [messages]
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from time_tracker.logger import LoggerMixin
+
+
+def run(use_queue: bool, n_threads: int, n_messages: int, directory: Path):
+    """Log `n_messages` from each of `n_threads` threads.
+
+    Returns:
+        tuple[float, float]: Seconds until all threads returned, and
+            seconds until all records were written.
+    """
+
+    class Bench(LoggerMixin):  # pylint: disable=too-few-public-methods
+        """Benchmark class."""
+
+    bench = Bench(
+        logger_filename=directory / f"queue_{use_queue}.log",
+        use_queue=use_queue,
+    )
+
+    def work():
+        for i in range(n_messages):
+            bench.logger.warning("message %d", i)
+
+    threads = [threading.Thread(target=work) for _ in range(n_threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    returned = time.perf_counter() - start
+    LoggerMixin.stop_log_queue()
+    written = time.perf_counter() - start
+    bench.logger_handler.close()
+    return returned, written
+
+
+def main():
+    """Run the benchmark and print a table of results."""
+    n_threads = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    n_messages = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    total = n_threads * n_messages
+    print(f"{n_threads} threads x {n_messages} messages")
+    print(f"{'mode':<8}{'callers (msg/s)':>18}{'written (msg/s)':>18}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for use_queue in (False, True):
+            returned, written = run(
+                use_queue, n_threads, n_messages, Path(tmp)
+            )
+            mode = "queue" if use_queue else "direct"
+            print(
+                f"{mode:<8}{total / returned:>18,.0f}"
+                f"{total / written:>18,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
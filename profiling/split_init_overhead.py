@@ -0,0 +1,92 @@
+"""Benchmark the per-instantiation overhead of SplitInitMixin and
+auto_split_init, with dynamic and compiled (generated) routing.
+
+Usage: python profiling/split_init_overhead.py [instantiations]
+"""
+
+import contextlib
+import io
+import sys
+import timeit
+
+from time_tracker.utils import SplitInitMixin, auto_split_init
+
+
+class A:  # pylint: disable=too-few-public-methods
+    """Class accepting one positional arg."""
+
+    def __init__(self, a):
+        self.a = a
+
+
+class B:  # pylint: disable=too-few-public-methods
+    """Class accepting variable kwargs."""
+
+    def __init__(self, b=0, **kwargs):
+        self.b = b
+        self.b_kwargs = kwargs
+        super().__init__()
+
+
+class C:  # pylint: disable=too-few-public-methods
+    """Class accepting a keyword-only arg."""
+
+    def __init__(self, c=None, *, d=1):
+        self.c = c
+        self.d = d
+
+
+class Plain(A, B, C):  # pylint: disable=too-few-public-methods
+    """Hand-written routing, for reference."""
+
+    def __init__(self, a, b=0, c=None, d=1, **kwargs):
+        # pylint: disable=non-parent-init-called
+        A.__init__(self, a)
+        B.__init__(self, b=b, **kwargs)
+        C.__init__(self, c, d=d)
+
+
+class Dynamic(SplitInitMixin, A, B, C):
+    """Mixin with dynamic routing."""
+
+    split_init_compiled = False
+
+
+class Compiled(SplitInitMixin, A, B, C):
+    """Mixin with compiled routing."""
+
+    split_init_compiled = True
+
+
+@auto_split_init
+class DecoratedDynamic(A, B, C):  # pylint: disable=too-few-public-methods
+    """Decorator with dynamic routing."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+@auto_split_init(compiled=True)
+class DecoratedCompiled(A, B, C):  # pylint: disable=too-few-public-methods
+    """Decorator with compiled routing."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+def main():
+    """Time each class and print the per-instantiation cost."""
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"{'class':<20}{'us/instantiation':>18}")
+    for cls in (Plain, Dynamic, Compiled, DecoratedDynamic, DecoratedCompiled):
+        # share_missing_params_across_parents prints on every call:
+        with contextlib.redirect_stdout(io.StringIO()):
+            cls(1, b=2, d=3, extra=4)  # Warm up the caches.
+            seconds = timeit.timeit(
+                lambda cls=cls: cls(1, b=2, d=3, extra=4), number=number
+            )
+        print(f"{cls.__name__:<20}{seconds / number * 1e6:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
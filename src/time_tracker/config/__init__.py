@@ -1,7 +1,18 @@
 """Expose Config class to module."""
 
 from .base_config import Party
-from .client_config import Client, ClientConfig, load_client_config
-from .invoice_state_config import InvoiceState, get_next_invoice_number
+from .client_config import (
+    Client,
+    ClientConfig,
+    LazyClientConfig,
+    ShardedClientConfig,
+    load_client_config,
+)
+from .config_cache import clear_config_cache, load_validated_config
+from .invoice_state_config import (
+    InvoiceState,
+    get_next_invoice_number,
+    peek_next_invoice_number,
+)
 from .load_config import settings
 from .me_config import Me, load_me_config, prepare_logo_for_latex
@@ -1,20 +1,55 @@
 """This file holds base classes to hold party information."""
 
 # import re
-from typing import Any
+from functools import lru_cache
+from typing import Annotated, Any
 
 import phonenumbers
-from pydantic import BaseModel, EmailStr, field_validator
+from pydantic import AfterValidator, BaseModel, field_validator
+from pydantic.networks import validate_email
 
 NEWLINE = "\n"
 
 
+# Phone and email normalization is the bulk of validating a Party, and
+# the same raw values recur across configs (and reloads of them), so
+# results are memoized by the raw string. Errors aren't cached. The memo
+# only lasts for the process: across runs, lazy validation (see
+# LazyClientConfig) already limits the work to the selected client, and
+# config snapshots (the config_snapshot_dir setting) skip reloading
+# unchanged files.
+@lru_cache(maxsize=4096)
+def normalize_phone(v: str) -> str:
+    """Validate a phone number and format it internationally."""
+    try:  # pylint: disable=too-many-try-statements
+        parsed = phonenumbers.parse(
+            v, "US"
+        )  # You can use "None" for unknown regions
+        if not phonenumbers.is_valid_number(parsed):
+            raise ValueError(f"Invalid phone number: {v}")
+    except phonenumbers.NumberParseException as e:
+        raise ValueError(f"Invalid phone number format: {e}") from e
+    return phonenumbers.format_number(
+        parsed, phonenumbers.PhoneNumberFormat.INTERNATIONAL
+    )
+
+
+@lru_cache(maxsize=4096)
+def normalize_email(v: str) -> str:
+    """Validate an email address and normalize it, as EmailStr does."""
+    return validate_email(v)[1]
+
+
+# EmailStr, with memoized validation:
+CachedEmailStr = Annotated[str, AfterValidator(normalize_email)]
+
+
 class Party(BaseModel):
     """Base class for parties of contracts (e.g., clients, me)."""
 
     name: str
     address: str
-    email: EmailStr
+    email: CachedEmailStr
     phone: str
 
     @field_validator("address")
@@ -42,14 +77,4 @@ class Party(BaseModel):
         # if not re.fullmatch(r"\d{3}-\d{3}-\d{4}", v):
         #     raise ValueError("Phone number must be in the format XXX-XXX-XXXX")
         # return v
-        try:  # pylint: disable=too-many-try-statements
-            parsed = phonenumbers.parse(
-                v, "US"
-            )  # You can use "None" for unknown regions
-            if not phonenumbers.is_valid_number(parsed):
-                raise ValueError(f"Invalid phone number: {v}")
-        except phonenumbers.NumberParseException as e:
-            raise ValueError(f"Invalid phone number format: {e}") from e
-        return phonenumbers.format_number(
-            parsed, phonenumbers.PhoneNumberFormat.INTERNATIONAL
-        )
+        return normalize_phone(v)
@@ -1,4 +1,5 @@
 """Client configuration helpers."""
 
+from .client_directory import ShardedClientConfig, load_client_index
 from .client_loader import load_client_config
-from .client_models import Client, ClientConfig
+from .client_models import Client, ClientConfig, LazyClientConfig, LazyClients
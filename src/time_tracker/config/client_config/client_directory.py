@@ -0,0 +1,176 @@
+"""This file contains a client config split into one file per client."""
+
+import json
+import os
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from ..config_cache import YAML_SUFFIXES, load_validated_config
+from .client_models import Client, LazyClientConfig, LazyClientsBase
+
+CLIENT_INDEX_FILENAME = ".index.json"
+CLIENT_FILE_SUFFIXES = (".json", *YAML_SUFFIXES)
+# The coarsest mtime resolution of common filesystems (FAT's 2 s):
+MTIME_RESOLUTION_NS = 2_000_000_000
+
+
+def scan_client_files(directory: Path) -> dict[str, list[int]]:
+    """List the client files of a client config directory, with their
+    [mtime_ns, size] (as stored in its index)."""
+    files: dict[str, list[int]] = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if (
+                entry.name == CLIENT_INDEX_FILENAME
+                or Path(entry.name).suffix.lower() not in CLIENT_FILE_SUFFIXES
+                or not entry.is_file()
+            ):
+                continue
+            stat = entry.stat()
+            files[entry.name] = [stat.st_mtime_ns, stat.st_size]
+    return files
+
+
+def build_client_index(
+    directory: Path, names: Iterable[str]
+) -> dict[str, str]:
+    """Map the client keys (file stems) of a client config directory's
+    files (see scan_client_files) to their names."""
+    index: dict[str, str] = {}
+    for name in sorted(names):
+        if (stem := Path(name).stem) in index:
+            raise ValueError(
+                f"Client {stem} has more than one file in {directory}: "
+                f"{index[stem]}, {name}."
+            )
+        index[stem] = name
+    return index
+
+
+def _read_client_index(index_file: Path) -> dict[str, Any]:
+    """Read a stored client index, or an empty one if it's unreadable."""
+    try:
+        stored = json.loads(index_file.read_text(encoding="utf8"))
+    except (OSError, ValueError):
+        return {}
+    return stored if isinstance(stored, dict) else {}
+
+
+def _write_client_index(
+    index_file: Path, index: dict[str, Any], in_place: bool = False
+):
+    """Write a client index, atomically (through a temporary file), or in
+    place, which leaves the directory's mtime as it is. A torn in-place
+    write is just unreadable (see _read_client_index). Unwritable
+    directories are ignored."""
+    data = json.dumps(index).encode("utf8")
+    if in_place:
+        try:  # pylint: disable=too-many-try-statements
+            fd = os.open(index_file, os.O_WRONLY)
+            try:
+                os.write(fd, data)
+                os.ftruncate(fd, len(data))
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+        return
+    tmp = index_file.with_name(f"{CLIENT_INDEX_FILENAME}.{os.getpid()}.tmp")
+    try:  # pylint: disable=too-many-try-statements
+        tmp.write_bytes(data)
+        os.replace(tmp, index_file)  # Atomically, for concurrent readers.
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def load_client_index(directory: str | Path) -> dict[str, str]:
+    """Load the index of a client config directory, (re)generating it if
+    files have been added, removed or renamed since it was written.
+
+    The index is kept in the directory. It's trusted without listing the
+    directory while the directory's mtime is the one recorded in it, and
+    otherwise while the client files, and each one's mtime and size, are
+    the ones recorded in it. The directory's mtime is only recorded once
+    it's older than the listing by more than MTIME_RESOLUTION_NS, so
+    changes made in the same mtime tick as the listing aren't missed. If
+    the directory isn't writable, the index is just rebuilt in memory.
+
+    Args:
+        directory (str | Path): The client config directory, holding one
+            JSON or YAML file per client, named after the client's key
+            (e.g., client1.json).
+
+    Returns:
+        dict[str, str]: The client keys and their files' names.
+    """
+    directory = Path(directory)
+    index_file = directory / CLIENT_INDEX_FILENAME
+    stored = _read_client_index(index_file)
+    listed_ns = time.time_ns()
+    directory_mtime_ns = directory.stat().st_mtime_ns
+    if not isinstance(clients := stored.get("clients"), dict):
+        clients = None
+    elif stored.get("directory_mtime_ns") == directory_mtime_ns:
+        return clients
+
+    files = scan_client_files(directory)
+    if clients is not None and stored.get("files") == files:
+        if directory_mtime_ns + MTIME_RESOLUTION_NS < listed_ns:
+            _write_client_index(
+                index_file,
+                stored | {"directory_mtime_ns": directory_mtime_ns},
+                in_place=True,
+            )
+        return clients
+
+    index = build_client_index(directory, files)
+    _write_client_index(index_file, {"files": files, "clients": index})
+    return index
+
+
+class ShardedClients(LazyClientsBase):
+    """Clients of a client config directory, each loaded and validated
+    from its own file only when it's first accessed."""
+
+    def __init__(self, directory: str | Path):
+        """Initialize the mapping.
+
+        Args:
+            directory (str | Path): The client config directory (see
+                load_client_index).
+        """
+        self.directory = Path(directory)
+        self._index = load_client_index(self.directory)
+
+    def __getitem__(self, name: str) -> Client:
+        return load_validated_config(
+            self.directory / self._index[name], Client
+        )
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+class ShardedClientConfig(
+    LazyClientConfig
+):  # pylint: disable=too-few-public-methods
+    """A client config stored as a directory of one file per client,
+    so using one client only means reading and validating its file, and
+    clients can be edited independently."""
+
+    def __init__(self, directory: str | Path):
+        """Initialize the config.
+
+        Args:
+            directory (str | Path): The client config directory (see
+                load_client_index).
+        """
+        super().__init__(ShardedClients(directory))
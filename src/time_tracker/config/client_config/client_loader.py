@@ -1,6 +1,5 @@
 """This file contains a function to load a client config."""
 
-import json
 from pathlib import Path
 
 from time_tracker.constants import (
@@ -8,13 +7,31 @@ from time_tracker.constants import (
     SAMPLE_CLIENT_CONFIG_FILE,
 )
 
-from .client_models import ClientConfig
+from ..config_cache import load_validated_config
+from .client_directory import ShardedClientConfig
+from .client_models import ClientConfig, LazyClientConfig
 
 
 def load_client_config(
     client_config_file: str | Path | None = None,
-) -> ClientConfig:
-    """Load a client config file."""
+    lazy: bool = False,
+) -> ClientConfig | LazyClientConfig:
+    """Load a client config file.
+
+    Validated configs are cached per process, and reused while the file is
+    unchanged. Across processes, they're only reused if snapshots are
+    enabled (the `config_snapshot_dir` setting); lazy configs are
+    snapshotted before any client is validated.
+
+    Args:
+        client_config_file (str | Path | None): The client config file, or
+            a directory with one JSON or YAML file per client (see
+            ShardedClientConfig, which is always lazy). Defaults to the
+            user's config, or else the sample config.
+        lazy (bool): Whether to validate each client only when it's
+            first accessed (see LazyClientConfig), rather than all of
+            them up front. Defaults to False.
+    """
     if (
         not client_config_file
         or not (client_config_file := Path(client_config_file)).exists()
@@ -24,6 +41,8 @@ def load_client_config(
             if DEFAULT_CLIENT_CONFIG_FILE.exists()
             else SAMPLE_CLIENT_CONFIG_FILE
         )
-    with Path(client_config_file).open("r", encoding="utf8") as file:
-        client_config = json.load(file)
-    return ClientConfig(**client_config)
+    if client_config_file.is_dir():
+        return ShardedClientConfig(client_config_file)
+    return load_validated_config(
+        client_config_file, LazyClientConfig if lazy else ClientConfig
+    )
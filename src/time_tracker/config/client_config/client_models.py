@@ -1,8 +1,9 @@
 """This file holds classes to hold client information."""
 
+from collections.abc import Iterator, Mapping
 from typing import Any
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ValidationError, field_validator
 
 from ..base_config import Party
 
@@ -27,3 +28,95 @@ class ClientConfig(BaseModel):
     """Configurations for Clients."""
 
     clients: dict[str, Client]
+
+
+class LazyClientsBase(Mapping[str, Client]):  # pylint: disable=abstract-method
+    """Base class for read-only mappings of client names to Clients,
+    which validate each client only when it's first accessed."""
+
+    def validate_all(self) -> dict[str, Client]:
+        """Validate all clients, reporting every invalid one at once.
+
+        Returns:
+            dict[str, Client]: The validated clients, by name.
+
+        Raises:
+            ValidationError: With the errors of all invalid clients, at
+                locations ("clients", <name>, ...), as ClientConfig does.
+        """
+        clients = {}
+        errors: list[Any] = []
+        for name in self:
+            try:
+                clients[name] = self[name]
+            except ValidationError as e:
+                errors.extend(
+                    error | {"loc": ("clients", name, *error["loc"])}
+                    for error in e.errors()
+                )
+        if errors:
+            raise ValidationError.from_exception_data(
+                ClientConfig.__name__, errors
+            )
+        return clients
+
+
+class LazyClients(LazyClientsBase):
+    """Lazily validated clients, from unvalidated client configs."""
+
+    def __init__(self, raw_clients: dict[str, Any]):
+        """Initialize the mapping.
+
+        Args:
+            raw_clients (dict[str, Any]): The unvalidated client configs
+                (e.g., as loaded from JSON), by client name.
+        """
+        self._raw = raw_clients
+        self._validated: dict[str, Client] = {}
+
+    def __getitem__(self, name: str) -> Client:
+        if (client := self._validated.get(name)) is None:
+            client = self._validated[name] = Client.model_validate(
+                self._raw[name]
+            )
+        return client
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._raw
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+
+class LazyClientConfig:  # pylint: disable=too-few-public-methods
+    """Like ClientConfig, but clients are validated lazily (see
+    LazyClients), so that using one client of a large config doesn't
+    mean validating all of them."""
+
+    def __init__(
+        self, clients: dict[str, Any] | LazyClientsBase, **_extra: Any
+    ):
+        """Initialize the config.
+
+        Args:
+            clients (dict[str, Any] | LazyClientsBase): The unvalidated
+                client configs, or a lazy mapping of clients (e.g.,
+                ShardedClients).
+            **_extra (Any): Any other top-level keys of the config file,
+                which are ignored, as ClientConfig ignores them.
+        """
+        if isinstance(clients, dict):
+            clients = LazyClients(clients)
+        elif not isinstance(clients, LazyClientsBase):
+            raise TypeError("clients must be a dict of client configs.")
+        self.clients: LazyClientsBase = clients
+
+    def validate_all(self) -> ClientConfig:
+        """Validate all clients into a ClientConfig (see
+        LazyClients.validate_all)."""
+        return ClientConfig.model_construct(
+            clients=self.clients.validate_all()
+        )
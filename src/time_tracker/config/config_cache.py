@@ -0,0 +1,112 @@
+"""This file contains a process-wide cache of validated config files."""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Any, TypeVar
+
+import yaml
+
+from .load_config import settings
+
+ModelT = TypeVar("ModelT")
+
+YAML_SUFFIXES = (".yaml", ".yml")
+
+# (model, resolved path) -> ((mtime_ns, size), validated config):
+_config_cache: dict[tuple[type, Path], tuple[tuple[int, int], Any]] = {}
+_config_cache_lock = threading.Lock()
+
+
+def clear_config_cache():
+    """Clear the in-process config cache."""
+    with _config_cache_lock:
+        _config_cache.clear()
+
+
+def get_snapshot_path(path: Path, model: type, snapshot_dir: Path):
+    """Get the path of the pickled snapshot of a config file."""
+    name = f"{model.__module__}.{model.__qualname__}:{path}"
+    digest = hashlib.sha256(name.encode("utf8")).hexdigest()[:16]
+    return snapshot_dir / f"{path.stem}-{digest}.pkl"
+
+
+def _load_snapshot(
+    snapshot_path: Path, key: tuple[int, int], model: type[ModelT]
+) -> ModelT | None:
+    """Load a snapshot, if it was taken of the same version of the file."""
+    try:
+        with snapshot_path.open("rb") as f:
+            snapshot_key, config = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+    if snapshot_key != key or not isinstance(config, model):
+        return None
+    return config
+
+
+def _save_snapshot(snapshot_path: Path, key: tuple[int, int], config: Any):
+    """Save a snapshot, atomically replacing any previous one."""
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+    with tmp.open("wb") as f:
+        pickle.dump((key, config), f)
+    os.replace(tmp, snapshot_path)
+
+
+def load_validated_config(
+    path: str | Path,
+    model: type[ModelT],
+    snapshot_dir: str | Path | None = settings.config_snapshot_dir,
+) -> ModelT:
+    """Load and validate a JSON (or YAML) config file, reusing an earlier result
+    while the file is unchanged (same path, mtime and size).
+
+    The returned config is shared between callers, so it should be
+    treated as read-only.
+
+    Args:
+        path (str | Path): The config file. Files ending in .yaml or .yml
+            are read as YAML, others as JSON.
+        model (type[ModelT]): The pydantic model to validate it with (or
+            another class taking the file's fields as keyword args).
+        snapshot_dir (str | Path | None): If given, validated configs are
+            also pickled to this directory, so that other processes can
+            skip validation when the file is unchanged. Defaults to the
+            `config_snapshot_dir` setting.
+
+    Returns:
+        ModelT: The validated config.
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _config_cache_lock:
+        if (cached := _config_cache.get((model, path))) and cached[0] == key:
+            return cached[1]  # type: ignore[return-value]
+
+    snapshot_path = (
+        get_snapshot_path(path, model, Path(snapshot_dir))
+        if snapshot_dir
+        else None
+    )
+    config = (
+        _load_snapshot(snapshot_path, key, model) if snapshot_path else None
+    )
+    if config is None:
+        with path.open("r", encoding="utf8") as file:
+            load = (
+                yaml.safe_load
+                if path.suffix.lower() in YAML_SUFFIXES
+                else json.load
+            )
+            config = model(**load(file))
+        if snapshot_path:
+            _save_snapshot(snapshot_path, key, config)
+
+    with _config_cache_lock:
+        _config_cache[(model, path)] = (key, config)
+    return config
@@ -1,4 +1,7 @@
 """Invoice state configurations."""
 
-from .invoice_state_loader import get_next_invoice_number
+from .invoice_state_loader import (
+    get_next_invoice_number,
+    peek_next_invoice_number,
+)
 from .invoice_state_models import InvoiceState
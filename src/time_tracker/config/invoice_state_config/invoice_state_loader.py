@@ -27,3 +27,11 @@ def get_next_invoice_number(counter_file: str | Path | None = None) -> int:
     state.save(counter_file)
 
     return invoice_number
+
+
+def peek_next_invoice_number(counter_file: str | Path | None = None) -> int:
+    """Get the next invoice counter number, without consuming it."""
+    if not counter_file or not Path(counter_file).exists():
+        counter_file = DEFAULT_INVOICE_STATE_CONFIG_FILE
+
+    return InvoiceState.load(counter_file).last_invoice_number + 1
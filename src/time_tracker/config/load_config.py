@@ -23,6 +23,29 @@ class Config(BaseModel):
     """Class to hold Config option from the YAML."""
 
     debug_prints: bool
+    # Directory in which to keep pickled snapshots of validated client
+    # and 'me' configs, so new processes can skip revalidating unchanged
+    # config files. If None, configs are only cached within a process.
+    config_snapshot_dir: str | None = None
+    # Directory in which to keep pickled snapshots of the entries reports
+    # read (indexed by start), so new processes can skip reading unchanged
+    # entry files. If None, they're only cached within a process.
+    report_cache_dir: str | None = None
+    # Whether loggers write to file from a background thread by default:
+    log_queue: bool = False
+    # Whether loggers write JSON lines by default:
+    log_json: bool = False
+    # A single log file shared by all loggers created without an explicit
+    # filename (logs/time_tracker.log in defaults.yaml, so each action
+    # doesn't create a new file). If None, each gets its own timestamped
+    # file in logs/:
+    log_file: str | None = None
+    # Log file rotation, by size (bytes, 0 to disable; 10 MiB in
+    # defaults.yaml) or by time (a `when` value of
+    # logging.handlers.TimedRotatingFileHandler):
+    log_max_bytes: int = 0
+    log_rotate_when: str | None = None
+    log_backup_count: int = 5
 
 
 with open(str(CONFIG_PATH), "r", encoding="utf8") as f:
@@ -1,7 +1,9 @@
 """This file contains a function to load a 'me' config."""
 
-import json
+import hashlib
+import os
 import shutil
+import subprocess
 from pathlib import Path
 
 from time_tracker.constants import (
@@ -10,6 +12,7 @@ from time_tracker.constants import (
 )
 
 from ...config.load_config import settings
+from ..config_cache import load_validated_config
 from .me_config_models import Me
 
 ALLOWED_EXTS = {".pdf", ".png", ".jpeg", ".jpg", ".eps", ".svg"}
@@ -18,7 +21,11 @@ DEBUG_PRINTS = settings.debug_prints
 
 
 def load_me_config(me_config_file: str | Path | None = None) -> Me:
-    """Load a 'me' config file."""
+    """Load a 'me' config file.
+
+    Validated configs are cached per process (and optionally snapshotted
+    to disk), and reused while the file is unchanged.
+    """
     if (
         not me_config_file
         or not (me_config_file := Path(me_config_file)).exists()
@@ -28,10 +35,7 @@ def load_me_config(me_config_file: str | Path | None = None) -> Me:
             if DEFAULT_ME_CONFIG_FILE.exists()
             else SAMPLE_ME_CONFIG_FILE
         )
-    with Path(me_config_file).open("r", encoding="utf8") as file:
-        me_config = json.load(file)
-
-    return Me(**me_config)
+    return load_validated_config(me_config_file, Me)
 
 
 def check_svg_support():
@@ -46,10 +50,54 @@ def check_svg_support():
     )
 
 
+def get_logo_cache_path(src: Path, cache_dir: Path) -> Path:
+    """Get the path of the cached PDF rendering of an SVG logo.
+
+    The cached file is keyed by a hash of the source contents, so an
+    edited logo automatically gets a fresh conversion.
+    """
+    digest = hashlib.sha256(src.read_bytes()).hexdigest()[:16]
+    return cache_dir / f"{src.stem}-{digest}.pdf"
+
+
+def convert_svg_to_pdf(src: Path, dst: Path) -> Path:
+    """Convert an SVG file to PDF using an external conversion tool."""
+    tool = check_svg_support()
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    # Convert into a temp file first, so a partial conversion is never
+    # picked up from the cache:
+    tmp = dst.with_name(f"{dst.stem}.{os.getpid()}.tmp.pdf")
+    if tool == "inkscape":
+        cmd = [tool, str(src), "--export-type=pdf", f"--export-filename={tmp}"]
+    else:
+        cmd = [tool, "-f", "pdf", "-o", str(tmp), str(src)]
+    try:
+        subprocess.run(cmd, check=True, capture_output=True, text=True)
+        os.replace(tmp, dst)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return dst
+
+
 def prepare_logo_for_latex(
-    user_logo_path: str | Path, latex_dir: Path
+    user_logo_path: str | Path,
+    latex_dir: Path,
+    cache_dir: Path | None = None,
 ) -> str | None:
-    """Prepare a user_logo_path for input into a .tex file."""
+    """Prepare a user_logo_path for input into a .tex file.
+
+    Args:
+        user_logo_path (str | Path): Path to the logo file.
+        latex_dir (Path): Directory in which the .tex file is compiled.
+        cache_dir (Path | None): If given, SVG logos are pre-rendered to
+            PDF once and stored here, keyed by the source hash, so
+            pdflatex doesn't need to reconvert them on every compile.
+            Defaults to None (the SVG is passed through to LaTeX).
+
+    Returns:
+        str | None: Path to the logo, relative to latex_dir, or None if
+            the logo doesn't exist.
+    """
     src = Path(user_logo_path).resolve()
     if not src.exists():
         return None
@@ -61,8 +109,19 @@ def prepare_logo_for_latex(
     # SVG must be copied with the extension preserved:
     svg_ext = ".svg"
     if ext == svg_ext:
-        # Check for LaTeX tool availability if desired (e.g. `inkscape`)
-        check_svg_support()
+        if cache_dir is not None:
+            cached = get_logo_cache_path(src, cache_dir)
+            if not cached.exists():
+                try:
+                    convert_svg_to_pdf(src, cached)
+                except (subprocess.CalledProcessError, OSError) as e:
+                    if DEBUG_PRINTS:
+                        print(f" Logo conversion failed, using SVG: {e}")
+            if cached.exists():
+                src = cached.resolve()
+        else:
+            # Check for LaTeX tool availability if desired (e.g. `inkscape`)
+            check_svg_support()
 
     # shutil.copyfile(src, latex_dir / src.name)
     # return src.name  # Return full filename (with .svg)
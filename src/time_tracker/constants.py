@@ -10,6 +10,9 @@ CONFIG_PATH = CONFIG_DIR / "defaults.yaml"
 
 DEFAULT_FILENAME = "tracked_time.csv"
 DEFAULT_OUTPUT_DIR = Path("outputs")
+DEFAULT_CACHE_DIR = DEFAULT_OUTPUT_DIR / ".cache"
+DEFAULT_LOGO_CACHE_DIR = DEFAULT_CACHE_DIR / "logos"
+DEFAULT_PROFILE_DIR = DEFAULT_OUTPUT_DIR / "profiles"
 
 DEFAULT_CLIENT = "client1"
 DEFAULT_CLIENT_CONFIG_DIR = REPO_HOME / "config"
@@ -39,6 +42,14 @@ class ColumnHeaders(Enum):
     TASK = "task"
 
 
+class Period(str, Enum):
+    """Enum class containing the valid report periods (of buckets)."""
+
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
 HEADERS = [
     ColumnHeaders.START.value,
     ColumnHeaders.END.value,
@@ -0,0 +1,19 @@
+"""Invoice rendering backends."""
+
+from enum import Enum
+
+from .backend import InvoiceBackend
+from .latex_backend import LatexInvoiceBackend
+from .pdf_backend import PdfInvoiceBackend
+
+INVOICE_BACKENDS: dict[str, type[InvoiceBackend]] = {
+    LatexInvoiceBackend.name: LatexInvoiceBackend,
+    PdfInvoiceBackend.name: PdfInvoiceBackend,
+}
+
+
+class BackendNames(str, Enum):
+    """Enum class for the valid invoice backend names."""
+
+    LATEX = LatexInvoiceBackend.name
+    PDF = PdfInvoiceBackend.name
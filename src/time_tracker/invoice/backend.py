@@ -0,0 +1,38 @@
+"""This file contains the interface for invoice rendering backends."""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+from time_tracker.logger.logger import CategoryLogger
+
+
+class InvoiceBackend(ABC):  # pylint: disable=too-few-public-methods
+    """Base class for backends that turn invoice data into a document.
+
+    The invoice context passed to `render` holds the same values that are
+    passed to the invoice template: `client`, `me`, `items`, `total`,
+    `date`, `start_date`, `end_date`, and `invoice_number`.
+    """
+
+    name: str = ""
+
+    def __init__(self, logger: CategoryLogger):
+        """Initialize the backend.
+
+        Args:
+            logger (CategoryLogger): Logger to report rendering results to.
+        """
+        self.logger = logger
+        # Elapsed times (ms) of the last render's stages:
+        self.timings: dict[str, float] = {}
+
+    @abstractmethod
+    def render(self, context: dict[str, Any], invoice_filename: Path):
+        """Render an invoice.
+
+        Args:
+            context (dict[str, Any]): The invoice data.
+            invoice_filename (Path): Path of the invoice PDF to create.
+        """
+        raise NotImplementedError
@@ -0,0 +1,108 @@
+"""This file contains the LaTeX/pdflatex invoice backend."""
+
+import subprocess
+from pathlib import Path
+from typing import Any
+
+from jinja2 import Environment, FileSystemLoader
+
+from time_tracker.logger.logger import CategoryLogger, timed_span
+from time_tracker.utils import ensure_preamble_format, split_preamble
+
+from .backend import InvoiceBackend
+
+
+class LatexInvoiceBackend(InvoiceBackend):
+    """Render invoices from a jinja2 LaTeX template, compiled by pdflatex."""
+
+    name = "latex"
+
+    def __init__(
+        self,
+        logger: CategoryLogger,
+        invoice_template: Path,
+        precompile_preamble: bool = False,
+    ):
+        """Initialize the backend.
+
+        Args:
+            logger (CategoryLogger): Logger to report rendering results to.
+            invoice_template (Path): The jinja2 LaTeX template.
+            precompile_preamble (bool): Whether to load the preamble from a
+                precompiled format file (built on first use, and rebuilt
+                whenever the preamble changes). Defaults to False.
+        """
+        super().__init__(logger)
+        self.invoice_template = invoice_template
+        self.precompile_preamble = precompile_preamble
+
+    def render_tex(self, context: dict[str, Any]) -> str:
+        """Render the LaTeX source of an invoice."""
+        env = Environment(
+            loader=FileSystemLoader(self.invoice_template.parent),
+            block_start_string="((*",
+            block_end_string="*))",
+            variable_start_string="(((",
+            variable_end_string=")))",
+            comment_start_string="((#",
+            comment_end_string="#))",
+        )
+        env.filters["latex_breaks"] = lambda s: s.replace("\n", r"\\")
+        with timed_span(self.logger, "render") as span:
+            template = env.get_template(self.invoice_template.name)
+            tex = template.render(**context)
+        self.timings["render_ms"] = span["wall_ms"]
+        return tex
+
+    def render(self, context: dict[str, Any], invoice_filename: Path):
+        """Write the invoice's .tex file and compile it."""
+        tex_path = invoice_filename.with_suffix(".tex")
+        with open(tex_path, "w", encoding="utf8") as f:
+            f.write(self.render_tex(context))
+        self.compile_latex(tex_path)
+
+    def compile_latex(self, tex_path: Path):
+        """Compile a .tex file into a PDF with pdflatex.
+
+        Args:
+            tex_path (Path): The .tex file to compile. The PDF is written
+                next to it.
+        """
+        cmd = ["pdflatex", "-interaction=nonstopmode", "-shell-escape"]
+        source = tex_path.name
+        if self.precompile_preamble:
+            preamble, body = split_preamble(
+                tex_path.read_text(encoding="utf8")
+            )
+            try:
+                fmt = ensure_preamble_format(preamble, tex_path.parent)
+            except (subprocess.CalledProcessError, FileNotFoundError) as e:
+                self.logger.warning(
+                    "Failed to build preamble format, compiling in full: %s",
+                    e,
+                )
+            else:
+                body_path = tex_path.with_suffix(".body.tex")
+                body_path.write_text(body, encoding="utf8")
+                cmd += [f"-fmt={fmt}", f"-jobname={tex_path.stem}"]
+                source = body_path.name
+        try:  # pylint: disable=too-many-try-statements
+            with timed_span(self.logger, "compile") as span:
+                _ = subprocess.run(
+                    cmd + [source],
+                    cwd=tex_path.parent,
+                    check=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                )
+            self.timings["pdflatex_ms"] = span["wall_ms"]
+            self.logger.info(
+                f"✅ Invoice created: {tex_path.with_suffix('.pdf')}"
+            )
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            self.logger.warning("❌ Failed to compile LaTeX invoice: %s", e)
+            if hasattr(e, "stdout") and e.stdout:
+                self.logger.warning("📄 STDOUT:\n%s", e.stdout)
+            if hasattr(e, "stderr") and e.stderr:
+                self.logger.warning("🐞 STDERR:\n%s", e.stderr)
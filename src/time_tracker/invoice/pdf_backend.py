@@ -0,0 +1,261 @@
+"""This file contains an invoice backend that writes PDFs directly,
+without a TeX distribution."""
+
+from pathlib import Path
+from typing import Any
+
+from time_tracker.logger.logger import timed_span
+
+from .backend import InvoiceBackend
+from .pdf_writer import (
+    LETTER,
+    PdfDocument,
+    PdfImage,
+    PdfPage,
+    load_image,
+    text_width,
+)
+
+MARGIN = 72.0  # 1in, as in the LaTeX template's geometry.
+TEXT_WIDTH = LETTER[0] - 2 * MARGIN
+FONT_SIZE = 11.0
+LEADING = 13.6  # \baselineskip of an 11pt article.
+COL_SEP = 6.0  # \tabcolsep
+CM = 72 / 2.54
+# Column content widths, as in the template's longtable:
+COLUMN_WIDTHS = (7 * CM, 2.5 * CM, 2.5 * CM, 3 * CM)
+STRUT = 0.7 * LEADING  # Height of a table row's first baseline (\strut).
+TABLE_TOP = LETTER[1] - MARGIN  # Where the table continues on new pages.
+LOGO_WIDTH = 0.3 * TEXT_WIDTH  # As in the template's logo minipage.
+SUMMARY_WIDTH = 0.45 * TEXT_WIDTH  # Of the right-aligned invoice summary.
+
+
+def wrap_text(text: str, width: float, bold: bool = False) -> list[str]:
+    """Wrap text into lines no wider than `width` points."""
+    lines: list[str] = []
+    for paragraph in text.splitlines() or [""]:
+        line = ""
+        for word in paragraph.split():
+            candidate = f"{line} {word}" if line else word
+            if line and text_width(candidate, FONT_SIZE, bold) > width:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+    return lines
+
+
+class PdfInvoiceBackend(
+    InvoiceBackend
+):  # pylint: disable=too-few-public-methods
+    """Render invoices straight to PDF, following the layout of the
+    sample LaTeX template. Logos are embedded if they are JPEGs or
+    (non-transparent) PNGs; other logo formats are skipped."""
+
+    name = "pdf"
+
+    def render(self, context: dict[str, Any], invoice_filename: Path):
+        """Write the invoice PDF."""
+        with timed_span(self.logger, "render") as span:
+            doc = PdfDocument()
+            page = doc.add_page()
+            top = LETTER[1] - MARGIN
+            y = self._draw_header(page, context, top)
+            y = self._draw_parties(page, context, y - 2 * FONT_SIZE)
+            self._draw_table(doc, page, context, y - FONT_SIZE)
+            pdf_path = invoice_filename.with_suffix(".pdf")
+            doc.save(pdf_path)
+        self.timings["render_ms"] = span["wall_ms"]
+        self.logger.info(f"✅ Invoice created: {pdf_path}")
+
+    @staticmethod
+    def _draw_lines(  # pylint: disable=too-many-arguments
+        page: PdfPage,
+        x: float,
+        top: float,
+        lines: list[tuple[str, bool]],
+    ):
+        """Draw (text, bold) lines downward, starting at `top`."""
+        for i, (text, bold) in enumerate(lines):
+            baseline = top - FONT_SIZE - i * LEADING
+            page.text(x, baseline, text, FONT_SIZE, bold)
+
+    def _load_logo(self, logo_path: str | Path) -> PdfImage | None:
+        """Load the logo, resolved as for the LaTeX backend (see
+        prepare_logo_for_latex), or None (with a warning) if it's missing,
+        unreadable, or not a (supported) JPEG or PNG."""
+        src = Path(logo_path).resolve()
+        try:
+            image = load_image(src)
+        except (OSError, ValueError) as e:
+            self.logger.warning(
+                "Logo %s can't be read (%s); skipping it in the PDF.", src, e
+            )
+            return None
+        if image is None:
+            self.logger.warning(
+                "Logo %s is not a JPEG or PNG; skipping it in the PDF.", src
+            )
+        return image
+
+    def _draw_header(
+        self, page: PdfPage, context: dict[str, Any], top: float
+    ) -> float:
+        """Draw the 'me' block and logo. Returns the bottom of the block."""
+        me = context["me"]
+        lines: list[tuple[str, bool]] = []
+        if me.company_name:
+            lines += [(me.company_name, True), (me.name, False)]
+        else:
+            lines.append((me.name, True))
+        lines += [(line, False) for line in me.address.splitlines()]
+        lines += [(str(me.email), False), (me.phone, False)]
+        text_height = len(lines) * LEADING
+
+        image = self._load_logo(me.logo_path) if me.logo_path else None
+        logo_height = LOGO_WIDTH * image.height / image.width if image else 0.0
+        # Minipages are vertically centered against each other:
+        height = max(text_height, logo_height)
+        self._draw_lines(page, MARGIN, top - (height - text_height) / 2, lines)
+        if image:
+            page.image(
+                image,
+                MARGIN + TEXT_WIDTH - LOGO_WIDTH,
+                top - (height + logo_height) / 2,
+                LOGO_WIDTH,
+                logo_height,
+            )
+        return top - height
+
+    def _draw_parties(  # pylint: disable=too-many-locals
+        self, page: PdfPage, context: dict[str, Any], top: float
+    ) -> float:
+        """Draw the client block and invoice summary. Returns the bottom
+        of the blocks."""
+        client = context["client"]
+        lines: list[tuple[str, bool]] = [(client.name, True)]
+        if client.project:
+            lines.append((client.project, False))
+        lines += [(line, False) for line in client.address.splitlines()]
+        lines += [(client.phone, False), (str(client.email), False)]
+        client_height = len(lines) * LEADING + FONT_SIZE
+
+        summary = [
+            ("Invoice #:", str(context["invoice_number"]), False),
+            ("Invoice Date:", context["date"], False),
+            (
+                "Dates of Service:",
+                f"{context['start_date']}-{context['end_date']}",
+                False,
+            ),
+            ("Amount Due:", f"$ {context['total']:.2f}", True),
+        ]
+        summary_height = len(summary) * LEADING
+        height = max(client_height, summary_height)
+
+        self._draw_lines(
+            page, MARGIN, top - (height - client_height) / 2, lines
+        )
+        right = MARGIN + TEXT_WIDTH
+        summary_top = top - (height - summary_height) / 2
+        for i, (label, value, bold) in enumerate(summary):
+            baseline = summary_top - FONT_SIZE - i * LEADING
+            page.text(right - SUMMARY_WIDTH, baseline, label, FONT_SIZE, bold)
+            page.text(
+                right - text_width(value, FONT_SIZE, bold),
+                baseline,
+                value,
+                FONT_SIZE,
+                bold,
+            )
+        return top - height
+
+    @staticmethod
+    def _new_page(doc: PdfDocument, edges: list[float]) -> PdfPage:
+        """Continue the table on a new page, starting with a rule."""
+        page = doc.add_page()
+        page.line(edges[0], TABLE_TOP, edges[-1], TABLE_TOP)
+        return page
+
+    @staticmethod
+    def _draw_row(  # pylint: disable=too-many-arguments
+        page: PdfPage,
+        edges: list[float],
+        y: float,
+        cells: list[list[str]],
+        bold: bool,
+    ) -> float:
+        """Draw a row of (wrapped) cells below `y`, with the first column
+        left-aligned and the others right-aligned. Returns the row's
+        bottom."""
+        height = max(len(cell) for cell in cells) * LEADING
+        for col, cell in enumerate(cells):
+            for i, text in enumerate(cell):
+                x = edges[col] + COL_SEP
+                if col:  # Right-aligned columns.
+                    x = (
+                        edges[col + 1]
+                        - COL_SEP
+                        - text_width(text, FONT_SIZE, bold)
+                    )
+                page.text(x, y - STRUT - i * LEADING, text, FONT_SIZE, bold)
+        for edge in edges:
+            page.line(edge, y, edge, y - height)
+        page.line(edges[0], y - height, edges[-1], y - height)
+        return y - height
+
+    @staticmethod
+    def _draw_total(page: PdfPage, edges: list[float], y: float, total: str):
+        """Draw the total row below `y`, with its label spanning the first
+        three columns."""
+        baseline = y - STRUT
+        for label, edge in (("Total Due", edges[3]), (total, edges[4])):
+            page.text(
+                edge - COL_SEP - text_width(label, FONT_SIZE, True),
+                baseline,
+                label,
+                FONT_SIZE,
+                True,
+            )
+        for edge in (edges[0], edges[3], edges[4]):
+            page.line(edge, y, edge, y - LEADING)
+        page.line(edges[0], y - LEADING, edges[-1], y - LEADING)
+
+    @classmethod
+    def _draw_table(
+        cls,
+        doc: PdfDocument,
+        page: PdfPage,
+        context: dict[str, Any],
+        top: float,
+    ):
+        """Draw the itemized table, continuing onto new pages as needed."""
+        edges = [MARGIN]
+        for width in COLUMN_WIDTHS:
+            edges.append(edges[-1] + width + 2 * COL_SEP)
+        rows: list[tuple[list[list[str]], bool]] = [
+            ([["Task"], ["Hours"], ["Rate ($)"], ["Total ($)"]], True)
+        ]
+        for item in context["items"]:
+            rows.append(
+                (
+                    [
+                        wrap_text(str(item["task"]), COLUMN_WIDTHS[0]),
+                        [f"{item['hours']:.2f}"],
+                        [f"{item['rate']:.2f}"],
+                        [f"{item['total']:.2f}"],
+                    ],
+                    False,
+                )
+            )
+
+        y = top
+        page.line(edges[0], y, edges[-1], y)
+        for cells, bold in rows:
+            if y - max(len(cell) for cell in cells) * LEADING < MARGIN:
+                page, y = cls._new_page(doc, edges), TABLE_TOP
+            y = cls._draw_row(page, edges, y, cells, bold)
+        if y - LEADING < MARGIN:
+            page, y = cls._new_page(doc, edges), TABLE_TOP
+        cls._draw_total(page, edges, y, f"$ {context['total']:.2f}")
@@ -0,0 +1,301 @@
+"""This file contains a minimal PDF writer, for drawing text, lines and
+images with the standard Helvetica fonts, without external dependencies."""
+
+import struct
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+
+LETTER = (612.0, 792.0)  # Page size in points.
+
+FONTS = {False: "Helvetica", True: "Helvetica-Bold"}
+
+# Glyph widths (per 1000 units of font size) of the printable ASCII
+# characters 32-126 in the standard Helvetica fonts (WinAnsiEncoding):
+_HELVETICA_WIDTHS = (
+    "278 278 355 556 556 889 667 191 333 333 389 584 278 333 278 278 "
+    "556 556 556 556 556 556 556 556 556 556 278 278 584 584 584 556 "
+    "1015 667 667 722 722 667 611 778 722 278 500 667 556 833 722 778 "
+    "667 778 722 667 611 722 667 944 667 667 611 278 278 278 469 556 "
+    "333 556 556 500 556 556 278 556 556 222 222 500 222 833 556 556 "
+    "556 556 333 500 278 556 500 722 500 500 500 334 260 334 584"
+)
+_HELVETICA_BOLD_WIDTHS = (
+    "278 333 474 556 556 889 722 238 333 333 389 584 278 333 278 278 "
+    "556 556 556 556 556 556 556 556 556 556 333 333 584 584 584 611 "
+    "975 722 722 722 722 667 611 778 722 278 556 722 611 833 722 778 "
+    "667 778 722 667 611 722 667 944 667 667 611 333 278 333 584 556 "
+    "333 556 611 556 611 556 333 611 611 278 278 556 278 889 611 611 "
+    "611 611 389 556 333 611 556 778 556 556 500 389 280 389 584"
+)
+WIDTHS = {
+    False: [int(w) for w in _HELVETICA_WIDTHS.split()],
+    True: [int(w) for w in _HELVETICA_BOLD_WIDTHS.split()],
+}
+DEFAULT_WIDTH = 556
+FIRST_CHAR, LAST_CHAR = 32, 126  # The characters with widths above.
+UNITS_PER_EM = 1000  # Glyph width units per point of font size.
+
+JPEG_SIGNATURE = b"\xff\xd8"
+JPEG_MARKER = 0xFF  # The first byte of each JPEG segment.
+# Start-of-frame markers are C0-CF, except for DHT, JPG and DAC:
+JPEG_FRAME_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+JPEG_COLORSPACES = {1: "DeviceGray", 3: "DeviceRGB", 4: "DeviceCMYK"}
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_HEADER_CHUNK = b"IHDR"
+PNG_DATA_CHUNK = b"IDAT"
+PNG_CHUNK_OVERHEAD = 12  # Length, type and CRC fields.
+PNG_BIT_DEPTH = 8  # The only bit depth supported.
+PNG_GRAY = 0
+PNG_COLORS = {PNG_GRAY: 1, 2: 3}  # Color type -> components (gray, RGB).
+
+
+def text_width(text: str, size: float, bold: bool = False) -> float:
+    """Get the width (in points) of a string in Helvetica."""
+    widths = WIDTHS[bold]
+    units = sum(
+        (
+            widths[code - FIRST_CHAR]
+            if FIRST_CHAR <= (code := ord(c)) <= LAST_CHAR
+            else DEFAULT_WIDTH
+        )
+        for c in text
+    )
+    return units * size / UNITS_PER_EM
+
+
+def escape_text(text: str) -> bytes:
+    """Encode a string as the contents of a PDF literal string."""
+    return (
+        text.encode("cp1252", errors="replace")
+        .replace(b"\\", b"\\\\")
+        .replace(b"(", b"\\(")
+        .replace(b")", b"\\)")
+    )
+
+
+@dataclass
+class PdfImage:
+    """An image XObject, with its already-encoded stream data."""
+
+    width: int
+    height: int
+    colorspace: str
+    data: bytes
+    filters: str
+    decode_parms: str = ""
+
+
+def _load_jpeg(data: bytes) -> PdfImage | None:
+    """Read the size and components of a JPEG, to embed it as-is."""
+    i = 2
+    while i + 9 < len(data):  # pylint: disable=while-used
+        if data[i] != JPEG_MARKER:
+            return None
+        (length,) = struct.unpack(">H", data[i + 2 : i + 4])
+        if data[i + 1] in JPEG_FRAME_MARKERS:
+            height, width = struct.unpack(">HH", data[i + 5 : i + 9])
+            if (components := data[i + 9]) not in JPEG_COLORSPACES:
+                return None
+            return PdfImage(
+                width, height, JPEG_COLORSPACES[components], data, "DCTDecode"
+            )
+        i += 2 + length
+    return None
+
+
+def _load_png(data: bytes) -> PdfImage | None:
+    """Read an 8-bit, non-interlaced gray or RGB PNG, to embed its
+    compressed data as-is (PDF supports the PNG predictors directly).
+    PNGs with transparency or palettes are not supported."""
+    pos = len(PNG_SIGNATURE)
+    header = None
+    idat = b""
+    while pos < len(data):  # pylint: disable=while-used
+        (length,) = struct.unpack(">I", data[pos : pos + 4])
+        kind = data[pos + 4 : pos + 8]
+        chunk = data[pos + 8 : pos + 8 + length]
+        if kind == PNG_HEADER_CHUNK:
+            header = struct.unpack(">IIBBBBB", chunk)
+        elif kind == PNG_DATA_CHUNK:
+            idat += chunk
+        pos += PNG_CHUNK_OVERHEAD + length
+    if header is None:
+        return None
+    width, height, depth, color_type, _, _, interlace = header
+    if depth != PNG_BIT_DEPTH or interlace or color_type not in PNG_COLORS:
+        return None
+    return PdfImage(
+        width,
+        height,
+        "DeviceGray" if color_type == PNG_GRAY else "DeviceRGB",
+        idat,
+        "FlateDecode",
+        f"<< /Predictor 15 /Colors {PNG_COLORS[color_type]} "
+        f"/BitsPerComponent {PNG_BIT_DEPTH} /Columns {width} >>",
+    )
+
+
+def load_image(path: str | Path) -> PdfImage | None:
+    """Load a JPEG or PNG image for embedding in a PDF.
+
+    Returns:
+        PdfImage | None: The image, or None if its format isn't supported.
+
+    Raises:
+        OSError: If the file can't be read.
+        ValueError: If the image is truncated or corrupt.
+    """
+    data = Path(path).read_bytes()
+    load = (
+        _load_jpeg
+        if data.startswith(JPEG_SIGNATURE)
+        else _load_png if data.startswith(PNG_SIGNATURE) else None
+    )
+    try:
+        return load(data) if load else None
+    except (struct.error, IndexError) as e:
+        raise ValueError(f"Corrupt image: {path}") from e
+
+
+@dataclass
+class PdfPage:
+    """A page of a PDF document, holding its content stream operators."""
+
+    size: tuple[float, float] = LETTER
+    ops: list[bytes] = field(default_factory=list)
+    images: list[PdfImage] = field(default_factory=list)
+
+    def text(  # pylint: disable=too-many-arguments
+        self,
+        x: float,
+        y: float,
+        text: str,
+        size: float = 11,
+        bold: bool = False,
+    ):
+        """Draw text with its baseline starting at (x, y)."""
+        font = "F2" if bold else "F1"
+        self.ops.append(
+            f"BT /{font} {size:g} Tf {x:.2f} {y:.2f} Td (".encode()
+            + escape_text(text)
+            + b") Tj ET"
+        )
+
+    def line(  # pylint: disable=too-many-arguments
+        self, x1: float, y1: float, x2: float, y2: float, width: float = 0.4
+    ):
+        """Draw a straight line."""
+        self.ops.append(
+            f"{width:g} w {x1:.2f} {y1:.2f} m {x2:.2f} {y2:.2f} l S".encode()
+        )
+
+    def image(  # pylint: disable=too-many-arguments
+        self, image: PdfImage, x: float, y: float, width: float, height: float
+    ):
+        """Draw an image with its lower-left corner at (x, y)."""
+        self.images.append(image)
+        name = f"Im{len(self.images)}"
+        self.ops.append(
+            f"q {width:.2f} 0 0 {height:.2f} {x:.2f} {y:.2f} cm "
+            f"/{name} Do Q".encode()
+        )
+
+
+@dataclass
+class PdfDocument:
+    """A minimal PDF document."""
+
+    pages: list[PdfPage] = field(default_factory=list)
+
+    def add_page(self, size: tuple[float, float] = LETTER) -> PdfPage:
+        """Append a new, empty page."""
+        page = PdfPage(size=size)
+        self.pages.append(page)
+        return page
+
+    def to_bytes(self) -> bytes:  # pylint: disable=too-many-locals
+        """Serialize the document."""
+        objects: list[bytes] = []
+
+        def add(obj: bytes) -> int:
+            objects.append(obj)
+            return len(objects)
+
+        def stream(header: str, data: bytes) -> bytes:
+            return (
+                f"<< {header} /Length {len(data)} >>\nstream\n".encode()
+                + data
+                + b"\nendstream"
+            )
+
+        catalog = add(b"")  # Filled in once the pages object exists.
+        pages = add(b"")
+        fonts = {
+            bold: add(
+                f"<< /Type /Font /Subtype /Type1 /BaseFont /{name} "
+                "/Encoding /WinAnsiEncoding >>".encode()
+            )
+            for bold, name in FONTS.items()
+        }
+        kids = []
+        for page in self.pages:
+            xobjects = []
+            for i, img in enumerate(page.images, start=1):
+                parms = (
+                    f" /DecodeParms {img.decode_parms}"
+                    if img.decode_parms
+                    else ""
+                )
+                ref = add(
+                    stream(
+                        "/Type /XObject /Subtype /Image "
+                        f"/Width {img.width} /Height {img.height} "
+                        f"/ColorSpace /{img.colorspace} "
+                        f"/BitsPerComponent 8 /Filter /{img.filters}{parms}",
+                        img.data,
+                    )
+                )
+                xobjects.append(f"/Im{i} {ref} 0 R")
+            content = add(
+                stream(
+                    "/Filter /FlateDecode", zlib.compress(b"\n".join(page.ops))
+                )
+            )
+            kids.append(
+                add(
+                    f"<< /Type /Page /Parent {pages} 0 R "
+                    f"/MediaBox [0 0 {page.size[0]:g} {page.size[1]:g}] "
+                    f"/Resources << /Font << /F1 {fonts[False]} 0 R "
+                    f"/F2 {fonts[True]} 0 R >> "
+                    f"/XObject << {' '.join(xobjects)} >> >> "
+                    f"/Contents {content} 0 R >>".encode()
+                )
+            )
+        objects[catalog - 1] = (
+            f"<< /Type /Catalog /Pages {pages} 0 R >>".encode()
+        )
+        objects[pages - 1] = (
+            f"<< /Type /Pages /Kids [{' '.join(f'{k} 0 R' for k in kids)}] "
+            f"/Count {len(kids)} >>".encode()
+        )
+
+        out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        offsets = []
+        for num, obj in enumerate(objects, start=1):
+            offsets.append(len(out))
+            out += f"{num} 0 obj\n".encode() + obj + b"\nendobj\n"
+        xref = len(out)
+        out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+        for offset in offsets:
+            out += f"{offset:010d} 00000 n \n".encode()
+        out += (
+            f"trailer\n<< /Size {len(objects) + 1} /Root {catalog} 0 R >>\n"
+            f"startxref\n{xref}\n%%EOF\n".encode()
+        )
+        return bytes(out)
+
+    def save(self, path: str | Path):
+        """Write the document to a file."""
+        Path(path).write_bytes(self.to_bytes())
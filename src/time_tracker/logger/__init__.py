@@ -1,3 +1,3 @@
 """Import package modules for direct import from package."""
 
-from .logger import LoggerMixin
+from .logger import ActionCounters, JsonFormatter, LoggerMixin, timed_span
@@ -1,17 +1,26 @@
 """This file contains a pre-built logger that can be
 easily incorporated into a project."""
 
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
+import sys
 import threading
-import traceback
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from enum import IntEnum, auto
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
 from time_tracker.config import settings
 
 DEBUG_PRINTS = settings.debug_prints
+LOG_QUEUE = settings.log_queue
+LOG_JSON = settings.log_json
 
 
 class DebugCategory(IntEnum):
@@ -113,6 +122,115 @@ class DebugCategoryNameFilter(
         return True
 
 
+class JsonFormatter(logging.Formatter):
+    """Class for formatting log records as single-line JSON objects,
+    including the debug category and any `extra` fields."""
+
+    # Attributes every LogRecord has, which aren't passed on as extras:
+    _RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {
+        "message",
+        "asctime",
+        "debug_category",
+        "debug_cat_name",
+    }
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "debug_category": getattr(record, "debug_category", None),
+            "debug_cat_name": getattr(record, "debug_cat_name", ""),
+            "pathname": record.pathname,
+            "lineno": record.lineno,
+            "funcName": record.funcName,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        data.update(
+            (key, value)
+            for key, value in vars(record).items()
+            if key not in self._RECORD_ATTRS
+        )
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(data, default=str)
+
+
+@contextmanager
+def timed_span(
+    logger: logging.Logger,
+    name: str,
+    category: int = DebugCategory.DETAILED,
+    level: int = logging.DEBUG,
+) -> Iterator[dict[str, Any]]:
+    """Time a block of code, then log its elapsed wall and CPU time.
+
+    The record's `extra` fields are `span` (the name), `wall_ms`,
+    `cpu_ms`, and any fields the block adds to the yielded dict (which
+    must not clash with LogRecord attributes). `wall_ms` and `cpu_ms` are
+    also added to the yielded dict once the block exits, e.g.:
+
+        with timed_span(logger, "read_csv") as span:
+            rows = read_rows()
+            span["rows"] = len(rows)
+        elapsed = span["wall_ms"]
+
+    Args:
+        logger (logging.Logger): Logger to log the timing to.
+        name (str): Name of the timed span.
+        category (int): Debug category of the record. Defaults to
+            DETAILED.
+        level (int): Level of the record. Defaults to DEBUG.
+
+    Yields:
+        dict[str, Any]: Extra fields to include in the record.
+    """
+    fields: dict[str, Any] = {}
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield fields
+    finally:
+        fields["wall_ms"] = (time.perf_counter() - wall_start) * 1000
+        fields["cpu_ms"] = (time.process_time() - cpu_start) * 1000
+        logger.log(
+            level,
+            "⏱️ %s: %.3f ms wall, %.3f ms CPU",
+            name,
+            fields["wall_ms"],
+            fields["cpu_ms"],
+            extra={**fields, "span": name, "debug_category": category},
+            # Report the code in the with block, not contextlib:
+            stacklevel=3,
+        )
+
+
+class ActionCounters(dict[str, float]):
+    """Counters of an action's work, logged after it (e.g., CSV rows
+    parsed and invoice render time), which are reset at the start of each
+    action."""
+
+    NAMES = (
+        "rows_parsed",
+        "bytes_read",
+        "rows_imported",
+        "render_ms",
+        "pdflatex_ms",
+    )
+
+    def __init__(self):
+        """Initialize the counters, at zero."""
+        super().__init__()
+        self.reset()
+
+    def reset(self):
+        """Zero the counters: CSV rows parsed, bytes read and rows
+        imported, and invoice render and pdflatex times (ms)."""
+        self.clear()
+        self.update(dict.fromkeys(self.NAMES, 0))
+
+
 class CategoryLogger(logging.Logger):
     """A subclass of logging.Logger that has debug categories."""
 
@@ -144,6 +262,38 @@ class CategoryLogger(logging.Logger):
         kwargs["extra"]["debug_category"] = category
         self.debug(msg, *args, **kwargs)
 
+    def timed(
+        self,
+        name: str,
+        category: int = DebugCategory.DETAILED,
+        level: int = logging.DEBUG,
+    ):
+        """Time a block of code, then log its elapsed wall and CPU time.
+        See `timed_span`.
+
+        Args:
+            name (str): Name of the timed span.
+            category (int): Debug category of the record. Defaults to
+                DETAILED.
+            level (int): Level of the record. Defaults to DEBUG.
+        """
+        return timed_span(self, name, category=category, level=level)
+
+
+class QueueDispatchHandler(
+    logging.Handler
+):  # pylint: disable=too-few-public-methods
+    """Handler, run by the shared QueueListener thread, that passes each
+    record on to the file handler registered for its logger's name."""
+
+    def __init__(self):
+        super().__init__()
+        self.targets: dict[str, logging.Handler] = {}
+
+    def emit(self, record: logging.LogRecord):
+        if (target := self.targets.get(record.name)) is not None:
+            target.handle(record)
+
 
 # class LoggerMixin (logging.getLoggerClass()):
 # class LoggerMixin(type):
@@ -153,29 +303,46 @@ class LoggerMixin:  # pylint: disable=too-few-public-methods
     _debug_enabled = True
     _lock_logger = threading.Lock()  # Add a lock for thread safety.
     _loggers: dict = {}
+    # Shared by all loggers in queue mode:
+    _log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_dispatcher = QueueDispatchHandler()
+    _queue_listener: logging.handlers.QueueListener | None = None
 
     def __init__(  # pylint: disable=too-many-branches,too-many-statements
         self,
         logger_filename: str | Path | None = None,
         logger_format: str | None = None,
         verbosity: int = 0,
+        use_queue: bool | None = None,
+        json_format: bool | None = None,
         # *args,
     ):
         """Initialize the logger.
 
         Args:
             logger_filename (str | Path | None): Filename (and path)
-                to which to write log. If None, writes to a file in
-                the local logs directory (relative to the calling
-                directory) with the filename given by the current
-                timestamp and class name, with the estension ".log".
-                Dafaults to None.
+                to which to write log. If None, writes to the file of
+                the `log_file` setting (logs/time_tracker.log by
+                default), or if that's None, to a file in the local logs
+                directory (relative to the calling directory) with the
+                filename given by the current timestamp and class name,
+                with the estension ".log". Dafaults to None.
             logger_format (str | None): Format specifier for log messages.
                 If None, defaults to 'timestamp level [file:lineno in func]
                 message'. Defaults to None.
             verbosity (int): How much and what level of logging to include.
                 Higher values indicates more logging. Defaults to 0
                 (warnings).
+            use_queue (bool | None): Whether to hand log records to a
+                background thread (shared by all loggers) that writes
+                them to file, instead of writing them in the calling
+                thread. Records still queued at interpreter exit are
+                written before it exits. If None, uses the `log_queue`
+                setting. Defaults to None.
+            json_format (bool | None): Whether to write log records as
+                JSON lines (see JsonFormatter) instead of formatting them
+                with `logger_format`. If None, uses the `log_json`
+                setting. Defaults to None.
             #args: Additional arguments to pass to super class.
         """
         # super().__init__(*args)
@@ -187,13 +354,13 @@ class LoggerMixin:  # pylint: disable=too-few-public-methods
                 if DEBUG_PRINTS:
                     print(f"{type(self).__name__} already has a logger.")
                 return
-            stack = traceback.extract_stack()
-            caller = stack[-2]  # The frame that called this __init__.
-            caller_info = f"{caller.filename}:{caller.lineno} in {caller.name}"
             self.logger_filename = logger_filename
             if self.logger_filename is not None:
                 init_type = f"explicit filename: {self.logger_filename}"
                 self.logger_filename = Path(self.logger_filename)
+            elif settings.log_file is not None:
+                self.logger_filename = Path(settings.log_file)
+                init_type = f"shared filename: {str(self.logger_filename)}"
             else:
                 self.logger_filename = Path(
                     f"logs/{datetime.now().strftime('%Y-%m-%d_%H.%M.%S.%f_%z')}"
@@ -210,7 +377,7 @@ class LoggerMixin:  # pylint: disable=too-few-public-methods
                 )
             if logger_key in LoggerMixin._loggers:
                 self.logger: CategoryLogger = LoggerMixin._loggers[logger_key]
-                if LoggerMixin._debug_enabled:
+                if LoggerMixin._debug_enabled and self._trace_enabled():
                     # print(f"Reusing logger {logger_key}")
                     self.logger.debug_with_category(
                         "LoggerMixin reusing logger with %s",
@@ -219,7 +386,7 @@ class LoggerMixin:  # pylint: disable=too-few-public-methods
                     )
                     self.logger.debug_with_category(
                         "Called from: %s",
-                        caller_info,
+                        self._get_caller_info(),
                         category=self.logger.debugLevels.TRACE,
                     )
                     self.logger.debug_with_category(
@@ -258,7 +425,9 @@ class LoggerMixin:  # pylint: disable=too-few-public-methods
                 cat_name_filter = DebugCategoryNameFilter()
                 self.logger.addFilter(cat_name_filter)
                 # Set the log file hander here:
-                self.logger_handler = logging.FileHandler(self.logger_filename)
+                self.logger_handler = self.make_file_handler(
+                    self.logger_filename
+                )
                 if logger_format is not None:
                     self.logger_format = logger_format
                 else:
@@ -269,13 +438,27 @@ class LoggerMixin:  # pylint: disable=too-few-public-methods
                         "%(message)s"
                     )
                 self.logger_handler.setFormatter(
-                    logging.Formatter(self.logger_format)
+                    JsonFormatter()
+                    if (LOG_JSON if json_format is None else json_format)
+                    else logging.Formatter(self.logger_format)
                 )
                 self.logger.handlers = []
-                self.logger.addHandler(self.logger_handler)
+                if LOG_QUEUE if use_queue is None else use_queue:
+                    LoggerMixin._queue_dispatcher.targets[self.logger.name] = (
+                        self.logger_handler
+                    )
+                    LoggerMixin._start_log_queue()
+                    self.logger.addHandler(
+                        logging.handlers.QueueHandler(LoggerMixin._log_queue)
+                    )
+                else:
+                    LoggerMixin._queue_dispatcher.targets.pop(
+                        self.logger.name, None
+                    )
+                    self.logger.addHandler(self.logger_handler)
                 # Store for future use:
                 LoggerMixin._loggers[logger_key] = self.logger
-                if LoggerMixin._debug_enabled:
+                if LoggerMixin._debug_enabled and self._trace_enabled():
                     # Log all the seup info:
                     self.logger.debug_with_category(
                         "LoggerMixin created new logger with %s",
@@ -284,7 +467,7 @@ class LoggerMixin:  # pylint: disable=too-few-public-methods
                     )
                     self.logger.debug_with_category(
                         "Called from: %s",
-                        caller_info,
+                        self._get_caller_info(),
                         category=self.logger.debugLevels.TRACE,
                     )
                     self.logger.debug_with_category(
@@ -293,6 +476,68 @@ class LoggerMixin:  # pylint: disable=too-few-public-methods
                         category=self.logger.debugLevels.TRACE,
                     )
 
+    def _trace_enabled(self) -> bool:
+        """Whether this instance's logger would emit TRACE messages."""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return False
+        return all(
+            f.max_category >= DebugCategory.TRACE
+            for f in self.logger.filters
+            if isinstance(f, DebugCategoryFilter)
+        )
+
+    @staticmethod
+    def _get_caller_info() -> str:
+        """Describe the frame that called LoggerMixin.__init__."""
+        # Skip this function and LoggerMixin.__init__:
+        frame = sys._getframe(2)  # pylint: disable=protected-access
+        code = frame.f_code
+        return f"{code.co_filename}:{frame.f_lineno} in {code.co_name}"
+
+    @staticmethod
+    def make_file_handler(filename: Path) -> logging.FileHandler:
+        """Make the file handler for a log file, rotating it by time or
+        size if the `log_rotate_when` or `log_max_bytes` settings are set.
+
+        Args:
+            filename (Path): The log file.
+
+        Returns:
+            logging.FileHandler: The handler.
+        """
+        if settings.log_rotate_when is not None:
+            return logging.handlers.TimedRotatingFileHandler(
+                filename,
+                when=settings.log_rotate_when,
+                backupCount=settings.log_backup_count,
+            )
+        if settings.log_max_bytes:
+            return logging.handlers.RotatingFileHandler(
+                filename,
+                maxBytes=settings.log_max_bytes,
+                backupCount=settings.log_backup_count,
+            )
+        return logging.FileHandler(filename)
+
+    @classmethod
+    def _start_log_queue(cls):
+        """Start the shared queue listener thread, if it isn't running."""
+        if cls._queue_listener is None:
+            cls._queue_listener = logging.handlers.QueueListener(
+                cls._log_queue, cls._queue_dispatcher
+            )
+            cls._queue_listener.start()
+
+    @classmethod
+    def stop_log_queue(cls):
+        """Write out all queued log records and stop the shared queue
+        listener thread. It is restarted by the next logger created in
+        queue mode. Called automatically at interpreter exit."""
+        with cls._lock_logger:
+            if cls._queue_listener is not None:
+                cls._queue_listener.stop()
+                cls._queue_listener = None
+
     @staticmethod
     def get_category_logger(name: str) -> CategoryLogger:
         """Get a CategoryLogger instance with the given name.
@@ -309,3 +554,8 @@ class LoggerMixin:  # pylint: disable=too-few-public-methods
     # def __new__(cls, name: str, bases:tuple[type], dct: dict):
     #     """Method for instantiating new class instances."""
     #     return super().__new__(cls, name, bases, dct)
+
+
+# Registered after logging's own shutdown hook, so it runs before it
+# (and before the file handlers are closed):
+atexit.register(LoggerMixin.stop_log_queue)
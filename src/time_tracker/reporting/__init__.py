@@ -0,0 +1,13 @@
+"""Reports of tracked time."""
+
+from .buckets import (
+    JSON_REPORT_SUFFIX,
+    BucketedReport,
+    bucket_entries,
+    bucket_label,
+    bucket_start,
+    check_period,
+    split_into_buckets,
+)
+from .entry_cache import ReportEntries, clear_report_cache, load_report_entries
+from .ranges import IntervalIndex, clip_interval, day_range
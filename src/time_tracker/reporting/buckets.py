@@ -0,0 +1,204 @@
+"""This file contains time-bucketed reports: the hours spent per task in
+each day, ISO week or month of a range."""
+
+import csv
+import json
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any, TextIO
+
+from time_tracker.constants import Period
+
+# Reports saved to files with this suffix are JSON, others CSV:
+JSON_REPORT_SUFFIX = ".json"
+
+
+def check_period(period: Period | str) -> Period:
+    """Check that a bucket period is valid (see Period).
+
+    Returns:
+        Period: The period.
+
+    Raises:
+        ValueError: If the period isn't a Period (or its value).
+    """
+    try:
+        return Period(period)
+    except ValueError:
+        raise ValueError(
+            f"Invalid period: {period}. "
+            f"Valid periods: {', '.join(p.value for p in Period)}."
+        ) from None
+
+
+def bucket_start(day: date, period: Period | str) -> date:
+    """The first day of the bucket (day, ISO week or month) of a day."""
+    if period == Period.WEEK:
+        return day - timedelta(days=day.weekday())
+    if period == Period.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+def next_bucket_start(start: date, period: Period | str) -> date:
+    """The first day of the bucket after the one starting at `start`."""
+    if period == Period.WEEK:
+        return start + timedelta(days=7)
+    if period == Period.MONTH:
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def bucket_label(start: date, period: Period | str) -> str:
+    """Label a bucket, e.g. 2024-01-31, 2024-W05 or 2024-01."""
+    if period == Period.WEEK:
+        year, week, _ = start.isocalendar()
+        return f"{year}-W{week:02d}"
+    if period == Period.MONTH:
+        return f"{start.year}-{start.month:02d}"
+    return start.isoformat()
+
+
+def split_into_buckets(
+    start: datetime, end: datetime, seconds: float, period: Period | str
+) -> Iterator[tuple[date, float]]:
+    """Split an entry's duration across the buckets it spans (e.g., both
+    days of an entry crossing midnight), in proportion to its time in
+    each.
+
+    Args:
+        start (datetime): The entry's start.
+        end (datetime): The entry's end.
+        seconds (float): The entry's (recorded) duration.
+        period (Period | str): The bucket period.
+
+    Yields:
+        tuple[date, float]: The buckets' first days, and the seconds in
+            them.
+    """
+    bucket = bucket_start(start.date(), period)
+    if (span := (end - start).total_seconds()) <= 0:
+        yield bucket, seconds
+        return
+    cursor = start
+    while True:  # pylint: disable=while-used
+        following = next_bucket_start(bucket, period)
+        boundary = datetime.combine(following, time(), tzinfo=start.tzinfo)
+        if end <= boundary:
+            yield bucket, seconds * (end - cursor).total_seconds() / span
+            return
+        yield bucket, seconds * (boundary - cursor).total_seconds() / span
+        cursor, bucket = boundary, following
+
+
+def bucket_entries(
+    entries: Iterable[tuple[tuple[int, ...], float, datetime, datetime]],
+    period: Period | str,
+) -> dict[tuple[int, ...], dict[date, float]]:
+    """Total the seconds of entries per task IDs and bucket, splitting
+    them across the buckets they span (see split_into_buckets).
+
+    Args:
+        entries (Iterable[tuple]): The entries' task IDs, seconds, start
+            and end (see TimeTracker._iter_report_entries).
+        period (Period | str): The bucket period.
+
+    Returns:
+        dict[tuple[int, ...], dict[date, float]]: The seconds per task IDs
+            and bucket (first day).
+    """
+    buckets: dict[tuple[int, ...], dict[date, float]] = defaultdict(
+        lambda: defaultdict(float)
+    )
+    for task_ids, seconds, start, end in entries:
+        task_buckets = buckets[task_ids]
+        for bucket, share in split_into_buckets(start, end, seconds, period):
+            task_buckets[bucket] += share
+    return buckets
+
+
+@dataclass
+class BucketedReport:
+    """Hours per task (rows) and period (columns), for every period from
+    the first to the last one with time in it."""
+
+    period: Period
+    periods: list[str]
+    tasks: list[str]
+    hours: list[list[float]]
+
+    @classmethod
+    def from_totals(
+        cls, period: Period | str, totals: Mapping[str, Mapping[date, float]]
+    ) -> "BucketedReport":
+        """Make a report from seconds per bucket (by first day) per task.
+
+        Args:
+            period (Period | str): The bucket period.
+            totals (Mapping[str, Mapping[date, float]]): The seconds spent
+                per task, per bucket.
+
+        Returns:
+            BucketedReport: The report.
+
+        Raises:
+            ValueError: If the period is invalid.
+        """
+        period = check_period(period)
+        starts = [start for buckets in totals.values() for start in buckets]
+        columns: dict[date, int] = {}
+        if starts:
+            start, last = min(starts), max(starts)
+            while start <= last:  # pylint: disable=while-used
+                columns[start] = len(columns)
+                start = next_bucket_start(start, period)
+        hours = []
+        for buckets in totals.values():
+            row = [0.0] * len(columns)
+            for start, seconds in buckets.items():
+                row[columns[start]] += seconds / 3600
+            hours.append(row)
+        return cls(
+            period=period,
+            periods=[bucket_label(start, period) for start in columns],
+            tasks=list(totals),
+            hours=hours,
+        )
+
+    def totals(self) -> list[float]:
+        """The total hours of each period."""
+        return [sum(column) for column in zip(*self.hours)]
+
+    def to_dict(self) -> dict[str, Any]:
+        """The report as a JSON-serializable dict."""
+        return {
+            "period": self.period.value,
+            "periods": self.periods,
+            "hours": dict(zip(self.tasks, self.hours)),
+            "total": self.totals(),
+        }
+
+    def write_csv(self, f: TextIO):
+        """Write the report as CSV: a row per task (and a total row), and a
+        column per period."""
+        writer = csv.writer(f)
+        writer.writerow(["task", *self.periods])
+        for task, row in zip(self.tasks, self.hours):
+            writer.writerow([task, *(f"{hours:.2f}" for hours in row)])
+        writer.writerow(
+            ["Total", *(f"{hours:.2f}" for hours in self.totals())]
+        )
+
+    def save(self, path: str | Path):
+        """Save the report, as JSON if the path ends in
+        JSON_REPORT_SUFFIX, else CSV."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", newline="", encoding="utf-8") as f:
+            if path.suffix.lower() == JSON_REPORT_SUFFIX:
+                json.dump(self.to_dict(), f, indent=2)
+            else:
+                self.write_csv(f)
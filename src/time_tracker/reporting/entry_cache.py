@@ -0,0 +1,139 @@
+"""This file contains a cache of the entries of files, as reports read
+them: indexed by start (see IntervalIndex), with their tasks and
+durations. It's shared by the trackers in a process, and can be
+snapshotted to disk for later processes (e.g., CLI runs)."""
+
+import hashlib
+import os
+import pickle
+import threading
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from time_tracker.config.load_config import settings
+from time_tracker.constants import ColumnHeaders
+
+from .ranges import IntervalIndex
+
+# How many files' entries to keep in the in-process cache:
+REPORT_CACHE_SIZE = 8
+
+# Resolved path -> ((mtime_ns, size), entries):
+_report_cache: dict[Path, tuple[tuple[int, int], "ReportEntries"]] = {}
+_report_cache_lock = threading.Lock()
+
+
+def clear_report_cache():
+    """Clear the in-process report cache."""
+    with _report_cache_lock:
+        _report_cache.clear()
+
+
+@dataclass
+class ReportEntries:
+    """The finished entries of a file (see IntervalIndex.from_entries),
+    with the tasks and durations of each (in the index's start order), and
+    the number of rows in the file."""
+
+    index: IntervalIndex
+    tasks: list[str]
+    durations: list[float]
+    rows: int
+
+    @classmethod
+    def from_entries(cls, entries: Sequence[dict[str, str]]):
+        """Index the entries of a file (as read by get_all_entries)."""
+        index = IntervalIndex.from_entries(entries)
+        task_key = ColumnHeaders.TASK.value
+        duration_key = ColumnHeaders.DURATION.value
+        rows = [entries[position] for position in index.positions]
+        return cls(
+            index=index,
+            tasks=[row.get(task_key) or "" for row in rows],
+            durations=[float(row.get(duration_key) or 0) for row in rows],
+            rows=len(entries),
+        )
+
+
+def get_report_snapshot_path(path: Path, snapshot_dir: Path) -> Path:
+    """Get the path of the pickled snapshot of a file's report entries."""
+    digest = hashlib.sha256(str(path).encode("utf8")).hexdigest()[:16]
+    return snapshot_dir / f"{path.name}-{digest}.report.pkl"
+
+
+def _load_report_snapshot(
+    snapshot_path: Path, key: tuple[int, int]
+) -> ReportEntries | None:
+    """Load a snapshot, if it was taken of the same version of the file."""
+    try:
+        snapshot_key, entries = pickle.loads(snapshot_path.read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+    if snapshot_key != key or not isinstance(entries, ReportEntries):
+        return None
+    return entries
+
+
+def _save_report_snapshot(
+    snapshot_path: Path, key: tuple[int, int], entries: ReportEntries
+):
+    """Save a snapshot, atomically replacing any previous one."""
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+    with tmp.open("wb") as f:
+        pickle.dump((key, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, snapshot_path)
+
+
+def load_report_entries(
+    path: str | Path,
+    read: Callable[[], Sequence[dict[str, str]]],
+    snapshot_dir: str | Path | None = settings.report_cache_dir,
+) -> ReportEntries:
+    """Load the report entries of a file, reusing an earlier result while
+    the file is unchanged (same path, mtime and size), so that repeated
+    reports (e.g., over other ranges) don't read and parse it again.
+
+    Otherwise, the whole file is read (with `read`) and indexed. Across
+    processes, that's only avoided if snapshots are enabled (the
+    `report_cache_dir` setting). The result is shared between callers,
+    so it should be treated as read-only.
+
+    Args:
+        path (str | Path): The entry file.
+        read (Callable[[], Sequence[dict[str, str]]]): Reads the file's
+            entries (e.g., TimeTracker.get_all_entries).
+        snapshot_dir (str | Path | None): If given, report entries are
+            also pickled to this directory, for other processes. Defaults
+            to the `report_cache_dir` setting.
+
+    Returns:
+        ReportEntries: The file's report entries.
+    """
+    path = Path(path).resolve()
+    stat = path.stat()  # Before reading, so changes meanwhile are seen.
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _report_cache_lock:
+        if (cached := _report_cache.get(path)) and cached[0] == key:
+            return cached[1]
+
+    snapshot_path = (
+        get_report_snapshot_path(path, Path(snapshot_dir))
+        if snapshot_dir
+        else None
+    )
+    entries = (
+        _load_report_snapshot(snapshot_path, key) if snapshot_path else None
+    )
+    if entries is None:
+        entries = ReportEntries.from_entries(read())
+        if snapshot_path:
+            _save_report_snapshot(snapshot_path, key, entries)
+
+    with _report_cache_lock:
+        _report_cache.pop(path, None)
+        _report_cache[path] = (key, entries)
+        for stale in list(_report_cache)[:-REPORT_CACHE_SIZE]:
+            del _report_cache[stale]  # The least recently loaded.
+    return entries
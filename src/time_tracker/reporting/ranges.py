@@ -0,0 +1,137 @@
+"""This file contains date ranges for reports: finding the entries that
+overlap a range, and clipping them to it."""
+
+import heapq
+import math
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from datetime import date, datetime, time, timedelta
+from operator import itemgetter
+
+from time_tracker.constants import ColumnHeaders
+
+
+def day_range(
+    start_dt: date | None = None, end_dt: date | None = None
+) -> tuple[datetime | None, datetime | None]:
+    """The half-open range [start_dt 00:00, the day after end_dt 00:00) of
+    a report's date filters (None where there's no filter)."""
+    return (
+        datetime.combine(start_dt, time()) if start_dt else None,
+        (
+            datetime.combine(end_dt + timedelta(days=1), time())
+            if end_dt
+            else None
+        ),
+    )
+
+
+def parse_naive(value: str) -> datetime:
+    """Parse an ISO date(time), dropping any timezone (keeping the wall
+    time, as for the entries' dates)."""
+    parsed = datetime.fromisoformat(value)
+    return parsed.replace(tzinfo=None) if parsed.tzinfo else parsed
+
+
+def clip_interval(
+    start: datetime,
+    end: datetime,
+    seconds: float,
+    lo: datetime | None,
+    hi: datetime | None,
+) -> tuple[datetime, datetime, float]:
+    """Clip an entry to the range [lo, hi), with the share of its seconds
+    in the range (in proportion to its time in it).
+
+    Args:
+        start (datetime): The entry's start.
+        end (datetime): The entry's end.
+        seconds (float): The entry's (recorded) duration.
+        lo (datetime | None): The range's start, if any.
+        hi (datetime | None): The range's (exclusive) end, if any.
+
+    Returns:
+        tuple[datetime, datetime, float]: The clipped start, end and
+            seconds.
+    """
+    clipped_start = max(start, lo) if lo else start
+    clipped_end = min(end, hi) if hi else end
+    if (clipped_start, clipped_end) == (start, end) or end <= start:
+        return start, end, seconds
+    share = (clipped_end - clipped_start) / (end - start)
+    return clipped_start, clipped_end, seconds * max(share, 0.0)
+
+
+class IntervalIndex:
+    """The intervals of finished entries, sorted by start, to find the ones
+    overlapping a range by bisection: O(log n), plus the overlapping ones
+    (and those starting less than the longest duration before the range).
+
+    The longest intervals (a LONG_FRACTION of them) are kept apart and
+    checked one by one, so that a few very long entries (e.g., a timer
+    left running for days) don't widen every search to a near-linear
+    scan."""
+
+    LONG_FRACTION = 0.01
+
+    def __init__(self, intervals: Sequence[tuple[int, datetime, datetime]]):
+        """Initialize the index.
+
+        Args:
+            intervals (Sequence[tuple[int, datetime, datetime]]): The
+                entries' positions (e.g., in the file), starts and ends.
+        """
+        intervals = sorted(intervals, key=itemgetter(1))  # Stable.
+        self.positions = [position for position, _, _ in intervals]
+        self.starts = [start for _, start, _ in intervals]
+        self.ends = [end for _, _, end in intervals]
+        # Entries ending before their start don't reach any further:
+        spans = [max(end - start, timedelta(0)) for _, start, end in intervals]
+        by_span = sorted(range(len(spans)), key=spans.__getitem__)
+        cut = len(spans) - math.ceil(len(spans) * self.LONG_FRACTION)
+        self.long = sorted(by_span[cut:])  # In start order.
+        self._long_set = frozenset(self.long)
+        self.max_span = max([timedelta(0), *(spans[i] for i in by_span[:cut])])
+
+    @classmethod
+    def from_entries(cls, entries: Sequence[dict[str, str]]):
+        """Index the finished entries (with an end) of a file."""
+        start_key = ColumnHeaders.START.value
+        end_key = ColumnHeaders.END.value
+        return cls(
+            [
+                (position, parse_naive(entry[start_key]), parse_naive(end))
+                for position, entry in enumerate(entries)
+                if (end := entry.get(end_key))
+            ]
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def overlapping(
+        self, lo: datetime | None = None, hi: datetime | None = None
+    ) -> Iterator[int]:
+        """Find the intervals overlapping the range [lo, hi) (or starting
+        in it, for empty intervals).
+
+        Args:
+            lo (datetime | None): The range's start, if any.
+            hi (datetime | None): The range's (exclusive) end, if any.
+
+        Yields:
+            int: The intervals' indices (in start order, into `positions`,
+                `starts` and `ends`).
+        """
+        first = (
+            0 if lo is None else bisect_left(self.starts, lo - self.max_span)
+        )
+        last = len(self.starts) if hi is None else bisect_left(self.starts, hi)
+        long = self._long_set
+        starts, ends = self.starts, self.ends
+        for i in heapq.merge(
+            (i for i in range(first, last) if i not in long),
+            (i for i in self.long if i < last),
+        ):
+            if lo is None or ends[i] > lo or lo <= starts[i]:
+                yield i
@@ -1,24 +1,202 @@
 """Run the time_tracker app."""
 
+import json
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+
 import typer
 from typing_extensions import Annotated
 
+from time_tracker.constants import DEFAULT_PROFILE_DIR, Period
+from time_tracker.invoice import BackendNames
+from time_tracker.reporting import JSON_REPORT_SUFFIX
+from time_tracker.storage import convert_entry_file
 from time_tracker.tracker import TimeTracker
+from time_tracker.utils import profile_call, read_entries
 
 app = typer.Typer()
 state = {"verbosity": 0}
 
+REPORT_PANEL = "Report options"
+INVOICE_PANEL = "Invoice options"
+FILE_PANEL = "Entry file options"
+
+
+@dataclass(frozen=True)
+class EntryFilters:
+    """The options selecting the entries to report or invoice."""
+
+    task: str = ""
+    start_date: str = ""
+    end_date: str = ""
+
+
+@dataclass(frozen=True)
+class ReportOptions:
+    """The options of the report action."""
+
+    split_tasks: bool = False
+    period: Period | None = None
+    report_file: str | None = None
+
+
+@dataclass(frozen=True)
+class InvoiceOptions:
+    """The options of the invoice and preview actions."""
+
+    state_file: str | None = None
+    filename: str | None = None
+    template: str | None = None
+    precompile_preamble: bool = False
+    backend: BackendNames = BackendNames.LATEX
+
+
+@dataclass(frozen=True)
+class FileOptions:
+    """The options of the actions that read or rewrite entry files."""
+
+    import_file: str | None = None
+    fix_overlaps: bool = False
+    convert_to: str | None = None
+
+
+@dataclass(frozen=True)
+class ActionOptions:
+    """The options of all the actions, by group."""
+
+    filters: EntryFilters = field(default_factory=EntryFilters)
+    report: ReportOptions = field(default_factory=ReportOptions)
+    invoice: InvoiceOptions = field(default_factory=InvoiceOptions)
+    files: FileOptions = field(default_factory=FileOptions)
+
+
+def run_track(tracker: TimeTracker, options: ActionOptions):
+    """Start or stop the timer."""
+    tracker.track(task=options.filters.task)
+
+
+def run_status(tracker: TimeTracker, _: ActionOptions):
+    """Print the timer's status."""
+    tracker.status()
+
+
+def run_report(tracker: TimeTracker, options: ActionOptions):
+    """Print (or save) a report, bucketed by period if one is given."""
+    filters, report = options.filters, options.report
+    if report.period:
+        tracker.report_buckets(
+            period=report.period,
+            filter_task=filters.task,
+            start_date=filters.start_date,
+            end_date=filters.end_date,
+            split_tasks=report.split_tasks,
+            report_file=report.report_file,
+        )
+        return
+    if report.report_file:
+        raise typer.BadParameter("--report-file needs a --period.")
+    tracker.report(
+        filter_task=filters.task,
+        start_date=filters.start_date,
+        end_date=filters.end_date,
+        split_tasks=report.split_tasks,
+    )
 
+
+def run_invoice(tracker: TimeTracker, options: ActionOptions):
+    """Generate an invoice."""
+    filters, invoice = options.filters, options.invoice
+    tracker.generate_invoice(
+        filter_task=filters.task,
+        start_date=filters.start_date,
+        end_date=filters.end_date,
+        invoice_state_file=invoice.state_file,
+        invoice_filename=invoice.filename,
+        invoice_template=invoice.template,
+        precompile_preamble=invoice.precompile_preamble,
+        backend=invoice.backend.value,
+    )
+
+
+def run_preview(tracker: TimeTracker, options: ActionOptions):
+    """Print the data of an invoice, as JSON."""
+    filters, invoice = options.filters, options.invoice
+    preview = tracker.preview_invoice(
+        filter_task=filters.task,
+        start_date=filters.start_date,
+        end_date=filters.end_date,
+        invoice_state_file=invoice.state_file,
+        invoice_template=invoice.template,
+    )
+    print(json.dumps(preview, indent=2))
+
+
+def run_import(tracker: TimeTracker, options: ActionOptions):
+    """Import the entries of a CSV or JSON lines file."""
+    if not (import_file := options.files.import_file):
+        raise typer.BadParameter("The import action needs an --import-file.")
+    count = tracker.import_entries(read_entries(import_file))
+    print(f"Imported {count} entries into {tracker.filepath}.")
+
+
+def run_sort(tracker: TimeTracker, options: ActionOptions):
+    """Sort the entries, printing the sort report as JSON."""
+    report = tracker.sort_entries(fix_overlaps=options.files.fix_overlaps)
+    print(json.dumps(report, indent=2))
+
+
+def run_normalize(tracker: TimeTracker, _: ActionOptions):
+    """Normalize the tasks of the entries."""
+    count = tracker.normalize_entries()
+    print(f"Normalized the tasks of {count} entries.")
+
+
+def run_convert(tracker: TimeTracker, options: ActionOptions):
+    """Convert the entry file to CSV or the binary format."""
+    if not (convert_to := options.files.convert_to):
+        raise typer.BadParameter(
+            "The convert action needs a --convert-to file."
+        )
+    count = convert_entry_file(tracker.filepath, convert_to)
+    print(f"Converted {count} entries into {convert_to}.")
+
+
+def run_initialize(tracker: TimeTracker, _: ActionOptions):
+    """Initialize the configuration files."""
+    tracker.init_config()
+
+
+ACTION_HANDLERS: dict[
+    TimeTracker.TrackerActions, Callable[[TimeTracker, ActionOptions], None]
+] = {
+    TimeTracker.TrackerActions.CONVERT: run_convert,
+    TimeTracker.TrackerActions.IMPORT: run_import,
+    TimeTracker.TrackerActions.INNITIALIZE: run_initialize,
+    TimeTracker.TrackerActions.INVOICE: run_invoice,
+    TimeTracker.TrackerActions.NORMALIZE: run_normalize,
+    TimeTracker.TrackerActions.PREVIEW: run_preview,
+    TimeTracker.TrackerActions.REPORT: run_report,
+    TimeTracker.TrackerActions.SORT: run_sort,
+    TimeTracker.TrackerActions.STATUS: run_status,
+    TimeTracker.TrackerActions.TRACK: run_track,
+}
+
+
+# Typer maps each option to a parameter; the per-action ones are grouped
+# (in ActionOptions, and in --help) once parsed.
 @app.command()
-def main(  # pylint: disable=too-many-arguments
+def main(  # pylint: disable=too-many-arguments,too-many-locals
+    *,
     action: Annotated[
         str,
         typer.Option(
             "--action",
             "-a",
             help=(
-                "What to do with the tracker. "
-                "Valid actions: track, status, report, invoice, initialize."
+                "What to do with the tracker. Valid actions: "
+                + ", ".join(action.value for action in ACTION_HANDLERS)
+                + "."
             ),
         ),
     ] = "track",
@@ -33,6 +211,73 @@ def main(  # pylint: disable=too-many-arguments
         str,
         typer.Option("--directory", "-d", help="Directory to store the file."),
     ] = "",
+    import_file: Annotated[
+        str | None,
+        typer.Option(
+            "--import-file",
+            help=(
+                "CSV or JSON lines file of entries to add with the import "
+                "action."
+            ),
+            rich_help_panel=FILE_PANEL,
+        ),
+    ] = None,
+    fix_overlaps: Annotated[
+        bool,
+        typer.Option(
+            "--fix-overlaps",
+            help=(
+                "With the sort action, fix overlapping entries rather than "
+                "just reporting them."
+            ),
+            rich_help_panel=FILE_PANEL,
+        ),
+    ] = False,
+    split_tasks: Annotated[
+        bool,
+        typer.Option(
+            "--split-tasks",
+            help=(
+                "With the report action, split entries with several tasks "
+                "evenly across them, and total each task separately."
+            ),
+            rich_help_panel=REPORT_PANEL,
+        ),
+    ] = False,
+    period: Annotated[
+        Period | None,
+        typer.Option(
+            "--period",
+            help=(
+                "With the report action, report the hours per task in each "
+                "period (as CSV)."
+            ),
+            rich_help_panel=REPORT_PANEL,
+        ),
+    ] = None,
+    report_file: Annotated[
+        str | None,
+        typer.Option(
+            "--report-file",
+            help=(
+                "With --period, file to write the report to (JSON if it "
+                f"ends in {JSON_REPORT_SUFFIX}, else CSV), rather than print "
+                "it."
+            ),
+            rich_help_panel=REPORT_PANEL,
+        ),
+    ] = None,
+    convert_to: Annotated[
+        str | None,
+        typer.Option(
+            "--convert-to",
+            help=(
+                "File to write the client's entries to with the convert "
+                "action (a .ttb file for the binary format, else CSV)."
+            ),
+            rich_help_panel=FILE_PANEL,
+        ),
+    ] = None,
     start_date: Annotated[
         str,
         typer.Option(
@@ -55,7 +300,10 @@ def main(  # pylint: disable=too-many-arguments
         str | None,
         typer.Option(
             "--client-config",
-            help="File containing information regarding clients.",
+            help=(
+                "File containing information regarding clients, or a "
+                "directory with one JSON/YAML file per client."
+            ),
         ),
     ] = None,
     me_config_file: Annotated[
@@ -73,6 +321,7 @@ def main(  # pylint: disable=too-many-arguments
         typer.Option(
             "--invoice-state",
             help="File containing information regarding persistent invoice state.",
+            rich_help_panel=INVOICE_PANEL,
         ),
     ] = None,
     invoice_filename: Annotated[
@@ -81,6 +330,7 @@ def main(  # pylint: disable=too-many-arguments
             "--invoice-filename",
             "-i",
             help="Name for the generated invoice file.",
+            rich_help_panel=INVOICE_PANEL,
         ),
     ] = None,
     invoice_template: Annotated[
@@ -88,15 +338,51 @@ def main(  # pylint: disable=too-many-arguments
         typer.Option(
             "--invoice-template",
             help="File to be used as a template for the generated invoices.",
+            rich_help_panel=INVOICE_PANEL,
         ),
     ] = None,
+    precompile_preamble: Annotated[
+        bool,
+        typer.Option(
+            "--precompile-preamble",
+            help=(
+                "Reuse a pdflatex format file built from the invoice "
+                "template's preamble."
+            ),
+            rich_help_panel=INVOICE_PANEL,
+        ),
+    ] = False,
+    backend: Annotated[
+        BackendNames,
+        typer.Option(
+            "--backend",
+            "-b",
+            help="Invoice rendering backend.",
+            rich_help_panel=INVOICE_PANEL,
+        ),
+    ] = BackendNames.LATEX,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            help=(
+                "Profile the action with cProfile, writing a .prof file to "
+                f"{DEFAULT_PROFILE_DIR} and a summary to the log."
+            ),
+        ),
+    ] = False,
+    profile_top: Annotated[
+        int,
+        typer.Option(
+            "--profile-top",
+            help="How many functions to include in the profile summary.",
+        ),
+    ] = 20,
     verbosity: Annotated[
         int, typer.Option("--verbosity", "-v", count=True)
     ] = 0,
 ) -> int:
     """Main function to call the time_tracker methods."""
-
-    # Do stuff here.
     tracker = TimeTracker(
         filename=filename,
         directory=directory,
@@ -104,33 +390,41 @@ def main(  # pylint: disable=too-many-arguments
         client_config_file=client_config_file,
         me_config_file=me_config_file,
     )
-    # print("It worked!")
     if verbosity > 0:
         print(f"Verbosity: {verbosity}")
         state["verbosity"] = verbosity
-    if action == tracker.actions.TRACK.value:
-        tracker.track(task=task)
-    elif action == tracker.actions.STATUS.value:
-        tracker.status()
-    elif action == tracker.actions.REPORT.value:
-        tracker.report(
-            filter_task=task, start_date=start_date, end_date=end_date
+
+    options = ActionOptions(
+        filters=EntryFilters(task, start_date, end_date),
+        report=ReportOptions(split_tasks, period, report_file),
+        invoice=InvoiceOptions(
+            invoice_state_file,
+            invoice_filename,
+            invoice_template,
+            precompile_preamble,
+            backend,
+        ),
+        files=FileOptions(import_file, fix_overlaps, convert_to),
+    )
+    try:
+        handler = ACTION_HANDLERS[tracker.actions(action)]
+    except ValueError:
+        handler = run_track  # Unknown actions track, as they always have.
+
+    if profile:
+        prof_path = DEFAULT_PROFILE_DIR / (
+            f"{datetime.now().strftime('%Y_%m_%d-%H%M%S')}-{action}.prof"
         )
-    elif action == tracker.actions.INVOICE.value:
-        tracker.generate_invoice(
-            filter_task=task,
-            start_date=start_date,
-            end_date=end_date,
-            invoice_state_file=invoice_state_file,
-            invoice_filename=invoice_filename,
-            invoice_template=invoice_template,
+        profile_call(
+            lambda: handler(tracker, options),
+            tracker.logger,
+            prof_path,
+            top=profile_top,
         )
-    elif action == tracker.actions.INNITIALIZE.value:
-        tracker.init_config()
+        tracker.logger.info("Counters: %s", tracker.counters)
+        print(f"Profile written to {prof_path}")
     else:
-        tracker.track(task=task)
-    # return call_function(state, data, percentage)
-    # A comment?
+        handler(tracker, options)
     return 0
 
 
@@ -0,0 +1,14 @@
+"""Storage formats for time entries."""
+
+from .binary_store import (
+    BINARY_SUFFIX,
+    BinaryEntryStore,
+    TaskDictionary,
+    convert_entry_file,
+    is_binary_entry_file,
+)
+from .task_registry import (
+    TASK_REGISTRY_SUFFIX,
+    TaskRegistry,
+    task_registry_path,
+)
@@ -0,0 +1,385 @@
+"""This file contains a binary, fixed-width record format for time
+entries, as an alternative to CSV files for live tracking."""
+
+import csv
+import json
+import os
+import struct
+import warnings
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from time_tracker.constants import HEADERS, ColumnHeaders
+from time_tracker.utils.file_lock import append_locked, locked_fd
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+
+BINARY_SUFFIX = ".ttb"
+MAGIC = b"TTB1"
+# start (us since the epoch), end (us), duration (hundredths of a second),
+# task ID, flags:
+RECORD = struct.Struct("<qqqIH2x")
+RECORD_SIZE = RECORD.size  # 32
+# The header takes one record's space, so record i is at (i + 1) * 32:
+HEADER = MAGIC.ljust(RECORD_SIZE, b"\0")
+END_OFFSET = 8  # Of the end (followed by the duration and task ID).
+TIME_FIELD = struct.Struct("<q")  # A record's start, end or duration.
+NONE = -(2**63)  # An empty end or duration.
+# The start or end was written as a date, without a time:
+FLAG_START_DATE = 1
+FLAG_END_DATE = 2
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+START = ColumnHeaders.START.value
+END = ColumnHeaders.END.value
+DURATION = ColumnHeaders.DURATION.value
+TASK = ColumnHeaders.TASK.value
+
+
+def numpy_record_dtype() -> "np.dtype":
+    """The numpy dtype of a record (see `BinaryEntryStore.read_array`)."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    return np.dtype(
+        [
+            ("start", "<i8"),
+            ("end", "<i8"),
+            ("duration", "<i8"),
+            ("task", "<u4"),
+            ("flags", "<u2"),
+            ("pad", "V2"),
+        ]
+    )
+
+
+def encode_time(value: str, date_flag: int) -> tuple[int, int]:
+    """Encode an ISO date(time) as microseconds since the epoch.
+
+    Returns:
+        tuple[int, int]: The microseconds, and `date_flag` if the value
+            was a date (or 0).
+
+    Raises:
+        ValueError: If the value wouldn't be decoded to the same string
+            (e.g., it has a timezone, or isn't in isoformat's format).
+    """
+    if not value:
+        return NONE, 0
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        raise ValueError(f"Timezones aren't supported: {value}")
+    flags = date_flag if len(value) == len("YYYY-MM-DD") else 0
+    if decode_time((parsed - EPOCH) // MICROSECOND, flags) != value:
+        raise ValueError(f"Not an isoformat date(time): {value}")
+    return (parsed - EPOCH) // MICROSECOND, flags
+
+
+def decode_time(micros: int, flags: int) -> str:
+    """Decode microseconds since the epoch to an ISO date(time)."""
+    if micros == NONE:
+        return ""
+    value = EPOCH + micros * MICROSECOND
+    return value.date().isoformat() if flags else value.isoformat()
+
+
+def encode_duration(value: str) -> int:
+    """Encode a duration of seconds, with two decimals, as hundredths.
+
+    Raises:
+        ValueError: If the duration isn't written with two decimals.
+    """
+    if not value:
+        return NONE
+    hundredths = round(float(value) * 100)
+    if decode_duration(hundredths) != value:
+        raise ValueError(f"Not a duration with two decimals: {value}")
+    return hundredths
+
+
+def decode_duration(hundredths: int) -> str:
+    """Decode hundredths of a second to seconds, with two decimals."""
+    return "" if hundredths == NONE else f"{hundredths / 100:.2f}"
+
+
+class TaskDictionary:
+    """An append-only file of task strings (JSON lines), whose line
+    numbers are the task IDs stored in binary records."""
+
+    def __init__(self, path: str | Path):
+        """Initialize the dictionary.
+
+        Args:
+            path (str | Path): The dictionary file.
+        """
+        self.path = Path(path)
+        self.tasks: list[str] = []
+        self.ids: dict[str, int] = {}
+        self._offset = 0  # How much of the file has been read.
+
+    def refresh(self):
+        """Read tasks appended (e.g., by other processes) since the last
+        read."""
+        try:
+            with self.path.open("rb") as f:
+                f.seek(self._offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        # Only whole lines (an append may be in progress):
+        data = data[: data.rfind(b"\n") + 1]
+        self._offset += len(data)
+        for line in data.splitlines():
+            self.ids.setdefault(task := json.loads(line), len(self.tasks))
+            self.tasks.append(task)
+
+    def get_task(self, task_id: int) -> str:
+        """Get a task by ID."""
+        if task_id >= len(self.tasks):
+            self.refresh()
+        return self.tasks[task_id]
+
+    def get_id(self, task: str) -> int:
+        """Get the ID of a task, adding it to the dictionary if needed."""
+        if (task_id := self.ids.get(task)) is not None:
+            return task_id
+        fd = os.open(self.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o666)
+        try:
+            with locked_fd(fd):
+                self.refresh()  # Another process may have added it.
+                if (task_id := self.ids.get(task)) is None:
+                    line = json.dumps(task, ensure_ascii=False) + "\n"
+                    os.write(fd, line.encode("utf-8"))
+                    self.refresh()
+                    task_id = self.ids[task]
+        finally:
+            os.close(fd)
+        return task_id
+
+
+class BinaryEntryStore:
+    """Time entries as fixed-width binary records (see RECORD), with tasks
+    kept in a TaskDictionary next to the file (<file>.tasks).
+
+    Entries are read and written as dicts with the CSV columns (HEADERS),
+    and conversion to and from CSV is lossless: values that couldn't be
+    converted back to the same strings are rejected. Datetimes must be
+    naive and written as by `datetime.isoformat` (or be dates), and
+    durations must have two decimals, as the tracker writes them.
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialize the store.
+
+        Args:
+            path (str | Path): The binary file (conventionally *.ttb).
+        """
+        self.path = Path(path)
+        self.task_dictionary = TaskDictionary(
+            self.path.with_name(self.path.name + ".tasks")
+        )
+
+    def ensure_exists(self):
+        """Create the file (with its header) if it doesn't exist."""
+        if not self.path.exists():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_bytes(HEADER)
+
+    def __len__(self) -> int:
+        return self.path.stat().st_size // RECORD_SIZE - 1
+
+    def encode(self, entry: dict[str, Any]) -> bytes:
+        """Encode an entry (by CSV column) as a record."""
+        start, start_flags = encode_time(
+            entry.get(START) or "", FLAG_START_DATE
+        )
+        if start == NONE:
+            raise ValueError("Missing start.")
+        end, end_flags = encode_time(entry.get(END) or "", FLAG_END_DATE)
+        return RECORD.pack(
+            start,
+            end,
+            encode_duration(entry.get(DURATION) or ""),
+            self.task_dictionary.get_id(entry.get(TASK) or ""),
+            start_flags | end_flags,
+        )
+
+    def decode(self, record: bytes | memoryview) -> dict[str, str]:
+        """Decode a record as an entry (by CSV column)."""
+        start, end, duration, task_id, flags = RECORD.unpack(record)
+        return {
+            START: decode_time(start, flags & FLAG_START_DATE),
+            END: decode_time(end, flags & FLAG_END_DATE),
+            DURATION: decode_duration(duration),
+            TASK: self.task_dictionary.get_task(task_id),
+        }
+
+    def _records_end(self, size: int) -> int:
+        """The end of the whole records of the file, given its size. A
+        partial record after them (e.g., from a crash mid-append) is
+        ignored, with a warning, until the next append truncates it."""
+        if torn := size % RECORD_SIZE:
+            warnings.warn(
+                f"{self.path} ends with a partial record ({torn} bytes, "
+                "e.g. from an interrupted write); ignoring it.",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+        return size - torn
+
+    def entries(self) -> Iterator[dict[str, str]]:
+        """Read all entries."""
+        data = self.path.read_bytes()
+        self._check_header(data)
+        view = memoryview(data)
+        end = self._records_end(len(data))
+        for offset in range(RECORD_SIZE, end, RECORD_SIZE):
+            yield self.decode(view[offset : offset + RECORD_SIZE])
+
+    def last_entry(self) -> dict[str, str] | None:
+        """Read the last entry (the last whole record of the file)."""
+        with self.path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if (end := self._records_end(size)) <= RECORD_SIZE:
+                return None
+            return self.decode(
+                os.pread(f.fileno(), RECORD_SIZE, end - RECORD_SIZE)
+            )
+
+    def append(self, entries: Iterable[dict[str, Any]]) -> int:
+        """Append entries, with a single write while holding the file's
+        lock (see `append_locked`), after truncating any partial record
+        at the end of the file (see `_records_end`).
+
+        Returns:
+            int: The number of entries appended.
+        """
+        data = b"".join(self.encode(entry) for entry in entries)
+        self.ensure_exists()
+        if torn := append_locked(self.path, data, align=RECORD_SIZE):
+            warnings.warn(
+                f"Truncated a partial record ({torn} bytes) at the end of "
+                f"{self.path}.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        return len(data) // RECORD_SIZE
+
+    def close_last(self, end: str, duration: str, task: str | None = None):
+        """Close the last (open) entry, by writing its end and duration
+        (16 bytes) in place, and its task ID if `task` is given.
+
+        Args:
+            end (str): The end (an isoformat datetime).
+            duration (str): The duration (seconds, with two decimals).
+            task (str | None): The entry's new task, if it changed.
+
+        Raises:
+            ValueError: If there are no entries, or the last one is
+                already closed (has an end).
+        """
+        end_micros, end_flags = encode_time(end, FLAG_END_DATE)
+        if end_flags or end_micros == NONE:
+            raise ValueError(f"The end must be a datetime: {end}")
+        data = struct.pack("<qq", end_micros, encode_duration(duration))
+        if task is not None:
+            data += struct.pack("<I", self.task_dictionary.get_id(task))
+        fd = os.open(self.path, os.O_RDWR)
+        try:
+            with locked_fd(fd):
+                end = self._records_end(os.fstat(fd).st_size)
+                if (offset := end - RECORD_SIZE) < RECORD_SIZE:
+                    raise ValueError(f"{self.path} has no entries.")
+                (last_end,) = TIME_FIELD.unpack(
+                    os.pread(fd, TIME_FIELD.size, offset + END_OFFSET)
+                )
+                if last_end != NONE:
+                    raise ValueError(
+                        f"The last entry of {self.path} is already closed."
+                    )
+                os.pwrite(fd, data, offset + END_OFFSET)
+        finally:
+            os.close(fd)
+
+    def write_entries(self, entries: Iterable[dict[str, Any]]) -> int:
+        """Replace all entries (atomically). The task dictionary is kept,
+        since it's append-only.
+
+        Returns:
+            int: The number of entries written.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        count = 0
+        try:
+            with tmp.open("wb") as f:
+                f.write(HEADER)
+                for entry in entries:
+                    f.write(self.encode(entry))
+                    count += 1
+            os.replace(tmp, self.path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        return count
+
+    def read_array(self) -> "np.ndarray":
+        """Read all records as a numpy structured array (see
+        `numpy_record_dtype`), without decoding them. Times are in
+        microseconds since the epoch and durations in hundredths of a
+        second, with NONE for empty values; tasks are IDs into
+        `task_dictionary`.
+
+        Raises:
+            ImportError: If numpy (the `numpy` extra) isn't installed.
+        """
+        try:
+            import numpy as np  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                "read_array needs numpy: install the `numpy` extra."
+            ) from e
+
+        data = self.path.read_bytes()
+        self._check_header(data)
+        return np.frombuffer(
+            data[: self._records_end(len(data))],
+            dtype=numpy_record_dtype(),
+            offset=RECORD_SIZE,
+        )
+
+    def _check_header(self, data: bytes):
+        """Check that data starts with the file header."""
+        if not data.startswith(MAGIC):
+            raise ValueError(f"{self.path} isn't a binary entry file.")
+
+
+def is_binary_entry_file(path: str | Path) -> bool:
+    """Whether a path is (named as) a binary entry file."""
+    return Path(path).suffix.lower() == BINARY_SUFFIX
+
+
+def convert_entry_file(src: str | Path, dst: str | Path) -> int:
+    """Convert a file of entries between CSV and the binary format (by
+    their suffixes, see `is_binary_entry_file`), losslessly.
+
+    Returns:
+        int: The number of entries converted.
+    """
+    src, dst = Path(src), Path(dst)
+    if is_binary_entry_file(src):
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        count = 0
+        with dst.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(
+                f, fieldnames=HEADERS, quoting=csv.QUOTE_MINIMAL
+            )
+            writer.writeheader()
+            for entry in BinaryEntryStore(src).entries():
+                writer.writerow(entry)
+                count += 1
+        return count
+    with src.open("r", newline="", encoding="utf-8") as f:
+        return BinaryEntryStore(dst).write_entries(csv.DictReader(f))
@@ -0,0 +1,131 @@
+"""This file contains a registry of integer IDs for individual task
+names, for aggregating entries by task."""
+
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from .binary_store import TaskDictionary
+
+TASK_REGISTRY_SUFFIX = ".task_ids"
+
+
+def task_registry_path(entry_file: str | Path) -> Path:
+    """The task registry file of a CSV entry file (next to it)."""
+    entry_file = Path(entry_file)
+    return entry_file.with_name(entry_file.name + TASK_REGISTRY_SUFFIX)
+
+
+class TaskRegistry:
+    """Compact, stable integer IDs for individual task names (e.g. "a"
+    and "b", rather than "a, b"), kept in a TaskDictionary: the binary
+    store's own one, or a file next to a CSV file (see
+    task_registry_path).
+
+    Task strings (as written in entries) are interned as tuples of the
+    IDs of their tasks, which are cached, so each distinct string is only
+    split once. Tasks are only added to the dictionary when registered
+    (e.g., see persist); otherwise, unknown tasks get temporary, negative
+    IDs, so that reading entries doesn't write anything. Only the tasks
+    of interned task strings are registered then; the tasks of looked up
+    ones (e.g., report filters) never are (see lookup).
+    """
+
+    def __init__(
+        self,
+        dictionary: TaskDictionary,
+        split: Callable[[str], Iterable[str]],
+    ):
+        """Initialize the registry.
+
+        Args:
+            dictionary (TaskDictionary): The dictionary of task IDs.
+            split (Callable[[str], Iterable[str]]): Splits a task string
+                into its (normalized, deduplicated) task names.
+        """
+        self.dictionary = dictionary
+        self.split = split
+        self._interned: dict[str, tuple[int, ...]] = {}
+        self._temporary: dict[str, int] = {}
+        self._temporary_tasks: list[str] = []
+        # The temporarily identified tasks to register (see persist), in
+        # the order they were interned:
+        self._unregistered: dict[str, None] = {}
+
+    @property
+    def path(self) -> Path:
+        """The dictionary file."""
+        return self.dictionary.path
+
+    def refresh(self):
+        """Read the tasks registered (e.g., by other processes) since the
+        last read."""
+        self.dictionary.refresh()
+
+    def _lookup_id(self, task: str, record: bool = True) -> int:
+        """Get the ID of a task, or a temporary ID if it isn't registered
+        (recording the task for persist, unless `record` is False)."""
+        if (task_id := self.dictionary.ids.get(task)) is not None:
+            return task_id
+        if (task_id := self._temporary.get(task)) is None:
+            self._temporary_tasks.append(task)
+            task_id = self._temporary[task] = -len(self._temporary_tasks)
+        if record:
+            self._unregistered[task] = None
+        return task_id
+
+    def intern(self, task_str: str) -> tuple[int, ...]:
+        """Get the IDs of the tasks in a task string, without registering
+        new tasks (see refresh)."""
+        if (ids := self._interned.get(task_str)) is None:
+            ids = self._interned[task_str] = tuple(
+                self._lookup_id(task) for task in self.split(task_str)
+            )
+        return ids
+
+    def lookup(self, task_str: str) -> tuple[int, ...]:
+        """Get the IDs of the tasks in a task string, like intern, but
+        without recording unregistered tasks for persist (e.g., for a
+        filter, which may name tasks no entry has)."""
+        if (ids := self._interned.get(task_str)) is not None:
+            return ids
+        return tuple(
+            self._lookup_id(task, record=False)
+            for task in self.split(task_str)
+        )
+
+    def register(self, task_str: str) -> tuple[int, ...]:
+        """Get the IDs of the tasks in a task string, adding new tasks to
+        the dictionary."""
+        ids = self._interned.get(task_str)
+        if ids is None or min(ids, default=0) < 0:
+            ids = self._interned[task_str] = tuple(
+                self.dictionary.get_id(task) for task in self.split(task_str)
+            )
+        return ids
+
+    def persist(self):
+        """Register the tasks that only have temporary IDs from interning
+        (not from lookup), e.g. once a report has read them. Temporary IDs
+        are invalid afterwards."""
+        if not self._temporary_tasks:
+            return
+        for task in self._unregistered:
+            self.dictionary.get_id(task)
+        self._interned = {
+            task_str: ids
+            for task_str, ids in self._interned.items()
+            if min(ids, default=0) >= 0
+        }
+        self._temporary.clear()
+        self._temporary_tasks.clear()
+        self._unregistered.clear()
+
+    def get_task(self, task_id: int) -> str:
+        """Get a task by (possibly temporary) ID."""
+        if task_id < 0:
+            return self._temporary_tasks[-task_id - 1]
+        return self.dictionary.get_task(task_id)
+
+    def join(self, ids: Iterable[int]) -> str:
+        """Join the tasks of some IDs into a (normalized) task string."""
+        return ", ".join(self.get_task(task_id) for task_id in ids)
@@ -1,15 +1,16 @@
 """This file contains the actual tracker."""
 
 import csv
-import re
+import os
 import shutil
-import subprocess
+import sys
 from collections import defaultdict
-from datetime import datetime
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import date, datetime
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
-
-from jinja2 import Environment, FileSystemLoader
+from typing import Any
 
 from time_tracker.constants import (
     DEFAULT_CLIENT,
@@ -17,6 +18,7 @@ from time_tracker.constants import (
     DEFAULT_INVOICE_DIR,
     DEFAULT_INVOICE_STATE_CONFIG_FILE,
     DEFAULT_INVOICE_TEMPLATE,
+    DEFAULT_LOGO_CACHE_DIR,
     DEFAULT_ME_CONFIG_FILE,
     DEFAULT_OUTPUT_DIR,
     HEADERS,
@@ -25,15 +27,46 @@ from time_tracker.constants import (
     SAMPLE_INVOICE_TEMPLATE,
     SAMPLE_ME_CONFIG_FILE,
     ColumnHeaders,
+    Period,
+)
+from time_tracker.invoice import (
+    INVOICE_BACKENDS,
+    InvoiceBackend,
+    LatexInvoiceBackend,
 )
-from time_tracker.logger import LoggerMixin
+from time_tracker.logger import ActionCounters, LoggerMixin, timed_span
 
 from .config import (
+    Me,
     get_next_invoice_number,
     load_client_config,
     load_me_config,
+    peek_next_invoice_number,
     prepare_logo_for_latex,
 )
+from .reporting import (
+    BucketedReport,
+    bucket_entries,
+    check_period,
+    clip_interval,
+    day_range,
+    load_report_entries,
+)
+from .storage import (
+    BinaryEntryStore,
+    TaskDictionary,
+    TaskRegistry,
+    is_binary_entry_file,
+    task_registry_path,
+)
+from .utils import (
+    append_csv_row,
+    format_csv_row,
+    locked_file,
+    maintenance,
+    normalize_task_column,
+    task_parsing,
+)
 
 
 class TimeTracker(LoggerMixin):
@@ -42,9 +75,14 @@ class TimeTracker(LoggerMixin):
     class TrackerActions(Enum):
         """Enum class for valid TimeTracker actions."""
 
+        CONVERT = "convert"
+        IMPORT = "import"
         INNITIALIZE = "initialize"
         INVOICE = "invoice"
+        NORMALIZE = "normalize"
+        PREVIEW = "preview"
         REPORT = "report"
+        SORT = "sort"
         STATUS = "status"
         TRACK = "track"
 
@@ -59,7 +97,8 @@ class TimeTracker(LoggerMixin):
     ):
         """Initialize class."""
         super().__init__(**kwargs)
-        self.client_config = load_client_config(client_config_file)
+        # Only the selected client needs to be validated:
+        self.client_config = load_client_config(client_config_file, lazy=True)
         self.client = client or DEFAULT_CLIENT
         if self.client not in self.client_config.clients:
             msg = f"Client {self.client} not in client config."
@@ -85,12 +124,21 @@ class TimeTracker(LoggerMixin):
                 filename = f"{self.client}.csv"
         assert filename
         self.filepath = dir_path / filename
+        # Files ending in .ttb hold binary records, rather than CSV:
+        self.store = (
+            BinaryEntryStore(self.filepath)
+            if is_binary_entry_file(self.filepath)
+            else None
+        )
         self.ensure_file_exists()
         self.actions = self.TrackerActions
+        self.counters = ActionCounters()
 
     def ensure_file_exists(self):
         """Check if the file exists. If not, create it with default headers."""
-        if not self.filepath.exists():
+        if self.store is not None:
+            self.store.ensure_exists()
+        elif not self.filepath.exists():
             self.filepath.parent.mkdir(parents=True, exist_ok=True)
             with self.filepath.open("w", newline="") as f:
                 writer = csv.writer(f)
@@ -99,27 +147,54 @@ class TimeTracker(LoggerMixin):
     def get_all_entries(self) -> list[dict[str, str]]:
         """Get all entries in the file."""
         try:  # pylint: disable=too-many-try-statements
-            with self.filepath.open("r", newline="") as f:
-                return list(csv.DictReader(f))
+            with timed_span(self.logger, "read_csv") as span:
+                if self.store is not None:
+                    entries = list(self.store.entries())
+                    span["bytes"] = self.filepath.stat().st_size
+                else:
+                    with self.filepath.open("r", newline="") as f:
+                        entries = list(csv.DictReader(f))
+                        span["bytes"] = os.fstat(f.fileno()).st_size
+                span["rows"] = len(entries)
+            self.counters["rows_parsed"] += span["rows"]
+            self.counters["bytes_read"] += span["bytes"]
+            return entries
         except Exception as e:  # pylint: disable=broad-exception-caught
             self.logger.error("⚠️ Failed to read CSV: %s", e)
             return []
 
     def get_last_entry(self) -> dict[str, str] | None:
         """Get last entry in file."""
+        if self.store is not None:  # The last record is at a known offset.
+            return self.store.last_entry()
         entries = self.get_all_entries()
         return entries[-1] if entries else None
 
-    def safe_write_csv(self, rows: list[dict], mode: str = "w"):
+    def safe_write_csv(
+        self,
+        rows: Iterable[dict],
+        mode: str = "w",
+        path: str | Path | None = None,
+    ):
         """Overwrites the CSV file with `rows`, ensuring safe CSV escaping.
 
         Args:
-            rows (list[dict]): The rows to write.
+            rows (Iterable[dict]): The rows to write (consumed lazily).
             mode (str): The mode of file writing (e.g., "w" for write/overwrite,
                 "a" for append). Defaults to "w".
+            path (str | Path | None): The file to write, if not the
+                tracker's CSV file. Defaults to None.
         """
         append_char = "a"
-        with open(self.filepath, mode, newline="", encoding="utf-8") as f:
+        if self.store is not None and path is None:
+            if append_char in mode:
+                self.store.append(rows)
+            else:
+                self.store.write_entries(rows)
+            return
+        with open(
+            path or self.filepath, mode, newline="", encoding="utf-8"
+        ) as f:
             writer = csv.DictWriter(
                 f, fieldnames=HEADERS, quoting=csv.QUOTE_MINIMAL
             )
@@ -128,9 +203,81 @@ class TimeTracker(LoggerMixin):
             for row in rows:
                 writer.writerow(row)
 
+    def append_csv_row(self, row: dict):
+        """Appends a row to the CSV file, with the same escaping as
+        `safe_write_csv`, in a single (atomic) write.
+
+        Args:
+            row (dict): The row to append.
+        """
+        if self.store is not None:
+            self.store.append([row])
+        else:
+            append_csv_row(self.filepath, row, HEADERS)
+
+    def import_entries(
+        self, entries: Iterable[Mapping[str, Any]], max_errors: int = 20
+    ) -> int:
+        """Validate, normalize (see `maintenance.validate_entry`) and append a
+        batch of
+        entries, e.g. historical entries from `read_entries`. Nothing is
+        written unless all entries are valid. Only the last entry may be
+        open (without an end, for a running timer), and only if the timer
+        isn't already running, so that an open entry is always the last
+        one in the file.
+
+        The entries are written in one go while holding the file's lock,
+        through a large buffer, rather than re-reading and rewriting the
+        file per entry like `track`.
+
+        Args:
+            entries (Iterable[Mapping[str, Any]]): The entries, by column
+                name.
+            max_errors (int): How many invalid entries to describe in the
+                error. Defaults to 20.
+
+        Returns:
+            int: The number of entries imported.
+
+        Raises:
+            ValueError: If any entries are invalid, listing them (by their
+                1-based index in `entries`), or if the timer is running.
+        """
+        self.counters.reset()
+        with timed_span(self.logger, "import") as span:
+            valid = maintenance.validate_entries(entries, max_errors)
+            if (
+                self.filepath.exists()
+                and (last_entry := self.get_last_entry())
+                and not last_entry[ColumnHeaders.END.value]
+            ):
+                raise ValueError(
+                    "The timer is running (the last entry is open): stop "
+                    "it before importing."
+                )
+            task_key = ColumnHeaders.TASK.value
+            tasks = normalize_task_column(entry[task_key] for entry in valid)
+            for entry, task in zip(valid, tasks):
+                entry[task_key] = task
+            self.ensure_file_exists()
+            if self.store is not None:
+                self.store.append(valid)
+            else:
+                with locked_file(self.filepath, buffering=1 << 20) as f:
+                    f.writelines(
+                        format_csv_row(entry, HEADERS) for entry in valid
+                    )
+            span["rows"] = len(valid)
+        self.counters["rows_imported"] = len(valid)
+        self.logger.info(
+            "Imported %d entries into %s.", len(valid), self.filepath
+        )
+        return len(valid)
+
     def track(self, task: str | None = None):
         """Track a timer (and maybe task).
         Start or stop timing, depending on current status."""
+        self.counters.reset()
         now = datetime.now()
         last_entry = self.get_last_entry()
         normed_task = self.normalize_tasks(task) if task else ""
@@ -151,14 +298,25 @@ class TimeTracker(LoggerMixin):
                 ]
             )
             duration = (now - start_time).total_seconds()
-            # with self.filepath.open("r", newline="") as f:
-            #     lines = list(csv.reader(f))
-            lines = self.get_all_entries()
             last_entry_task = last_entry.get(ColumnHeaders.TASK.value, "")
             # task_entry = (
             #     last_entry_task + " " + normed_task if normed_task else last_entry_task
             # )
             task_entry = self.merge_task_lists(last_entry_task, normed_task)
+            if self.store is not None:
+                # Write the end, duration (and task) in place:
+                self.store.close_last(
+                    now.isoformat(),
+                    f"{duration:.2f}",
+                    task_entry if task_entry != last_entry_task else None,
+                )
+                print(
+                    f"Stopped timer at {now}. Duration: {duration:.2f} seconds."
+                )
+                return
+            # with self.filepath.open("r", newline="") as f:
+            #     lines = list(csv.reader(f))
+            lines = self.get_all_entries()
             # Replace last row:
             lines[-1] = {
                 ColumnHeaders.START.value: last_entry[  # pylint: disable=unsubscriptable-object
@@ -175,18 +333,16 @@ class TimeTracker(LoggerMixin):
             print(f"Stopped timer at {now}. Duration: {duration:.2f} seconds.")
         else:
             # Start new entry:
-            new_entry = [
-                {
-                    ColumnHeaders.START.value: now.isoformat(),
-                    ColumnHeaders.END.value: "",
-                    ColumnHeaders.DURATION.value: "",
-                    ColumnHeaders.TASK.value: normed_task or "",
-                }
-            ]
+            new_entry = {
+                ColumnHeaders.START.value: now.isoformat(),
+                ColumnHeaders.END.value: "",
+                ColumnHeaders.DURATION.value: "",
+                ColumnHeaders.TASK.value: normed_task or "",
+            }
             # with self.filepath.open("a", newline="") as f:
             #     writer = csv.writer(f)
             #     writer.writerow([now.isoformat(), "", "", task or ""])
-            self.safe_write_csv(new_entry, mode="a")
+            self.append_csv_row(new_entry)
             print(
                 f"Started timer at {now}"
                 + (f" for task: {normed_task}" if normed_task else ".")
@@ -195,27 +351,134 @@ class TimeTracker(LoggerMixin):
     @staticmethod
     def merge_task_lists(start_tasks: str, end_tasks: str) -> str:
         """Merge and deduplicate comma-separated task strings."""
-
-        def parse(task_str: str) -> list[str]:
-            return [t.strip() for t in task_str.split(",") if t.strip()]
-
-        combined = parse(start_tasks) + parse(end_tasks)
-        deduped = list(dict.fromkeys(combined))  # preserves order
-        return ", ".join(deduped)
+        return task_parsing.merge_task_lists(start_tasks, end_tasks)
 
     @staticmethod
     def normalize_tasks(task_str: str) -> str:
         """Convert comma-separated or " and " -separated tasks to CSV-style."""
-        # To separate only commas and spaces, just use [,\s] as the re pattern.
-        parts = [
-            part.strip()
-            for part in re.split(r",|\s+and\s+", task_str)
-            if part.strip()
-        ]
-        return ", ".join(dict.fromkeys(parts))  # de-dupe + preserve order
+        return task_parsing.normalize_tasks(task_str)
+
+    @cached_property
+    def task_registry(self) -> TaskRegistry:
+        """The registry of task IDs: in the binary store's task dictionary,
+        or a file next to a CSV file (see task_registry_path). Only reports
+        write it (see TaskRegistry.persist)."""
+        dictionary = (
+            self.store.task_dictionary
+            if self.store is not None
+            else TaskDictionary(task_registry_path(self.filepath))
+        )
+        return TaskRegistry(dictionary, task_parsing.split_task_names)
+
+    def sort_entries(
+        self,
+        fix_overlaps: bool = False,
+        chunk_size: int = 100_000,
+        max_examples: int = 10,
+    ) -> dict[str, Any]:
+        """Make the CSV file chronological and free of duplicate entries,
+        in bounded memory, and report (or fix) entries that overlap the
+        previous one (see `maintenance.sort_entry_rows`).
+
+        The sorted file replaces the original atomically, and only if all
+        starts are valid. Entries appended meanwhile by another process
+        could be lost, so this shouldn't run alongside tracking.
+
+        Args:
+            fix_overlaps (bool): Whether to fix overlapping entries, rather
+                than just report them. Defaults to False.
+            chunk_size (int): How many entries to sort in memory at a time.
+                Defaults to 100_000.
+            max_examples (int): How many overlaps to include in the report.
+                Defaults to 10.
+
+        Returns:
+            dict[str, Any]: The number of entries read and written, whether
+                the file was already sorted, and the numbers of duplicates,
+                overlaps and fixed overlaps, with examples of overlaps.
+
+        Raises:
+            ValueError: If an entry's start or end isn't an ISO date(time).
+        """
+        if self.store is not None:
+            raise ValueError(
+                "Sorting binary entry files isn't supported. Convert the "
+                "file to CSV (see convert_entry_file) to sort it."
+            )
+        self.counters.reset()
+        report = maintenance.new_sort_report()
+        with (
+            timed_span(self.logger, "sort_entries") as span,
+            maintenance.replacing_file(self.filepath, "sorting") as tmp_path,
+            self.filepath.open("r", newline="", encoding="utf-8") as f,
+        ):
+            self.safe_write_csv(
+                maintenance.sort_entry_rows(
+                    csv.DictReader(f),
+                    report,
+                    fix_overlaps=fix_overlaps,
+                    chunk_size=chunk_size,
+                    max_examples=max_examples,
+                    tmp_dir=self.filepath.parent,
+                ),
+                path=tmp_path,
+            )
+            span["rows"] = report["rows_read"]
+        self.counters["rows_parsed"] += report["rows_read"]
+        self.logger.info("Sorted %s: %s", self.filepath, report)
+        return report
+
+    def normalize_entries(self, chunk_size: int = 100_000) -> int:
+        """Normalize the tasks of all entries (see normalize_tasks), e.g.
+        after changing task conventions, a chunk of entries at a time (see
+        `maintenance.normalize_rows`).
+
+        The normalized file replaces the original atomically. Entries
+        appended meanwhile by another process could be lost, so this
+        shouldn't run alongside tracking.
+
+        Args:
+            chunk_size (int): How many entries to normalize at a time.
+                Defaults to 100_000.
+
+        Returns:
+            int: The number of entries whose tasks changed.
+        """
+        self.counters.reset()
+        counts = {"read": 0, "changed": 0}
+        with timed_span(self.logger, "normalize_entries") as span:
+            if self.store is not None:
+                self.store.write_entries(
+                    maintenance.normalize_rows(
+                        self.store.entries(), counts, chunk_size
+                    )
+                )
+            else:
+                with (
+                    maintenance.replacing_file(
+                        self.filepath, "normalizing"
+                    ) as tmp_path,
+                    self.filepath.open("r", newline="", encoding="utf-8") as f,
+                ):
+                    self.safe_write_csv(
+                        maintenance.normalize_rows(
+                            csv.DictReader(f), counts, chunk_size
+                        ),
+                        path=tmp_path,
+                    )
+            span["rows"] = counts["read"]
+        self.counters["rows_parsed"] += counts["read"]
+        self.logger.info(
+            "Normalized %d of %d entries in %s.",
+            counts["changed"],
+            counts["read"],
+            self.filepath,
+        )
+        return counts["changed"]
 
     def status(self):
         """Get status of currently tracked task, or no active timer."""
+        self.counters.reset()
         last_entry = self.get_last_entry()
         if (
             last_entry
@@ -238,9 +501,15 @@ class TimeTracker(LoggerMixin):
         filter_task: str | None = None,
         start_date: str | None = None,
         end_date: str | None = None,
+        split_tasks: bool = False,
     ):
-        """Output a report of time tracking."""
-        totals, _ = self.generate_report(filter_task, start_date, end_date)
+        """Output a report of time tracking (see generate_report), and
+        register the tasks read (see TaskRegistry.persist)."""
+        self.counters.reset()
+        totals, _ = self.generate_report(
+            filter_task, start_date, end_date, split_tasks=split_tasks
+        )
+        self.task_registry.persist()
 
         if not totals:
             print("No matching entries found.")
@@ -252,17 +521,46 @@ class TimeTracker(LoggerMixin):
         total_time = sum(totals.values())
         print(f"\nTotal time: {total_time / 3600:.2f} h")
 
-    def generate_report(
+    def report_buckets(  # pylint: disable=too-many-arguments
         self,
+        period: Period | str = Period.DAY,
+        *,
         filter_task: str | None = None,
         start_date: str | None = None,
         end_date: str | None = None,
+        split_tasks: bool = False,
+        report_file: str | Path | None = None,
     ):
-        """Generate a report, which can be printed or turned into an invoice."""
-        entries = self.get_all_entries()
-        # print(entries)
-        totals: dict[str, float] = defaultdict(float)
+        """Output a report of the hours per task in each period (see
+        generate_bucketed_report), as CSV, or save it to `report_file` (see
+        BucketedReport.save), and register the tasks read
+        (see TaskRegistry.persist)."""
+        self.counters.reset()
+        report = self.generate_bucketed_report(
+            period,
+            filter_task=filter_task,
+            start_date=start_date,
+            end_date=end_date,
+            split_tasks=split_tasks,
+        )
+        self.task_registry.persist()
+        if not report.tasks:
+            print("No matching entries found.")
+        elif report_file:
+            report.save(report_file)
+            print(f"Report written to {report_file}")
+        else:
+            report.write_csv(sys.stdout)
 
+    @staticmethod
+    def _parse_date_filters(
+        start_date: str | None = None, end_date: str | None = None
+    ) -> tuple[date | None, date | None]:
+        """Parse the start and end date filters of a report.
+
+        Raises:
+            ValueError: If a date isn't formatted as YYYY-MM-DD.
+        """
         try:  # pylint: disable=too-many-try-statements
             start_dt = (
                 datetime.strptime(start_date, "%Y-%m-%d").date()
@@ -277,49 +575,201 @@ class TimeTracker(LoggerMixin):
         except ValueError:
             print("Invalid date format. Use YYYY-MM-DD.")
             raise
+        return start_dt, end_dt
+
+    def _iter_report_entries(  # pylint: disable=too-many-locals
+        self,
+        filter_task: str | None = None,
+        start_dt: date | None = None,
+        end_dt: date | None = None,
+        split_tasks: bool = False,
+    ) -> Iterator[tuple[tuple[int, ...], float, datetime, datetime]]:
+        """Read the finished entries matching a report's filters (see
+        generate_report), in a single pass.
+
+        Entries are clipped to the dates' range, [start_dt 00:00, the day
+        after end_dt 00:00), keeping the share of their seconds in it (see
+        clip_interval), and found by bisection (see IntervalIndex). The
+        indexed entries are reused while the file is unchanged (see
+        load_report_entries); otherwise the whole file is read.
+
+        Yields:
+            tuple[tuple[int, ...], float, datetime, datetime]: The IDs of
+                each entry's tasks (see task_registry), seconds, start and
+                end (clipped). When splitting tasks, an entry with several
+                tasks is yielded once per (matching) task, with a share of
+                its seconds.
+        """
+        entries = load_report_entries(self.filepath, self.get_all_entries)
+        registry = self.task_registry
+        registry.refresh()
+        filter_ids = registry.lookup(filter_task) if filter_task else None
+        filter_ids_set = frozenset(filter_ids or ())
+        lo, hi = day_range(start_dt, end_dt)
+        index = entries.index
+
+        with timed_span(self.logger, "aggregate") as span:
+            for i in index.overlapping(lo, hi):
+                task_ids = registry.intern(entries.tasks[i] or "Unspecified")
+                if filter_ids is not None and (
+                    filter_ids_set.isdisjoint(task_ids)
+                    if split_tasks
+                    else task_ids != filter_ids
+                ):
+                    continue
+                start_time, end_time = index.starts[i], index.ends[i]
+                duration = entries.durations[i]
+                if (lo and start_time < lo) or (hi and end_time > hi):
+                    start_time, end_time, duration = clip_interval(
+                        start_time, end_time, duration, lo, hi
+                    )
+                if split_tasks:
+                    share = duration / len(task_ids)
+                    for task_id in task_ids:
+                        if filter_ids is None or task_id in filter_ids_set:
+                            yield (task_id,), share, start_time, end_time
+                else:
+                    yield task_ids, duration, start_time, end_time
+            span["rows"] = entries.rows
+
+    def generate_report(
+        self,
+        filter_task: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        split_tasks: bool = False,
+    ):
+        """Generate a report, which can be printed or turned into an invoice.
+
+        Entries are aggregated by the IDs of their tasks (see
+        task_registry), so task strings that only differ in formatting
+        (e.g. "a and b" and "a, b") are totaled together, under their
+        normalized form.
+
+        Args:
+            filter_task (str | None): Only include entries with these
+                tasks (or, when splitting tasks, only these tasks).
+            start_date (str | None): Start date filter (YYYY-MM-DD).
+            end_date (str | None): End date filter (YYYY-MM-DD).
+            split_tasks (bool): Whether to split the durations of entries
+                with several tasks evenly across them, and total each task
+                separately, rather than totaling each combination of tasks.
+                Defaults to False.
+
+        Returns:
+            tuple[dict[str, float], tuple[date, date]]: The seconds spent
+                per task, and the first and last dates of the entries.
+        """
+        start_dt, end_dt = self._parse_date_filters(start_date, end_date)
         # first_date = (
         #     datetime.combine(start_date, datetime.time()) if start_date else datetime.now()
         # )
         # last_date = datetime.combine(end_date, datetime.time()) if end_date else datetime.now()
         first_date = start_dt or datetime.today().date()
         last_date = end_dt or datetime.today().date()
-
-        for entry in entries:
-            task = entry.get(ColumnHeaders.TASK.value, "") or "Unspecified"
-            duration = float(entry.get(ColumnHeaders.DURATION.value, "0") or 0)
-            # print(duration)
-            if ColumnHeaders.END.value in entry:  # Only finished entries.
-                start_time = datetime.fromisoformat(
-                    entry[ColumnHeaders.START.value]
-                ).date()
-                end_time = datetime.fromisoformat(
-                    entry[ColumnHeaders.END.value]
-                ).date()
-                if start_dt and start_time < start_dt:
-                    continue
-                if end_dt and end_time > end_dt:
-                    continue
-                if filter_task and task != filter_task:
-                    # print(f"Entry {entry} not in {filter_task}, skipping...")
-                    continue
-                # print(f"first_date ({type(first_date)}): {first_date}")
-                # print(f"start_time ({type(start_time)}): {start_time}")
-                first_date = min(first_date, start_time)
-                last_date = max(last_date, end_time)
-                totals[task] += duration
-                # print(f"Current totals: {totals}")
+        totals_by_ids: dict[tuple[int, ...], float] = defaultdict(float)
+        for (
+            task_ids,
+            seconds,
+            start_time,
+            end_time,
+        ) in self._iter_report_entries(
+            filter_task, start_dt, end_dt, split_tasks
+        ):
+            # print(f"first_date ({type(first_date)}): {first_date}")
+            # print(f"start_time ({type(start_time)}): {start_time}")
+            first_date = min(first_date, start_time.date())
+            last_date = max(last_date, end_time.date())
+            totals_by_ids[task_ids] += seconds
+            # print(f"Current totals: {totals}")
+        if end_dt:  # Entries may end at midnight after the end date.
+            last_date = min(last_date, end_dt)
+        totals = {
+            self.task_registry.join(task_ids): seconds
+            for task_ids, seconds in totals_by_ids.items()
+        }
         return totals, (first_date, last_date)
 
+    def generate_bucketed_report(  # pylint: disable=too-many-arguments
+        self,
+        period: Period | str = Period.DAY,
+        *,
+        filter_task: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        split_tasks: bool = False,
+    ) -> BucketedReport:
+        """Generate a report of the hours per task in each day, ISO week or
+        month, in a single pass over the entries. Entries spanning several
+        periods (e.g., crossing midnight) are split across them in
+        proportion to their time in each.
+
+        Args:
+            period (Period | str): The period of the buckets. Defaults to
+                Period.DAY.
+            filter_task (str | None): See generate_report.
+            start_date (str | None): Start date filter (YYYY-MM-DD).
+            end_date (str | None): End date filter (YYYY-MM-DD).
+            split_tasks (bool): See generate_report. Defaults to False.
+
+        Returns:
+            BucketedReport: The hours per task and period.
+
+        Raises:
+            ValueError: If the period or a date filter is invalid.
+        """
+        period = check_period(period)
+        start_dt, end_dt = self._parse_date_filters(start_date, end_date)
+        buckets = bucket_entries(
+            self._iter_report_entries(
+                filter_task, start_dt, end_dt, split_tasks
+            ),
+            period,
+        )
+        return BucketedReport.from_totals(
+            period,
+            {
+                self.task_registry.join(task_ids): task_buckets
+                for task_ids, task_buckets in buckets.items()
+            },
+        )
+
     def generate_invoice(  # pylint: disable=too-many-arguments,too-many-locals
         self,
         filter_task: str | None = None,
         start_date: str | None = None,
         end_date: str | None = None,
+        *,
         invoice_filename: str | Path | None = None,
         invoice_template: str | Path | None = None,
         invoice_state_file: str | Path | None = None,
+        precompile_preamble: bool = False,
+        backend: str = LatexInvoiceBackend.name,
     ):
-        """Generate an invoice based on tracked time."""
+        """Generate an invoice based on tracked time.
+
+        Args:
+            filter_task (str | None): Only include this task.
+            start_date (str | None): Start date filter (YYYY-MM-DD).
+            end_date (str | None): End date filter (YYYY-MM-DD).
+            invoice_filename (str | Path | None): Name for the generated
+                invoice file.
+            invoice_template (str | Path | None): Template for the
+                generated invoice.
+            invoice_state_file (str | Path | None): File holding the
+                persistent invoice state.
+            precompile_preamble (bool): Whether to dump the template's
+                preamble into a pdflatex format file once and reuse it
+                for later compiles (LaTeX backend only). Defaults to False.
+            backend (str): Name of the invoice backend to render with (see
+                INVOICE_BACKENDS). Defaults to "latex".
+        """
+        if backend not in INVOICE_BACKENDS:
+            raise ValueError(
+                f"Unknown invoice backend: {backend}. "
+                f"Valid backends: {', '.join(INVOICE_BACKENDS)}."
+            )
+        self.counters.reset()
         # 1. Change "report" method to give the report values for this
         #    in "run_report", and then just use those values to print.
         totals, dates = self.generate_report(filter_task, start_date, end_date)
@@ -338,16 +788,49 @@ class TimeTracker(LoggerMixin):
             )
         else:
             invoice_filename = Path(invoice_filename)
-        invoice_template = (
-            Path(invoice_template)
-            if invoice_template
-            else (
-                DEFAULT_INVOICE_TEMPLATE
-                if DEFAULT_INVOICE_TEMPLATE.exists()
-                else SAMPLE_INVOICE_TEMPLATE
+        items, total = self._build_invoice_items(totals)
+        me = self.me
+        if backend == LatexInvoiceBackend.name:
+            invoice_backend: InvoiceBackend = LatexInvoiceBackend(
+                self.logger,
+                self._resolve_invoice_template(invoice_template),
+                precompile_preamble=precompile_preamble,
             )
+            # Load 'me' and invoice state info. The loaded config is
+            # shared (cached), so it's copied rather than modified:
+            if self.me.logo_path:
+                me = self.me.model_copy(
+                    update={
+                        "logo_path": prepare_logo_for_latex(
+                            self.me.logo_path,
+                            invoice_filename.parent,
+                            cache_dir=DEFAULT_LOGO_CACHE_DIR,
+                        )
+                    }
+                )
+        else:
+            invoice_backend = INVOICE_BACKENDS[backend](self.logger)
+        invoice_number = get_next_invoice_number(invoice_state_file)
+        invoice_backend.render(
+            self._build_invoice_context(
+                items, total, (first_date, last_date), invoice_number, me=me
+            ),
+            invoice_filename,
         )
-        # Build the items list:
+        self.counters.update(invoice_backend.timings)
+
+    def _build_invoice_items(
+        self, totals: dict[str, float]
+    ) -> tuple[list[dict], float]:
+        """Build the itemized invoice lines from report totals.
+
+        Args:
+            totals (dict[str, float]): Seconds spent per task.
+
+        Returns:
+            tuple[list[dict], float]: The invoice items (task, hours, rate
+                and total), and the invoice total.
+        """
         items = []
         total = 0.0
         rate = self.client_config.clients[self.client].rate
@@ -363,61 +846,90 @@ class TimeTracker(LoggerMixin):
                 }
             )
             total += subtotal
-        invoice_template_path = invoice_template.parent
-        invoice_template_filename = invoice_template.name
-        # Load 'me' and invoice state info:
-        if self.me.logo_path:
-            self.me.logo_path = prepare_logo_for_latex(
-                self.me.logo_path, invoice_filename.parent
-            )
-        invoice_number = get_next_invoice_number(invoice_state_file)
-        # Load and render LaTeX template:
-        env = Environment(
-            loader=FileSystemLoader(invoice_template_path),
-            block_start_string="((*",
-            block_end_string="*))",
-            variable_start_string="(((",
-            variable_end_string=")))",
-            comment_start_string="((#",
-            comment_end_string="#))",
+        return items, total
+
+    def _build_invoice_context(
+        self,
+        items: list[dict],
+        total: float,
+        dates: tuple[date, date],
+        invoice_number: int,
+        me: Me | None = None,
+    ) -> dict[str, Any]:
+        """Build the data an invoice backend renders. Uses the tracker's
+        'me' config, unless another one is given."""
+        return {
+            "client": self.client_config.clients[self.client],
+            "date": datetime.now().strftime("%m/%d/%Y"),
+            "items": items,
+            "total": total,
+            "start_date": dates[0].strftime("%m/%d/%Y"),
+            "end_date": dates[1].strftime("%m/%d/%Y"),
+            "me": me or self.me,
+            "invoice_number": invoice_number,
+        }
+
+    @staticmethod
+    def _resolve_invoice_template(
+        invoice_template: str | Path | None = None,
+    ) -> Path:
+        """Get the invoice template to use, falling back to the default
+        template, and then to the sample template."""
+        if invoice_template:
+            return Path(invoice_template)
+        return (
+            DEFAULT_INVOICE_TEMPLATE
+            if DEFAULT_INVOICE_TEMPLATE.exists()
+            else SAMPLE_INVOICE_TEMPLATE
         )
-        env.filters["latex_breaks"] = lambda s: s.replace("\n", r"\\")
-        template = env.get_template(invoice_template_filename)
-        rendered_tex = template.render(
-            client=self.client_config.clients[self.client],
-            date=datetime.now().strftime("%m/%d/%Y"),
-            items=items,
-            total=total,
-            start_date=first_date.strftime("%m/%d/%Y"),
-            end_date=last_date.strftime("%m/%d/%Y"),
-            me=self.me,
-            invoice_number=invoice_number,
+
+    def preview_invoice(
+        self,
+        filter_task: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        invoice_template: str | Path | None = None,
+        invoice_state_file: str | Path | None = None,
+    ) -> dict[str, Any]:
+        """Preview what an invoice would bill, without generating it.
+
+        This computes the invoice items, total and dates of service, and
+        renders the invoice's LaTeX source, but doesn't consume an invoice
+        number, write any files, or run pdflatex.
+
+        Args:
+            filter_task (str | None): Only include this task.
+            start_date (str | None): Start date filter (YYYY-MM-DD).
+            end_date (str | None): End date filter (YYYY-MM-DD).
+            invoice_template (str | Path | None): Template for the
+                invoice.
+            invoice_state_file (str | Path | None): File holding the
+                persistent invoice state.
+
+        Returns:
+            dict[str, Any]: The JSON-serializable invoice preview.
+        """
+        self.counters.reset()
+        totals, dates = self.generate_report(filter_task, start_date, end_date)
+        items, total = self._build_invoice_items(totals)
+        invoice_number = peek_next_invoice_number(invoice_state_file)
+        context = self._build_invoice_context(
+            items, total, dates, invoice_number
         )
-        # Write and compile:
-        tex_path = invoice_filename.with_suffix(".tex")
-        with open(tex_path, "w", encoding="utf8") as f:
-            f.write(rendered_tex)
-        try:  # pylint: disable=too-many-try-statements
-            _ = subprocess.run(
-                [
-                    "pdflatex",
-                    "-interaction=nonstopmode",
-                    "-shell-escape",
-                    tex_path.name,
-                ],
-                cwd=tex_path.parent,
-                check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
-            self.logger.info(f"✅ Invoice created: {invoice_filename}")
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
-            self.logger.warning("❌ Failed to compile LaTeX invoice: %s", e)
-            if hasattr(e, "stdout") and e.stdout:
-                self.logger.warning("📄 STDOUT:\n%s", e.stdout)
-            if hasattr(e, "stderr") and e.stderr:
-                self.logger.warning("🐞 STDERR:\n%s", e.stderr)
+        invoice_backend = LatexInvoiceBackend(
+            self.logger, self._resolve_invoice_template(invoice_template)
+        )
+        tex = invoice_backend.render_tex(context)
+        self.counters.update(invoice_backend.timings)
+        return {
+            "client": self.client,
+            "invoice_number": invoice_number,
+            "start_date": dates[0].isoformat(),
+            "end_date": dates[1].isoformat(),
+            "items": items,
+            "total": total,
+            "tex": tex,
+        }
 
     @staticmethod
     def init_config():
@@ -1,10 +1,22 @@
 """Import package modules for direct import from package."""
 
+from .compiled_split_init import apply_compiled_split_inits
+from .csv_append import append_csv_row, format_csv_row
+from .external_sort import external_sort
+from .file_lock import append_locked, locked_file
 from .get_unique_filename import get_unique_filename
+from .latex_format import ensure_preamble_format, split_preamble
+from .profiling import profile_call
+from .read_entries import read_entries
 from .split_args_for_inits import (
     LEFTOVERS,
-    SplitInitMixin,
     apply_split_inits,
-    auto_split_init,
     split_args_for_inits_strict_kwargs,
 )
+from .split_init_mixin import SplitInitMixin, auto_split_init
+from .task_parsing import (
+    merge_task_lists,
+    normalize_task_column,
+    normalize_tasks,
+    split_task_names,
+)
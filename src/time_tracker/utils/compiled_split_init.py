@@ -0,0 +1,140 @@
+"""This file contains the compiled split __init__ routing: functions,
+generated once per class and call shape, that do what `apply_split_inits`
+does with the argument routing worked out ahead of time."""
+
+import keyword
+from collections.abc import Callable
+from typing import Any
+
+from .split_args_for_inits import (
+    DEBUG_PRINTS,
+    LEFTOVERS,
+    cached_for_class,
+    find_calling_class,
+    plan_init_chain_calls,
+    share_missing_params_across_parents,
+    split_args_for_inits_strict_kwargs,
+)
+
+
+class _ValueRef:  # pylint: disable=too-few-public-methods
+    """Placeholder for an argument while compiling a split __init__,
+    holding the source expression of the argument."""
+
+    def __init__(self, expr: str):
+        self.expr = expr
+
+
+def _value_expr(value: Any, namespace: dict[str, Any]) -> str:
+    """The source expression of a value routed by a compiled split
+    __init__: the argument's expression for a placeholder, or a name bound
+    to the value in `namespace` (e.g., for a default shared across
+    parents)."""
+    if isinstance(value, _ValueRef):
+        return value.expr
+    name = f"_value_{len(namespace)}"
+    namespace[name] = value
+    return name
+
+
+def _call_args(args: list, kwargs: dict, namespace: dict[str, Any]) -> str:
+    """The source of a call's arguments. Kwargs whose names aren't
+    identifiers (or are keywords) are passed in a `**` dict."""
+    parts = [_value_expr(value, namespace) for value in args]
+    others = []
+    for key, value in kwargs.items():
+        if key.isidentifier() and not keyword.iskeyword(key):
+            parts.append(f"{key}={_value_expr(value, namespace)}")
+        else:
+            others.append(f"{key!r}: {_value_expr(value, namespace)}")
+    if others:
+        parts.append(f"**{{{', '.join(others)}}}")
+    return ", ".join(parts)
+
+
+def _split_init_source(
+    calls: list[tuple[type, list, dict]],
+    leftovers: dict[str, Any],
+    namespace: dict[str, Any],
+) -> str:
+    """The source of a `split_init(self, args, kwargs)` function making
+    the __init__ calls (see `plan_init_chain_calls`) and returning the
+    leftovers, binding the __init__s and values it uses in `namespace`."""
+    lines = ["def split_init(self, args, kwargs):"]
+    for i, (base, args, kwargs) in enumerate(calls):
+        namespace[f"_init_{i}"] = base.__init__
+        call_args = _call_args(args, kwargs, namespace)
+        lines.append(
+            f"    _init_{i}(self{', ' if call_args else ''}{call_args})"
+        )
+    leftover_kwargs = ", ".join(
+        f"{key!r}: {_value_expr(value, namespace)}"
+        for key, value in leftovers["kwargs"].items()
+    )
+    lines.append(
+        f"    return {{'args': "
+        f"[{_call_args(leftovers['args'], {}, namespace)}], "
+        f"'kwargs': {{{leftover_kwargs}}}}}"
+    )
+    return "\n".join(lines)
+
+
+def _compile_split_init(
+    cls: type, nargs: int, keys: tuple[str, ...]
+) -> Callable[[Any, tuple, dict], dict[str, Any]]:
+    """Generate a function doing what `apply_split_inits` does for
+    instances of `cls` called with `nargs` args and kwargs `keys`, with
+    the argument routing worked out ahead of time.
+
+    The routing is found by running `apply_split_inits`'s steps once, on
+    placeholders for the arguments; it only depends on the number of
+    args and the names of the kwargs.
+
+    Returns:
+        Callable[[Any, tuple, dict], dict[str, Any]]: Function taking
+            (self, args, kwargs), which calls the parent __init__s and
+            returns the leftovers.
+    """
+    split = split_args_for_inits_strict_kwargs(
+        cls,
+        tuple(_ValueRef(f"args[{i}]") for i in range(nargs)),
+        {key: _ValueRef(f"kwargs[{key!r}]") for key in keys},
+    )
+    share_missing_params_across_parents(split, stop_at=object)
+    namespace: dict[str, Any] = {}
+    source = _split_init_source(
+        plan_init_chain_calls(cls, split, find_calling_class(cls)),
+        split[LEFTOVERS],
+        namespace,
+    )
+    if DEBUG_PRINTS:
+        print(f"[_compile_split_init] {cls.__name__}:\n{source}")
+    exec(  # pylint: disable=exec-used
+        compile(source, f"<split_init {cls.__qualname__}>", "exec"),
+        namespace,
+    )
+    return namespace["split_init"]
+
+
+def apply_compiled_split_inits(self, args=(), kwargs=None):
+    """Do what `apply_split_inits` does, with a routing function
+    generated once per class and call shape (the number of args and the
+    names of the kwargs), instead of working out the routing on every
+    call.
+
+    The generated functions are dropped if the MRO, or any __init__ in
+    it, changes. Type hint and bytecode routing aren't supported, as
+    with `apply_split_inits`.
+    """
+    kwargs = kwargs or {}
+    cls = type(self)
+    keys = tuple(kwargs)
+    split_init = cached_for_class(
+        cls,
+        ("compiled_split_init", len(args), keys),
+        lambda: _compile_split_init(cls, len(args), keys),
+    )
+    self._init_leftovers = split_init(  # pylint: disable=protected-access
+        self, args, kwargs
+    )
+    return self._init_leftovers  # pylint: disable=protected-access
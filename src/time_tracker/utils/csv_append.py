@@ -0,0 +1,67 @@
+"""This file contains a fast path for appending single rows to CSV files."""
+
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from .file_lock import append_locked
+
+# The characters that make csv.QUOTE_MINIMAL (excel dialect) quote a
+# field: the delimiter, the quote character and line terminators.
+_SPECIAL_CHARS = frozenset(',"\r\n')
+LINE_TERMINATOR = "\r\n"
+
+
+def format_csv_field(value: Any) -> str:
+    """Format a field as csv.writer does with QUOTE_MINIMAL."""
+    if value is None:
+        return ""
+    field = value if isinstance(value, str) else str(value)
+    if _SPECIAL_CHARS.isdisjoint(field):
+        return field
+    return '"' + field.replace('"', '""') + '"'
+
+
+def format_csv_row(row: Mapping[str, Any], fieldnames: Iterable[str]) -> str:
+    """Format a row as csv.DictWriter does with QUOTE_MINIMAL (and the
+    default restval and line terminator).
+
+    Args:
+        row (Mapping[str, Any]): The row's values, by field name.
+        fieldnames (Iterable[str]): The CSV's columns, in order.
+
+    Returns:
+        str: The formatted line, including its line terminator.
+
+    Raises:
+        ValueError: If `row` has fields that aren't in `fieldnames`.
+    """
+    fieldnames = list(fieldnames)
+    if extra := row.keys() - set(fieldnames):
+        raise ValueError(
+            "dict contains fields not in fieldnames: "
+            + ", ".join(repr(field) for field in extra)
+        )
+    fields = [format_csv_field(row.get(name, "")) for name in fieldnames]
+    if fields == [""]:  # A lone empty field is quoted, to not be skipped.
+        fields = ['""']
+    return ",".join(fields) + LINE_TERMINATOR
+
+
+def append_csv_row(
+    path: str | Path, row: Mapping[str, Any], fieldnames: Iterable[str]
+):
+    """Append a row to a CSV file with a single write to an O_APPEND file
+    descriptor, so that concurrent appenders' rows don't interleave. The
+    file's lock (see `append_locked`) is held for the write, so rows don't
+    land inside a batch being written by a bulk import either.
+
+    This skips setting up a csv.DictWriter and file object, and writes
+    the same bytes as `csv.DictWriter(f, fieldnames).writerow(row)`.
+
+    Args:
+        path (str | Path): The CSV file (created if missing).
+        row (Mapping[str, Any]): The row's values, by field name.
+        fieldnames (Iterable[str]): The CSV's columns, in order.
+    """
+    append_locked(path, format_csv_row(row, fieldnames).encode("utf-8"))
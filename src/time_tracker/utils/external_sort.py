@@ -0,0 +1,101 @@
+"""This file contains an external merge sort for CSV rows, for files too
+large to sort in memory."""
+
+import csv
+import heapq
+import tempfile
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import count, islice
+from pathlib import Path
+from typing import Any
+
+
+def _write_chunk(
+    rows: Iterable[dict[str, str]], fieldnames: Sequence[str], path: Path
+) -> Path:
+    """Write rows to a chunk file."""
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def _read_chunk(path: Path) -> Iterator[dict[str, str]]:
+    """Read the rows of a chunk file, lazily."""
+    with path.open("r", newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def _merge_runs(
+    runs: list[Path],
+    key: Callable[[dict[str, str]], Any],
+    fieldnames: Sequence[str],
+    max_fan_in: int,
+    new_run_path: Callable[[], Path],
+) -> list[Path]:
+    """Merge runs in passes, `max_fan_in` at a time, until few enough
+    remain to merge at once, keeping the runs in order (for stability).
+
+    Returns:
+        list[Path]: The remaining runs, in order.
+    """
+    while len(runs) > max_fan_in:  # pylint: disable=while-used
+        group, rest = runs[:max_fan_in], runs[max_fan_in:]
+        merged = heapq.merge(*(_read_chunk(run) for run in group), key=key)
+        runs = [_write_chunk(merged, fieldnames, new_run_path()), *rest]
+        for run in group:
+            run.unlink()
+    return runs
+
+
+def external_sort(  # pylint: disable=too-many-arguments
+    rows: Iterable[dict[str, str]],
+    key: Callable[[dict[str, str]], Any],
+    fieldnames: Sequence[str],
+    *,
+    chunk_size: int = 100_000,
+    tmp_dir: str | Path | None = None,
+    max_fan_in: int = 64,
+) -> Iterator[dict[str, str]]:
+    """Sort CSV rows in bounded memory: sorted runs of `chunk_size` rows
+    are spilled to temporary CSV files, which are then merged (at most
+    `max_fan_in` at a time). Rows that fit in one chunk are sorted in
+    memory. The sort is stable.
+
+    Args:
+        rows (Iterable[dict[str, str]]): The rows, e.g. a csv.DictReader.
+        key (Callable[[dict[str, str]], Any]): The sort key of a row.
+        fieldnames (Sequence[str]): The rows' columns.
+        chunk_size (int): How many rows to sort in memory at a time.
+            Defaults to 100_000.
+        tmp_dir (str | Path | None): Where to create the temporary files.
+            Defaults to the system's temporary directory.
+        max_fan_in (int): How many runs to merge at once. Defaults to 64.
+
+    Yields:
+        dict[str, str]: The sorted rows.
+    """
+    rows = iter(rows)
+    first = sorted(islice(rows, chunk_size), key=key)
+    if len(first) < chunk_size:
+        yield from first
+        return
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as tmp:
+        runs: list[Path] = []
+        run_numbers = count()
+
+        def new_run_path() -> Path:
+            return Path(tmp) / f"run{next(run_numbers)}.csv"
+
+        runs.append(_write_chunk(first, fieldnames, new_run_path()))
+        del first
+        while chunk := sorted(  # pylint: disable=while-used
+            islice(rows, chunk_size), key=key
+        ):
+            runs.append(_write_chunk(chunk, fieldnames, new_run_path()))
+        del chunk
+
+        runs = _merge_runs(runs, key, fieldnames, max_fan_in, new_run_path)
+        yield from heapq.merge(*(_read_chunk(run) for run in runs), key=key)
@@ -0,0 +1,94 @@
+"""This file contains advisory file locks, for writers."""
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+@contextmanager
+def locked_fd(fd: int) -> Iterator[int]:
+    """Hold an exclusive advisory lock (flock) on an open file. Other
+    writers taking the lock wait for it. Where flock isn't available
+    (Windows), the file isn't locked.
+
+    Args:
+        fd (int): The file descriptor.
+
+    Yields:
+        int: The file descriptor.
+    """
+    if fcntl is None:  # pragma: no cover - Windows
+        yield fd
+        return
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        yield fd
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+@contextmanager
+def locked_file(
+    path: str | Path, mode: str = "a", buffering: int = -1
+) -> Iterator[IO[str]]:
+    """Open a text file, holding an exclusive advisory lock on it (see
+    `locked_fd`) until it's closed.
+
+    Args:
+        path (str | Path): The file.
+        mode (str): The mode to open it in. Defaults to "a".
+        buffering (int): As for `open`. Defaults to -1 (the default
+            buffer size).
+
+    Yields:
+        IO[str]: The open file.
+    """
+    with (
+        open(
+            path, mode, buffering=buffering, newline="", encoding="utf-8"
+        ) as f,
+        locked_fd(f.fileno()),
+    ):
+        try:
+            yield f
+        finally:
+            f.flush()  # Before the lock is released.
+
+
+def append_locked(path: str | Path, data: bytes, align: int = 0) -> int:
+    """Append bytes to a file with a single write to an O_APPEND file
+    descriptor, holding the file's lock (see `locked_fd`), so concurrent
+    appenders' writes don't interleave, and don't land inside a batch
+    written under the lock.
+
+    Args:
+        path (str | Path): The file (created if missing).
+        data (bytes): The bytes to append.
+        align (int): If given, the size of the file's fixed-width records:
+            a partial record at its end (e.g., from an interrupted write)
+            is truncated before appending. Defaults to 0 (no records).
+
+    Returns:
+        int: The number of bytes truncated.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+    torn = 0
+    try:
+        with locked_fd(fd):
+            if align and (torn := os.fstat(fd).st_size % align):
+                os.ftruncate(fd, os.fstat(fd).st_size - torn)
+            written = os.write(fd, data)
+            # Regular files are written in full, barring errors like a
+            # full disk, but just in case:
+            while written < len(data):  # pylint: disable=while-used
+                written += os.write(fd, data[written:])
+    finally:
+        os.close(fd)
+    return torn
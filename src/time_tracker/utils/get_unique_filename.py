@@ -1,5 +1,6 @@
 """This file contains a function to get unique filenames."""
 
+import os
 import re
 from pathlib import Path
 
@@ -10,9 +11,18 @@ def get_unique_filename(
     out_file: str | Path,
     logger_filename: str | Path | None = None,
     verbosity: int = 0,
+    claim: bool = False,
 ) -> Path:
     """Get a unique filename.
 
+    By default, the filename is checked and its "(n)" suffix incremented
+    until a free name is found, one stat call at a time. With `claim`,
+    the directory is instead scanned once for the highest existing
+    suffix, and the next name is created atomically (retrying on
+    collision), which is faster with many existing versions and safe
+    against concurrent callers. The returned file then exists (empty),
+    and belongs to the caller, which should overwrite it.
+
     Args:
         out_file (str | Path): Initial filename.
         logger_filename (str | Path | None): Filename (and path)
@@ -24,6 +34,9 @@ def get_unique_filename(
         verbosity (int): How much and what level of logging to include.
             Higher values indicates more logging. Defaults to 0
             (warnings).
+        claim (bool): Whether to scan the directory once and atomically
+            create the file (see above). Unlike the default mode, this
+            never fills gaps in the existing numbering. Defaults to False.
 
     Returns:
         Path: The unique output filename.
@@ -38,6 +51,14 @@ def get_unique_filename(
         str(out_file),
         category=logger.debugLevels.TRACE,
     )
+    if claim:
+        out_file = claim_unique_filename(out_file)
+        logger.debug_with_category(
+            "Claimed output filename: %s",
+            str(out_file),
+            category=logger.debugLevels.TRACE,
+        )
+        return out_file
 
     while out_file.exists():  # pylint: disable=while-used
         logger.debug_with_category(
@@ -66,3 +87,47 @@ def get_unique_filename(
 
     # return str(out_file) if return_string else out_file
     return out_file
+
+
+def _split_numbered_stem(stem: str) -> tuple[str, int | None]:
+    """Split a stem like "name (3)" into ("name", 3)."""
+    if match := re.fullmatch(r"(.*?) \((\d+)\)", stem):
+        return match.group(1), int(match.group(2))
+    return stem, None
+
+
+def claim_unique_filename(out_file: Path) -> Path:
+    """Atomically create the first free version of a filename that's
+    newer than all existing versions in its directory (see
+    `get_unique_filename`)."""
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+    base_name, number = _split_numbered_stem(out_file.stem)
+    suffix = out_file.suffix
+
+    # Find the highest existing number (0 for the unnumbered file):
+    pattern = re.compile(
+        rf"{re.escape(base_name)}(?: \((\d+)\))?{re.escape(suffix)}"
+    )
+    highest = -1
+    with os.scandir(out_file.parent) as entries:
+        for entry in entries:
+            if match := pattern.fullmatch(entry.name):
+                highest = max(highest, int(match.group(1) or 0))
+
+    # The requested name itself is fine if nothing newer exists:
+    number = number or 0
+    if number <= highest:
+        number = highest + 1
+    while True:  # pylint: disable=while-used
+        candidate = out_file.with_name(
+            f"{base_name} ({number}){suffix}" if number else base_name + suffix
+        )
+        try:
+            fd = os.open(
+                candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666
+            )
+        except FileExistsError:  # Claimed by someone else meanwhile.
+            number += 1
+            continue
+        os.close(fd)
+        return candidate
@@ -0,0 +1,92 @@
+"""This file contains functions to precompile a LaTeX preamble
+into a reusable pdflatex format file."""
+
+import hashlib
+import os
+import subprocess
+from pathlib import Path
+
+from .file_lock import locked_file
+
+BEGIN_DOCUMENT = r"\begin{document}"
+FORMAT_PREFIX = "preamble-"
+# Not matched by FORMAT_PREFIX, so stale format cleanup keeps it:
+FORMAT_LOCK_FILENAME = ".preamble.lock"
+
+
+def split_preamble(tex: str) -> tuple[str, str]:
+    """Split LaTeX source into its preamble and its document body.
+
+    Args:
+        tex (str): The full LaTeX source.
+
+    Returns:
+        tuple[str, str]: The preamble (everything before
+            \\begin{document}) and the body (everything from
+            \\begin{document} on).
+    """
+    if (idx := tex.find(BEGIN_DOCUMENT)) == -1:
+        raise ValueError(f"No {BEGIN_DOCUMENT} found in LaTeX source.")
+    return tex[:idx], tex[idx:]
+
+
+def get_format_name(preamble: str) -> str:
+    """Get the format name for a preamble, keyed by its contents."""
+    digest = hashlib.sha256(preamble.encode("utf8")).hexdigest()[:16]
+    return f"{FORMAT_PREFIX}{digest}"
+
+
+def _build_format(preamble: str, directory: Path, name: str):
+    """Build the format `name` from a preamble with `pdflatex -ini`, under
+    a temporary job name, then move it into place atomically, so pdflatex
+    never loads a partly written format."""
+    src = directory / f"{name}.tex"
+    src.write_text(preamble + "\\dump\n", encoding="utf8")
+    jobname = f"{name}.{os.getpid()}"
+    subprocess.run(
+        [
+            "pdflatex",
+            "-ini",
+            "-interaction=nonstopmode",
+            "-shell-escape",
+            f"-jobname={jobname}",
+            "&pdflatex",
+            src.name,
+        ],
+        cwd=directory,
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    os.replace(directory / f"{jobname}.fmt", directory / f"{name}.fmt")
+
+
+def ensure_preamble_format(preamble: str, directory: Path) -> str:
+    """Build a pdflatex format file from a preamble, if not already built.
+
+    The format is named after a hash of the preamble, so a changed
+    preamble automatically gets rebuilt. Stale formats from previous
+    preambles in the same directory are removed, once the new one is in
+    place. Builds hold a lock file in the directory (see `locked_file`),
+    so concurrent runs don't build the same format twice.
+
+    Args:
+        preamble (str): The LaTeX preamble to dump into the format.
+        directory (Path): Directory in which to build and keep the
+            format file. This should be the directory pdflatex is run in.
+
+    Returns:
+        str: The format name, to pass to pdflatex as `-fmt=<name>`.
+    """
+    name = get_format_name(preamble)
+    if (fmt := directory / f"{name}.fmt").exists():
+        return name
+    with locked_file(directory / FORMAT_LOCK_FILENAME):
+        if fmt.exists():  # Built by another run while waiting.
+            return name
+        _build_format(preamble, directory, name)
+        for stale in directory.glob(f"{FORMAT_PREFIX}*"):
+            if stale.stem != name:
+                stale.unlink(missing_ok=True)
+    return name
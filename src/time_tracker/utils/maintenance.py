@@ -0,0 +1,315 @@
+"""This file contains the maintenance of entry files: validating entries
+for importing, sorting and deduplicating them (fixing overlaps), and
+normalizing their tasks, in bounded memory."""
+
+import os
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import islice
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
+
+from time_tracker.constants import HEADERS, ColumnHeaders
+
+from .external_sort import external_sort
+from .task_parsing import normalize_task_column, normalize_tasks
+
+START = ColumnHeaders.START.value
+END = ColumnHeaders.END.value
+DURATION = ColumnHeaders.DURATION.value
+TASK = ColumnHeaders.TASK.value
+
+_sort_columns = itemgetter(START, END, TASK)
+
+
+def entry_sort_key(entry: Mapping[str, str]) -> tuple[datetime, str, str]:
+    """Sort entries by start, then end and task (so that duplicates end up
+    next to each other)."""
+    start, end, task = _sort_columns(entry)
+    return (datetime.fromisoformat(start), end or "", task or "")
+
+
+def validate_entry(
+    entry: Mapping[str, Any], normalize_task: bool = True
+) -> dict[str, str]:
+    """Validate and normalize an entry for importing. Columns other than
+    HEADERS are dropped, the duration is recomputed from the start and end
+    (which may be empty, for a running timer), and the tasks are
+    normalized.
+
+    Args:
+        entry (Mapping[str, Any]): The entry, by column name.
+        normalize_task (bool): Whether to normalize the tasks (rather than
+            leave that to the caller, e.g. for a whole column). Defaults to
+            True.
+
+    Returns:
+        dict[str, str]: The normalized entry.
+
+    Raises:
+        ValueError: If the start or end isn't an ISO date(time), or the end
+            is before the start.
+    """
+    start_str = str(entry.get(START) or "")
+    end_str = str(entry.get(END) or "")
+    if not start_str:
+        raise ValueError("Missing start.")
+    start = datetime.fromisoformat(start_str)
+    duration = ""
+    if end_str:
+        if (end := datetime.fromisoformat(end_str)) < start:
+            raise ValueError(f"End {end_str} is before start {start_str}.")
+        duration = f"{(end - start).total_seconds():.2f}"
+    task = str(entry.get(TASK) or "")
+    return {
+        START: start_str,
+        END: end_str,
+        DURATION: duration,
+        TASK: normalize_tasks(task) if normalize_task else task,
+    }
+
+
+def validate_entries(
+    entries: Iterable[Mapping[str, Any]], max_errors: int = 20
+) -> list[dict[str, str]]:
+    """Validate a batch of entries (see `validate_entry`), without
+    normalizing their tasks. Only the last entry may be open (without an
+    end).
+
+    Args:
+        entries (Iterable[Mapping[str, Any]]): The entries, by column name.
+        max_errors (int): How many invalid entries to describe in the
+            error. Defaults to 20.
+
+    Returns:
+        list[dict[str, str]]: The validated entries.
+
+    Raises:
+        ValueError: If any entries are invalid, listing them (by their
+            1-based index in `entries`).
+    """
+    valid: list[dict[str, str]] = []
+    errors: list[str] = []
+    open_entry = 0  # The index of the last open entry, if any.
+    for i, entry in enumerate(entries, start=1):
+        if open_entry:
+            errors.append(
+                f"Entry {open_entry}: Missing end (only the last entry can "
+                "be open)."
+            )
+            open_entry = 0
+        try:
+            valid.append(validate_entry(entry, normalize_task=False))
+        except (ValueError, TypeError) as e:
+            errors.append(f"Entry {i}: {e}")
+            continue
+        if not valid[-1][END]:
+            open_entry = i
+    if errors:
+        more = len(errors) - max_errors
+        raise ValueError(
+            f"{len(errors)} invalid entries, nothing imported:\n"
+            + "\n".join(errors[:max_errors])
+            + (f"\n... and {more} more." if more > 0 else "")
+        )
+    return valid
+
+
+@contextmanager
+def replacing_file(path: Path, label: str) -> Iterator[Path]:
+    """A temporary file next to `path` (named after `label`), to write its
+    new contents to, which then replaces it atomically, unless the block
+    raises.
+
+    Args:
+        path (Path): The file to replace.
+        label (str): The temporary file's suffix, e.g. "sorting".
+
+    Yields:
+        Path: The temporary file.
+    """
+    tmp_path = path.with_name(f".{path.name}.{label}")
+    try:  # pylint: disable=too-many-try-statements
+        yield tmp_path
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def new_sort_report() -> dict[str, Any]:
+    """An empty report of sorting entries (see `sort_entry_rows`)."""
+    report: dict[str, Any] = dict.fromkeys(
+        (
+            "rows_read",
+            "rows_written",
+            "duplicates",
+            "overlaps",
+            "overlaps_fixed",
+        ),
+        0,
+    )
+    report["was_sorted"] = True
+    report["overlap_examples"] = []
+    return report
+
+
+def check_order(
+    rows: Iterable[dict[str, str]], report: dict[str, Any]
+) -> Iterator[dict[str, str]]:
+    """Pass rows through, counting them (`rows_read`) and checking whether
+    they're already sorted (`was_sorted`) in the report."""
+    previous = None
+    for row in rows:
+        report["rows_read"] += 1
+        key = entry_sort_key(row)
+        if previous is not None and key < previous:
+            report["was_sorted"] = False
+        previous = key
+        yield row
+
+
+def trim_start(
+    row: dict[str, str], start: datetime, end: datetime
+) -> dict[str, str] | None:
+    """Start an entry later (at `start`), recomputing its duration, or
+    drop it (None) if that leaves nothing of it."""
+    if end <= start:
+        return None
+    return row | {
+        START: start.isoformat(),
+        DURATION: f"{(end - start).total_seconds():.2f}",
+    }
+
+
+def clean_sorted_rows(
+    rows: Iterable[dict[str, str]],
+    report: dict[str, Any],
+    fix_overlaps: bool = False,
+    max_examples: int = 10,
+) -> Iterator[dict[str, str]]:
+    """Drop duplicates from sorted rows, and report (or fix) rows that
+    overlap the previous ones. Overlaps are fixed by starting the later
+    row when the earlier one ends (and dropping it if that leaves nothing
+    of it, see `trim_start`). Open rows (without an end) are kept, but
+    don't count as overlapping anything.
+
+    Args:
+        rows (Iterable[dict[str, str]]): The rows, sorted by
+            `entry_sort_key`.
+        report (dict[str, Any]): The report to count in (see
+            `new_sort_report`).
+        fix_overlaps (bool): Whether to fix overlapping rows, rather than
+            just report them. Defaults to False.
+        max_examples (int): How many overlaps to describe in the report.
+            Defaults to 10.
+
+    Yields:
+        dict[str, str]: The cleaned rows.
+    """
+    previous = None
+    previous_end: datetime | None = None
+    for row in rows:
+        if row == previous:
+            report["duplicates"] += 1
+            continue
+        previous = cleaned = row
+        if row[END]:
+            end = datetime.fromisoformat(row[END])
+            if (
+                previous_end is not None
+                and datetime.fromisoformat(row[START]) < previous_end
+            ):
+                report["overlaps"] += 1
+                if len(report["overlap_examples"]) < max_examples:
+                    report["overlap_examples"].append(
+                        f"{row[START]} - {row[END]} starts before "
+                        f"{previous_end.isoformat()}"
+                    )
+                if fix_overlaps:
+                    report["overlaps_fixed"] += 1
+                    cleaned = trim_start(row, previous_end, end)
+            previous_end = max(end, previous_end or end)
+        if cleaned is not None:
+            report["rows_written"] += 1
+            yield cleaned
+
+
+def sort_entry_rows(  # pylint: disable=too-many-arguments
+    rows: Iterable[dict[str, str]],
+    report: dict[str, Any],
+    *,
+    fix_overlaps: bool = False,
+    chunk_size: int = 100_000,
+    max_examples: int = 10,
+    tmp_dir: str | Path | None = None,
+) -> Iterator[dict[str, str]]:
+    """Sort entry rows chronologically in bounded memory (see
+    `external_sort`), dropping duplicates and reporting (or fixing)
+    overlaps (see `clean_sorted_rows`).
+
+    Args:
+        rows (Iterable[dict[str, str]]): The rows, e.g. a csv.DictReader.
+        report (dict[str, Any]): The report to count in (see
+            `new_sort_report`), complete once the rows are consumed.
+        fix_overlaps (bool): Whether to fix overlapping rows. Defaults to
+            False.
+        chunk_size (int): How many rows to sort in memory at a time.
+            Defaults to 100_000.
+        max_examples (int): How many overlaps to describe in the report.
+            Defaults to 10.
+        tmp_dir (str | Path | None): Where to spill sorted runs. Defaults
+            to the system's temporary directory.
+
+    Yields:
+        dict[str, str]: The sorted, cleaned rows.
+
+    Raises:
+        ValueError: If a row's start or end isn't an ISO date(time).
+    """
+    yield from clean_sorted_rows(
+        external_sort(
+            check_order(rows, report),
+            entry_sort_key,
+            HEADERS,
+            chunk_size=chunk_size,
+            tmp_dir=tmp_dir,
+        ),
+        report,
+        fix_overlaps=fix_overlaps,
+        max_examples=max_examples,
+    )
+
+
+def normalize_rows(
+    rows: Iterable[dict[str, str]],
+    counts: dict[str, int],
+    chunk_size: int = 100_000,
+) -> Iterator[dict[str, str]]:
+    """Normalize the tasks of rows (see normalize_task_column), a chunk of
+    rows at a time.
+
+    Args:
+        rows (Iterable[dict[str, str]]): The rows.
+        counts (dict[str, int]): Where to count the rows "read", and the
+            ones whose tasks "changed".
+        chunk_size (int): How many rows to normalize at a time. Defaults
+            to 100_000.
+
+    Yields:
+        dict[str, str]: The normalized rows.
+    """
+    rows = iter(rows)
+    while chunk := list(  # pylint: disable=while-used
+        islice(rows, chunk_size)
+    ):
+        tasks = [row.get(TASK) or "" for row in chunk]
+        for row, task, normalized in zip(
+            chunk, tasks, normalize_task_column(tasks)
+        ):
+            if normalized != task:
+                counts["changed"] += 1
+                row[TASK] = normalized
+            yield row
+        counts["read"] += len(chunk)
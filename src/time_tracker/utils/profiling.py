@@ -0,0 +1,49 @@
+"""This file contains a helper for profiling a call with cProfile."""
+
+import cProfile
+import io
+import logging
+import pstats
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar
+
+ReturnT = TypeVar("ReturnT")
+
+
+def profile_call(
+    func: Callable[[], ReturnT],
+    logger: logging.Logger,
+    prof_path: str | Path,
+    top: int = 20,
+) -> ReturnT:
+    """Call `func` under cProfile, save the stats to `prof_path` (for
+    e.g. snakeviz or `python -m pstats`), and log the `top` entries by
+    cumulative time.
+
+    Args:
+        func (Callable[[], ReturnT]): The function to profile.
+        logger (logging.Logger): Logger to write the summary to.
+        prof_path (str | Path): The .prof file to write.
+        top (int): How many entries to include in the summary.
+            Defaults to 20.
+
+    Returns:
+        ReturnT: What `func` returned.
+    """
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func)
+    finally:
+        prof_path = Path(prof_path)
+        prof_path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(prof_path)
+        summary = io.StringIO()
+        stats = pstats.Stats(profiler, stream=summary)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+        logger.info(
+            "Profile saved to %s. Top %d by cumulative time:\n%s",
+            prof_path,
+            top,
+            summary.getvalue(),
+        )
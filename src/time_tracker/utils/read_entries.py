@@ -0,0 +1,40 @@
+"""This file contains a reader for files of time entries to import."""
+
+import csv
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson", ".json")
+
+
+def read_entries(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Read time entries from a CSV file with a header row (like the
+    tracker's own files) or a JSON lines file (one object per line),
+    lazily.
+
+    Args:
+        path (str | Path): The file. Files ending in .jsonl, .ndjson or
+            .json are read as JSON lines, others as CSV.
+
+    Yields:
+        dict[str, Any]: The entries, by column name.
+    """
+    path = Path(path)
+    with path.open("r", newline="", encoding="utf-8") as f:
+        if path.suffix.lower() not in JSON_LINES_SUFFIXES:
+            yield from csv.DictReader(f)
+            return
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_number}: {e}") from e
+            if not isinstance(entry, dict):
+                raise ValueError(
+                    f"{path}:{line_number}: Expected an object per line."
+                )
+            yield entry
@@ -3,31 +3,188 @@
 import ast
 import dis
 import inspect
+import os
 import textwrap
+import weakref
 from collections import defaultdict
-from typing import Any, get_type_hints
+from collections.abc import Callable
+from typing import Any, NamedTuple, get_type_hints
 
 from time_tracker.config import settings
 
 DEBUG_PRINTS = settings.debug_prints
 LEFTOVERS = "leftovers"
 
+# Introspection results, cached per function and per class. Functions
+# that can't be weakly referenced (e.g. object.__init__) are builtins,
+# which live forever anyway, so they're cached in plain dicts.
+_function_caches: dict[str, weakref.WeakKeyDictionary] = defaultdict(
+    weakref.WeakKeyDictionary
+)
+_builtin_function_caches: dict[str, dict] = defaultdict(dict)
+# cls -> (fingerprint of its MRO's __init__s, {key: cached value}):
+_class_caches: weakref.WeakKeyDictionary[type, tuple[tuple, dict]] = (
+    weakref.WeakKeyDictionary()
+)
+# Source file -> ((mtime_ns, size), parsed module), for uses_super:
+_source_ast_cache: dict[str, tuple[tuple[int, int], ast.Module]] = {}
+
+
+def cached_for_function(name: str, func: Callable, compute: Callable) -> Any:
+    """Get `compute(func)`, computing it only once per function.
+
+    Args:
+        name (str): Name of the cache (one per kind of computation).
+        func (Callable): The function (e.g., an __init__).
+        compute (Callable): Computes the value from the function.
+
+    Returns:
+        Any: The (cached) value.
+    """
+    try:
+        cache: Any = _function_caches[name]
+        return cache[func]
+    except KeyError:
+        value = cache[func] = compute(func)
+        return value
+    except TypeError:  # Not weakly referenceable.
+        cache = _builtin_function_caches[name]
+        if func not in cache:
+            cache[func] = compute(func)
+        return cache[func]
+
+
+def _weak_or_strong_ref(obj: Any) -> Any:
+    """A weak reference to `obj` if possible, otherwise `obj` itself."""
+    if obj is None:
+        return None
+    try:
+        return weakref.ref(obj)
+    except TypeError:
+        return obj
+
+
+def _init_fingerprint(cls: type) -> tuple:
+    """Identify the MRO of `cls` and its classes' own __init__ methods,
+    so cached results can be dropped when either changes."""
+    return tuple(
+        (weakref.ref(base), _weak_or_strong_ref(base.__dict__.get("__init__")))
+        for base in cls.__mro__
+    )
+
+
+def cached_for_class(cls: type, key: Any, compute: Callable[[], Any]) -> Any:
+    """Get `compute()`, computing it only once per class (and key), or
+    again if the class's MRO or any __init__ in it has been replaced.
+
+    Args:
+        cls (type): The class the value is computed for.
+        key (Any): Identifies the computation (and its other arguments).
+        compute (Callable[[], Any]): Computes the value.
+
+    Returns:
+        Any: The (cached) value.
+    """
+    fingerprint = _init_fingerprint(cls)
+    entry = _class_caches.get(cls)
+    if entry is None or entry[0] != fingerprint:
+        entry = _class_caches[cls] = (fingerprint, {})
+    if key not in entry[1]:
+        entry[1][key] = compute()
+    return entry[1][key]
+
+
+def clear_introspection_caches():
+    """Clear all cached signatures, routing plans and the like."""
+    _function_caches.clear()
+    _builtin_function_caches.clear()
+    _class_caches.clear()
+    _source_ast_cache.clear()
+
+
+def get_signature(func: Callable) -> inspect.Signature:
+    """Get the (cached) signature of a function."""
+    return cached_for_function("signature", func, inspect.signature)
+
+
+def get_init_type_hints(func: Callable) -> dict[str, Any]:
+    """Get the (cached) type hints of a function."""
+    return cached_for_function("type_hints", func, get_type_hints)
+
+
+class InitRoute(NamedTuple):
+    """How to route arguments to one base class's __init__."""
+
+    base: type
+    # Parameters that can be passed positionally, in order:
+    positional: tuple[str, ...]
+    # Parameters that can be passed by keyword:
+    keyword: frozenset[str]
+    accepts_var_keyword: bool
+    # Keyword parameters of the base and its ancestors (used if
+    # accepts_var_keyword):
+    accepted_keys: frozenset[str]
+
+
+def get_init_routing_plan(
+    cls: type, stop_at: type = object
+) -> tuple[InitRoute, ...]:
+    """Get the (cached) routing plan of the direct bases of `cls` that
+    define their own __init__, as used by
+    `split_args_for_inits_strict_kwargs`."""
+
+    def compute():
+        plan = []
+        for base in cls.__bases__:
+            if base is stop_at:
+                break
+            if not (init := base.__dict__.get("__init__", None)):
+                continue
+            params = list(get_signature(init).parameters.values())[1:]
+            plan.append(
+                InitRoute(
+                    base=base,
+                    positional=tuple(
+                        p.name
+                        for p in params
+                        if p.kind
+                        in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+                    ),
+                    keyword=frozenset(
+                        p.name
+                        for p in params
+                        if p.kind in (p.KEYWORD_ONLY, p.POSITIONAL_OR_KEYWORD)
+                    ),
+                    accepts_var_keyword=any(
+                        p.kind == p.VAR_KEYWORD for p in params
+                    ),
+                    accepted_keys=frozenset(collect_init_param_names(base)),
+                )
+            )
+        return tuple(plan)
+
+    return cached_for_class(cls, ("routing_plan", stop_at), compute)
+
 
 def collect_init_param_names(cls: type) -> set:
     """Collect all __init__ param names (excluding 'self') from cls and ancestors."""
-    names: set[str] = set()
-    for base in cls.__mro__:
-        if base is object:
-            break
-        if (init := base.__dict__.get("__init__", None)) is not None:
-            sig = inspect.signature(init)
-            params = list(sig.parameters.values())[1:]  # skip 'self'
-            names.update(
-                p.name
-                for p in params
-                if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
-            )
-    return names
+
+    def compute():
+        names: set[str] = set()
+        for base in cls.__mro__:
+            if base is object:
+                break
+            if (init := base.__dict__.get("__init__", None)) is not None:
+                sig = get_signature(init)
+                params = list(sig.parameters.values())[1:]  # skip 'self'
+                names.update(
+                    p.name
+                    for p in params
+                    if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+                )
+        return frozenset(names)
+
+    return set(cached_for_class(cls, "init_param_names", compute))
 
 
 def split_args_for_inits_strict_kwargs(  # pylint: disable=too-many-locals,too-complex,too-many-branches,too-many-arguments
@@ -96,71 +253,39 @@ def split_args_for_inits_strict_kwargs(  # pylint: disable=too-many-locals,too-c
             }
         )
     )
-    param_cache = {}
-
-    # params_assigned_positionally = {}
-
     # for base in cls.__mro__[1:]:  # Skip the class itself
-    for base in cls.__bases__:  # Only look at the bases of this class.
-        # params_assigned_positionally[base] = []
-        if base is stop_at:
-            break
-        if not (init := base.__dict__.get("__init__", None)):
-            continue
-
-        sig = inspect.signature(init)
-        params = list(sig.parameters.values())[1:]
-
-        # accepts_var_positional = any(p.kind == p.VAR_POSITIONAL for p in params)
-        accepts_var_keyword = any(p.kind == p.VAR_KEYWORD for p in params)
+    # Only look at the bases of this class (see get_init_routing_plan):
+    for route in get_init_routing_plan(cls, stop_at):
+        base = route.base
+        assigned_positionally: list[str] = result[base][  # type: ignore[assignment]
+            "args_assigned_positionally"
+        ]
 
         # Bind args
         bound_args = []
         bound_kwargs = {}
         # 1. Route positional args:
-        param_iter = (
-            p
-            for p in params
-            if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
-        )
-        for p in param_iter:
+        for name in route.positional:
             if remaining_args:
                 bound_args.append(remaining_args.pop(0))
-                # params_assigned_positionally[base].append(p.name)
-                result[base]["args_assigned_positionally"].append(  # type: ignore[union-attr]
-                    p.name
-                )
-            elif p.name in remaining_kwargs:
+                assigned_positionally.append(name)
+            elif name in remaining_kwargs:
                 # There's an arg necessary, but it's not in args, so check kwargs:
-                bound_kwargs[p.name] = remaining_kwargs.pop(p.name)
-                # bound_args.append(remaining_kwargs.pop(p.name))
+                bound_kwargs[name] = remaining_kwargs.pop(name)
             else:
                 break
         # 2. Route kwargs:
         # Bind kwargs explicitly listed in this __init__:
-        keyword_params = {
-            p.name
-            for p in params
-            if p.kind in (p.KEYWORD_ONLY, p.POSITIONAL_OR_KEYWORD)
-        }
         for key in list(remaining_kwargs):
-            if (
-                key in keyword_params
-                # and key not in params_assigned_positionally[base]
-                and key not in result[base]["args_assigned_positionally"]
-            ):
+            if key in route.keyword and key not in assigned_positionally:
                 bound_kwargs[key] = remaining_kwargs.pop(key)
 
         # If accepts **kwargs, only pass keys that base class (or its ancestors) can use:
-        if accepts_var_keyword:
-            if base not in param_cache:
-                param_cache[base] = collect_init_param_names(base)
-            accepted_keys = param_cache[base]
+        if route.accepts_var_keyword:
             for key in list(remaining_kwargs):
                 if (
-                    key in accepted_keys
-                    # and key not in params_assigned_positionally[base]
-                    and key not in result[base]["args_assigned_positionally"]
+                    key in route.accepted_keys
+                    and key not in assigned_positionally
                 ):
                     bound_kwargs[key] = remaining_kwargs.pop(key)
 
@@ -194,21 +319,26 @@ def split_args_for_inits_strict_kwargs(  # pylint: disable=too-many-locals,too-c
 
 def get_mro_kwarg_info(cls):
     """Get kwarg ifno from the MRO."""
-    mro = cls.mro()
-    paraminfo = {}
-    for base in mro:
-        sig = inspect.signature(base.__init__)
-        accepted = {
-            name
-            for name, param in sig.parameters.items()
-            if name != "self"  # pylint: disable=magic-value-comparison
-            and param.kind in (param.KEYWORD_ONLY, param.POSITIONAL_OR_KEYWORD)
-        }
-        accepts_var_kw = any(
-            p.kind == p.VAR_KEYWORD for p in sig.parameters.values()
-        )
-        paraminfo[base] = (accepted, accepts_var_kw)
-    return paraminfo
+
+    def compute():
+        mro = cls.mro()
+        paraminfo = {}
+        for base in mro:
+            sig = get_signature(base.__init__)
+            accepted = {
+                name
+                for name, param in sig.parameters.items()
+                if name != "self"  # pylint: disable=magic-value-comparison
+                and param.kind
+                in (param.KEYWORD_ONLY, param.POSITIONAL_OR_KEYWORD)
+            }
+            accepts_var_kw = any(
+                p.kind == p.VAR_KEYWORD for p in sig.parameters.values()
+            )
+            paraminfo[base] = (frozenset(accepted), accepts_var_kw)
+        return paraminfo
+
+    return dict(cached_for_class(cls, "mro_kwarg_info", compute))
 
 
 def apply_type_heuristic_routing(
@@ -221,7 +351,7 @@ def apply_type_heuristic_routing(
         # for base, (accepted, _) in paraminfo.items():
         while current != stop_at:  # pylint: disable=while-used
             (accepted, _) = paraminfo.get(current, (set(), False))
-            type_hints = get_type_hints(base.__init__)
+            type_hints = get_init_type_hints(base.__init__)
             for name, val in list(remaining_kwargs.items()):
                 if name in accepted and name in type_hints:
                     hint = type_hints[name]
@@ -232,38 +362,69 @@ def apply_type_heuristic_routing(
             current = current.__base__
 
 
-def apply_dis_bytecode_routing(  # pylint: disable=too-many-nested-blocks
-    cls, remaining_kwargs, routing, stop_at=object
-):
+def get_string_constants(func: Callable) -> frozenset[str]:
+    """Get the (cached) set of string constants a function's bytecode
+    loads, e.g. the keys of `kwargs.get("key")` calls. Functions that
+    can't be disassembled (e.g. builtins) have none."""
+
+    def compute(func):
+        try:
+            return frozenset(
+                instr.argval
+                for instr in dis.get_instructions(func)
+                if instr.opname  # pylint: disable=magic-value-comparison
+                == "LOAD_CONST"
+                and isinstance(instr.argval, str)
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            return frozenset()
+
+    return cached_for_function("string_constants", func, compute)
+
+
+def get_dis_routing_plan(
+    cls: type, stop_at: type = object
+) -> tuple[tuple[type, frozenset[str]], ...]:
+    """Get the (cached) string constants referenced by the __init__ of
+    each direct base of `cls` or any of its ancestors (up to `stop_at`),
+    as used by `apply_dis_bytecode_routing`."""
+
+    def compute():
+        plan = []
+        for base in cls.__bases__:
+            constants: set[str] = set()
+            current = base
+            # pylint: disable-next=while-used
+            while current is not None and current != stop_at:
+                if init := current.__dict__.get("__init__"):
+                    constants |= get_string_constants(init)
+                current = current.__base__
+            plan.append((base, frozenset(constants)))
+        return tuple(plan)
+
+    return cached_for_class(cls, ("dis_routing_plan", stop_at), compute)
+
+
+def apply_dis_bytecode_routing(cls, remaining_kwargs, routing, stop_at=object):
     """Route kwargs if init function internally uses them."""
-    # paraminfo = get_mro_kwarg_info(cls)
-    # for base in paraminfo:
-    for base in cls.__bases__:
-        current = base
-        while current != stop_at:  # pylint: disable=while-used
-            try:  # pylint: disable=too-many-try-statements
-                func = base.__init__
-                # code = func.__code__
-                for instr in dis.get_instructions(func):
-                    if (
-                        instr.opname  # pylint: disable=magic-value-comparison
-                        == "LOAD_CONST"
-                        and isinstance(instr.argval, str)
-                    ):
-                        if (key := instr.argval) in remaining_kwargs:
-                            routing[base]["kwargs"][key] = (
-                                remaining_kwargs.pop(key)
-                            )
-            except Exception:  # pylint: disable=broad-exception-caught
-                # continue
-                pass
-            current = current.__base__
+    for base, constants in get_dis_routing_plan(cls, stop_at):
+        for key in [key for key in remaining_kwargs if key in constants]:
+            routing[base]["kwargs"][key] = remaining_kwargs.pop(key)
 
 
 def find_safe_kwargs_targets(cls):
     """For each direct base class of `cls`, follow its MRO path down and ensure all accept **kwargs.
     Return those safe to receive leftover kwargs.
     """
+    return set(
+        cached_for_class(
+            cls, "safe_kwargs_targets", lambda: _find_safe_kwargs_targets(cls)
+        )
+    )
+
+
+def _find_safe_kwargs_targets(cls):
+    """Uncached `find_safe_kwargs_targets`."""
     paraminfo = get_mro_kwarg_info(cls)
     safe_bases = set()
     for base in cls.__bases__:
@@ -283,7 +444,7 @@ def find_safe_kwargs_targets(cls):
             if DEBUG_PRINTS:
                 print("  --> Safe!")
             safe_bases.add(base)
-    return safe_bases
+    return frozenset(safe_bases)
 
 
 def share_missing_params_across_parents(
@@ -320,7 +481,7 @@ def share_missing_params_across_parents(
         current = parent
         while current != stop_at:  # pylint: disable=while-used
             if hasattr(current, "__init__"):
-                sig = inspect.signature(current.__init__)  # type: ignore[misc]
+                sig = get_signature(current.__init__)  # type: ignore[misc]
                 required_params.extend(
                     [
                         p.name
@@ -350,7 +511,7 @@ def share_missing_params_across_parents(
                     break
 
 
-def call_init_chain_respecting_super(  # pylint: disable=too-many-locals,too-complex
+def call_init_chain_respecting_super(
     self,
     cls: type,
     split: dict[type, dict[str, Any]],
@@ -397,6 +558,31 @@ def call_init_chain_respecting_super(  # pylint: disable=too-many-locals,too-com
     #         base.__init__(self, *args, **kwargs)  # type: ignore[misc] # pylint: disable=unnecessary-dunder-call
     #         called.add(base)
 
+    # Steps 3 and 4 (see plan_init_chain_calls):
+    for base, args, kwargs in plan_init_chain_calls(cls, split, skip_class):
+        if DEBUG_PRINTS:
+            print(
+                "[call_init_chain_respecting_super] Calling init of "
+                f"super-respecting class {base.__name__}"
+            )
+        # super(base, self).__init__(*super_args[base], **super_kwargs[base])
+        base.__init__(  # type: ignore[misc] # pylint: disable=unnecessary-dunder-call
+            self, *args, **kwargs
+        )
+
+
+def plan_init_chain_calls(
+    cls: type, split: dict[type, dict[str, Any]], skip_class=None
+) -> list[tuple[type, list, dict]]:
+    """Get the __init__ calls that `call_init_chain_respecting_super`
+    makes: one per chain of super-respecting classes (see
+    `find_super_chains`), starting at the chain's first class, with the
+    args and kwargs split to all of the chain's classes.
+
+    Returns:
+        list[tuple[type, list, dict]]: The class whose __init__ to call,
+            and the args and kwargs to call it with, in call order.
+    """
     # Step 3: Collect args and kwargs for super-respecting chain:
     # first_bases = []
     chains = find_super_chains(cls)
@@ -426,23 +612,16 @@ def call_init_chain_respecting_super(  # pylint: disable=too-many-locals,too-com
                 super_kwargs[base].update(split[link]["kwargs"])
 
     # Step 4: Begin super-respecting chain from first super-respecting class in MRO:
-    for base in first_bases:
-        if base in (skip_class,):
-            continue
-        if DEBUG_PRINTS:
-            print(
-                "[call_init_chain_respecting_super] Calling init of "
-                f"super-respecting class {base.__name__}"
-            )
-        # super(base, self).__init__(*super_args[base], **super_kwargs[base])
-        base.__init__(  # type: ignore[misc] # pylint: disable=unnecessary-dunder-call
-            self, *super_args[base], **super_kwargs[base]
-        )
+    return [
+        (base, super_args[base], super_kwargs[base])
+        for base in first_bases
+        if base not in (skip_class,)
+    ]
 
 
 def accepts_kwargs(cls) -> bool:
     """Determine whether a class accepts kwargs."""
-    sig = inspect.signature(cls.__init__)
+    sig = get_signature(cls.__init__)
     return any(p.kind == p.VAR_KEYWORD for p in sig.parameters.values())
 
 
@@ -476,8 +655,35 @@ def get_class_qualname(cls):
     return ".".join(parts)
 
 
+def parse_source_file(sourcefile: str) -> ast.Module:
+    """Parse a (dedented) source file, reusing the parsed module while
+    the file's mtime and size are unchanged."""
+    stat = os.stat(sourcefile)
+    key = (stat.st_mtime_ns, stat.st_size)
+    if (cached := _source_ast_cache.get(sourcefile)) and cached[0] == key:
+        return cached[1]
+    with open(sourcefile, "r", encoding="utf8") as f:
+        sourcecode = f.read()
+    module = ast.parse(textwrap.dedent(sourcecode))
+    _source_ast_cache[sourcefile] = (key, module)
+    return module
+
+
+def init_bytecode_uses_super(cls) -> bool:
+    """Determine whether a class's own __init__ looks up `super`, from its
+    bytecode (for when its source isn't available)."""
+    code = getattr(cls.__dict__.get("__init__"), "__code__", None)
+    return code is not None and "super" in code.co_names
+
+
 def uses_super(cls) -> bool:
-    """Determine whether a clss uses super."""
+    """Determine whether a clss uses super. The result is cached per
+    class (see `cached_for_class`)."""
+    return cached_for_class(cls, "uses_super", lambda: _uses_super(cls))
+
+
+def _uses_super(cls) -> bool:
+    """Uncached `uses_super`."""
     # if hasattr(cls, "__init__"):
     #     src = inspect.getsource(cls.__init__)
     #     if "super(" in src:  # pylint: disable=magic-value-comparison
@@ -485,13 +691,12 @@ def uses_super(cls) -> bool:
     # return False
     try:  # pylint: disable=too-many-try-statements,too-many-nested-blocks
         if (sourcefile := inspect.getsourcefile(cls)) is None:
-            return False
-
-        with open(sourcefile, "r", encoding="utf8") as f:
-            sourcecode = f.read()
-
-        sourcecode = textwrap.dedent(sourcecode)
-        module = ast.parse(sourcecode)
+            # E.g. .pyc-only installs:
+            return init_bytecode_uses_super(cls)
+        try:
+            module = parse_source_file(sourcefile)
+        except OSError:  # E.g. modules in zipapps.
+            return init_bytecode_uses_super(cls)
 
         fq_path = get_class_qualname(cls)
         if not (class_node := find_class_with_path(module, fq_path)):
@@ -519,6 +724,16 @@ def uses_super(cls) -> bool:
 
 def find_super_chains(cls, stop_at=object):
     """Find chains of super-respecting classes."""
+    chains = cached_for_class(
+        cls,
+        ("super_chains", stop_at),
+        lambda: _find_super_chains(cls, stop_at),
+    )
+    return [list(chain) for chain in chains]
+
+
+def _find_super_chains(cls, stop_at=object):
+    """Uncached `find_super_chains`."""
     mro = cls.mro()[1:]  # exclude cls itself
     chains = []
     current_chain = []
@@ -532,19 +747,28 @@ def find_super_chains(cls, stop_at=object):
             break
         current_chain.append(c)
         if not (accepts_kwargs(c) and uses_super(c)):
-            chains.append(list(current_chain))
+            chains.append(tuple(current_chain))
             current_chain = []
     if current_chain:
-        chains.append(current_chain)
-    return chains
+        chains.append(tuple(current_chain))
+    return tuple(chains)
 
 
-def _find_calling_class_from_init(instance):  # pylint: disable=too-complex
+def _find_calling_class_from_init(instance):
     """Examine classes in MRO of `instance` to find whose `__init__` contains
-    a direct call to `apply_split_inits`.
+    a direct call to `apply_split_inits` (or `apply_compiled_split_inits`).
     """
-    apply_split_inits_name = "apply_split_inits"
-    cls = type(instance)
+    return find_calling_class(type(instance))
+
+
+def find_calling_class(cls):  # pylint: disable=too-complex
+    """Examine classes in MRO of `cls` to find whose `__init__` contains
+    a direct call to `apply_split_inits` (or `apply_compiled_split_inits`).
+    """
+    apply_split_inits_names = {
+        "apply_split_inits",
+        "apply_compiled_split_inits",
+    }
     for base in cls.__mro__:
         if DEBUG_PRINTS:
             print(
@@ -568,7 +792,7 @@ def _find_calling_class_from_init(instance):  # pylint: disable=too-complex
             for instr in instructions:
                 if (
                     instr.opname in set(["LOAD_GLOBAL", "LOAD_METHOD"])
-                    and instr.argval == apply_split_inits_name
+                    and instr.argval in apply_split_inits_names
                 ):
                     return base
         except TypeError as e:
@@ -758,86 +982,3 @@ def apply_split_inits(self, cls=None, args=(), kwargs=None, skip_class=None):
             f"[apply_split_inits] Leftovers set to: {self._init_leftovers}"  # pylint: disable=protected-access
         )
     return self._init_leftovers  # pylint: disable=protected-access
-
-
-class SplitInitMixin:  # pylint: disable=too-few-public-methods
-    """A mixin class to be used for automatically splitting args across inits.
-
-    Note: this mixin class is not perfect, and will fail under certain circumstances:
-     - If some parent class has only positional arguments and comes before another
-       parent class with kwargs, the first parent may fail to initialize (whether or not it
-       calls super).
-    [The following parts ay not apply anymore, using the new apply_split_inits:
-     - Calling super().__init__() in apply_split_inits can skip the init methods
-       for the direct parent classes, so they won't get ininialized.
-     - Changing the calls in apply_split_inits from super().__init__() to
-       calling the init of each parent directly results in recursion.
-     - Changing the calls in apply_split_inits from super().__init__() to
-       calling the super().__init__() once also results in recursion.
-    The big dilema is we want
-     - To automate splitting and routing *args and **kwargs to multiple __init__ methods.
-     - To work cooperatively with super(), without requiring all third-party classes to cooperate.
-     - To avoid recursion and ensure each __init__ is called exactly once.
-     - To not manually walk the MRO, because that breaks super() semantics and third-party
-       expectations.
-    So we can't really have all three of the following at the same time, only two:
-     - Automatic argument splitting
-     - Compatibility with arbitrary third-party __init__ methods
-     - Full preservation of Python's super()]
-
-    Usage example:
-    class Child(SplitInitMixin, Parent1, Parent2):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-            # Use self._init_leftovers if needed
-    """
-
-    def __init__(self, *args, **kwargs):
-        """New init for the class."""
-        self._init_leftovers = apply_split_inits(
-            self, cls=type(self), args=args, kwargs=kwargs
-        )  # , skip_class=SplitInitMixin)
-
-
-def auto_split_init(cls):
-    """A decorator to be used for automatically splitting args across inits.
-
-    Note: this decorator is not perfect, and will fail under certain circumstances:
-     - If some parent class has only positional arguments and comes before another
-       parent class with kwargs, the first parent may fail to initialize (whether or not it
-       calls super).
-     - Calling super().__init__() in apply_split_inits can skip the init methods
-       for the direct parent classes, so they won't get ininialized.
-     - Changing the calls in apply_split_inits from super().__init__() to
-       calling the init of each parent directly results in recursion.
-     - Changing the calls in apply_split_inits from super().__init__() to
-       calling the super().__init__() once also results in recursion.
-    The big dilema is we want
-     - To automate splitting and routing *args and **kwargs to multiple __init__ methods.
-     - To work cooperatively with super(), without requiring all third-party classes to cooperate.
-     - To avoid recursion and ensure each __init__ is called exactly once.
-     - To not manually walk the MRO, because that breaks super() semantics and third-party
-       expectations.
-    So we can't really have all three of the following at the same time, only two:
-     - Automatic argument splitting
-     - Compatibility with arbitrary third-party __init__ methods
-     - Full preservation of Python's super()
-
-    Usage example:
-    @auto_split_init
-    class Child(Parent1, Parent2):
-        def __init__(self, *args, **kwargs):
-            # self._init_leftovers is available if needed
-            print("Child custom init logic")
-    """
-    original_init = cls.__init__
-
-    def wrapped_init(self, *args, **kwargs):
-        """New init for the wrapped class."""
-        leftovers = apply_split_inits(self, type(self), args, kwargs)
-        original_init(
-            self, *leftovers.get("args", []), **leftovers.get("kwargs", {})
-        )
-
-    cls.__init__ = wrapped_init
-    return cls
@@ -0,0 +1,113 @@
+"""This file contains the mixin and decorator that split args across the
+__init__s of a class's parents, with the dynamic (`apply_split_inits`) or
+the compiled (`apply_compiled_split_inits`) routing."""
+
+from .compiled_split_init import apply_compiled_split_inits
+from .split_args_for_inits import apply_split_inits
+
+# Whether SplitInitMixin and auto_split_init use generated routing
+# functions (see apply_compiled_split_inits) unless told otherwise:
+COMPILE_SPLIT_INITS = False
+
+
+class SplitInitMixin:  # pylint: disable=too-few-public-methods
+    """A mixin class to be used for automatically splitting args across inits.
+
+    Note: this mixin class is not perfect, and will fail under certain circumstances:
+     - If some parent class has only positional arguments and comes before another
+       parent class with kwargs, the first parent may fail to initialize (whether or not it
+       calls super).
+    [The following parts ay not apply anymore, using the new apply_split_inits:
+     - Calling super().__init__() in apply_split_inits can skip the init methods
+       for the direct parent classes, so they won't get ininialized.
+     - Changing the calls in apply_split_inits from super().__init__() to
+       calling the init of each parent directly results in recursion.
+     - Changing the calls in apply_split_inits from super().__init__() to
+       calling the super().__init__() once also results in recursion.
+    The big dilema is we want
+     - To automate splitting and routing *args and **kwargs to multiple __init__ methods.
+     - To work cooperatively with super(), without requiring all third-party classes to cooperate.
+     - To avoid recursion and ensure each __init__ is called exactly once.
+     - To not manually walk the MRO, because that breaks super() semantics and third-party
+       expectations.
+    So we can't really have all three of the following at the same time, only two:
+     - Automatic argument splitting
+     - Compatibility with arbitrary third-party __init__ methods
+     - Full preservation of Python's super()]
+
+    Set `split_init_compiled = True` on a class to route its arguments
+    with `apply_compiled_split_inits`. If None (the default), uses
+    COMPILE_SPLIT_INITS.
+
+    Usage example:
+    class Child(SplitInitMixin, Parent1, Parent2):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            # Use self._init_leftovers if needed
+    """
+
+    split_init_compiled: bool | None = None
+
+    def __init__(self, *args, **kwargs):
+        """New init for the class."""
+        compiled = self.split_init_compiled
+        if COMPILE_SPLIT_INITS if compiled is None else compiled:
+            apply_compiled_split_inits(self, args, kwargs)
+            return
+        self._init_leftovers = apply_split_inits(
+            self, cls=type(self), args=args, kwargs=kwargs
+        )  # , skip_class=SplitInitMixin)
+
+
+def auto_split_init(cls=None, *, compiled: bool | None = None):
+    """A decorator to be used for automatically splitting args across inits.
+
+    Use `@auto_split_init(compiled=True)` to route arguments with
+    `apply_compiled_split_inits`. If None (the default), uses
+    COMPILE_SPLIT_INITS.
+
+    Note: this decorator is not perfect, and will fail under certain circumstances:
+     - If some parent class has only positional arguments and comes before another
+       parent class with kwargs, the first parent may fail to initialize (whether or not it
+       calls super).
+     - Calling super().__init__() in apply_split_inits can skip the init methods
+       for the direct parent classes, so they won't get ininialized.
+     - Changing the calls in apply_split_inits from super().__init__() to
+       calling the init of each parent directly results in recursion.
+     - Changing the calls in apply_split_inits from super().__init__() to
+       calling the super().__init__() once also results in recursion.
+    The big dilema is we want
+     - To automate splitting and routing *args and **kwargs to multiple __init__ methods.
+     - To work cooperatively with super(), without requiring all third-party classes to cooperate.
+     - To avoid recursion and ensure each __init__ is called exactly once.
+     - To not manually walk the MRO, because that breaks super() semantics and third-party
+       expectations.
+    So we can't really have all three of the following at the same time, only two:
+     - Automatic argument splitting
+     - Compatibility with arbitrary third-party __init__ methods
+     - Full preservation of Python's super()
+
+    Usage example:
+    @auto_split_init
+    class Child(Parent1, Parent2):
+        def __init__(self, *args, **kwargs):
+            # self._init_leftovers is available if needed
+            print("Child custom init logic")
+    """
+    if cls is None:
+        return lambda cls: auto_split_init(cls, compiled=compiled)
+    original_init = cls.__init__
+
+    def wrapped_init(self, *args, **kwargs):
+        """New init for the wrapped class."""
+        leftovers = (
+            apply_compiled_split_inits(self, args, kwargs)
+            if (COMPILE_SPLIT_INITS if compiled is None else compiled)
+            else apply_split_inits(self, type(self), args, kwargs)
+        )
+        original_init(
+            self, *leftovers.get("args", []), **leftovers.get("kwargs", {})
+        )
+
+    cls.__init__ = wrapped_init
+    return cls
@@ -0,0 +1,68 @@
+"""This file contains the parsing and normalization of task strings (e.g.
+"planning and design, review" to "planning, design, review")."""
+
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+
+# To separate only commas and spaces, just use [,\s] as the re pattern.
+TASK_SEPARATOR = re.compile(r",|\s+and\s+")
+# How many distinct task strings the parsing functions remember:
+TASK_CACHE_SIZE = 4096
+
+
+def _split_task_names(task_str: str) -> tuple[str, ...]:
+    """Split a task string into task names (see split_task_names)."""
+    # Most task strings are a single task, without any separator:
+    if "," not in task_str and "and" not in task_str:
+        task = task_str.strip()
+        return (task,) if task else ()
+    parts = (part.strip() for part in TASK_SEPARATOR.split(task_str))
+    return tuple(dict.fromkeys(part for part in parts if part))
+
+
+@lru_cache(maxsize=TASK_CACHE_SIZE)
+def split_task_names(task_str: str) -> tuple[str, ...]:
+    """Split comma-separated or " and " -separated tasks into task
+    names, deduplicated (in order)."""
+    return _split_task_names(task_str)
+
+
+@lru_cache(maxsize=TASK_CACHE_SIZE)
+def normalize_tasks(task_str: str) -> str:
+    """Convert comma-separated or " and " -separated tasks to CSV-style."""
+    return ", ".join(split_task_names(task_str))
+
+
+@lru_cache(maxsize=TASK_CACHE_SIZE)
+def split_task_list(task_list: str) -> tuple[str, ...]:
+    """Split a comma-separated task list (as normalize_tasks writes it)."""
+    return tuple(
+        task for part in task_list.split(",") if (task := part.strip())
+    )
+
+
+def merge_task_lists(start_tasks: str, end_tasks: str) -> str:
+    """Merge and deduplicate comma-separated task strings."""
+    combined = split_task_list(start_tasks) + split_task_list(end_tasks)
+    return ", ".join(dict.fromkeys(combined))  # de-dupe + preserve order
+
+
+def normalize_task_column(tasks: Iterable[str | None]) -> list[str]:
+    """Normalize a column of task strings (see normalize_tasks), e.g. of a
+    whole file, parsing each distinct string once.
+
+    This bypasses the normalize_tasks cache, so a column with more
+    distinct strings than the cache holds doesn't evict it (or thrash).
+
+    Args:
+        tasks (Iterable[str | None]): The task strings (None for empty).
+
+    Returns:
+        list[str]: The normalized task strings, in the same order.
+    """
+    tasks = [task or "" for task in tasks]
+    normalized = {
+        task: ", ".join(_split_task_names(task)) for task in set(tasks)
+    }
+    return [normalized[task] for task in tasks]
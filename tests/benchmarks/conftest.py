@@ -0,0 +1,116 @@
+"""This file contains fixtures for the benchmark suite, which only runs
+with `pytest --benchmark` (see the options in tests/conftest.py)."""
+
+import json
+import platform
+import statistics
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def skip_without_benchmark_option(request):
+    """Skip benchmarks unless they were asked for."""
+    if not request.config.getoption("--benchmark"):
+        pytest.skip("Benchmarks only run with --benchmark.")
+
+
+@pytest.fixture(name="benchmark_results", scope="session")
+def fixture_benchmark_results(request, tmp_path_factory):
+    """Collect benchmark results, and save them as JSON at the end of the
+    session (to `--benchmark-save`, or pytest's temporary directory)."""
+    results: dict[str, dict[str, Any]] = {}
+    yield results
+    if not results:
+        return
+    if (save_path := request.config.getoption("--benchmark-save")) is None:
+        timestamp = datetime.now().strftime("%Y_%m_%d-%H%M%S")
+        save_path = tmp_path_factory.getbasetemp() / f"{timestamp}.json"
+    save_path = Path(save_path)
+    save_path.parent.mkdir(parents=True, exist_ok=True)
+    save_path.write_text(
+        json.dumps(
+            {
+                "date": datetime.now().isoformat(),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "benchmarks": results,
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    print(f"\nBenchmark results saved to {save_path}")
+
+
+@pytest.fixture(name="benchmark_baseline", scope="session")
+def fixture_benchmark_baseline(request) -> dict[str, dict[str, Any]]:
+    """The stored baseline results, if any."""
+    path = request.config.getoption("--benchmark-baseline")
+    if not path or not Path(path).is_file():
+        return {}
+    return json.loads(Path(path).read_text(encoding="utf-8"))["benchmarks"]
+
+
+@pytest.fixture(name="benchmark")
+def fixture_benchmark(request, benchmark_results, benchmark_baseline):
+    """Time a function over several rounds, record the result, and fail
+    if its median is slower than the baseline's by more than the
+    threshold (`--benchmark-threshold`, or a `threshold` stored with the
+    baseline entry).
+
+    Call it as `benchmark(func, *args, setup=None, name=None, ops=None)`.
+    `setup` (untimed) runs before each round; `name` defaults to the
+    test's name; `ops`, the number of operations `func` performs per
+    round, adds an operations-per-second figure to the results.
+    Returns what the last round of `func` returned.
+    """
+    rounds = request.config.getoption("--benchmark-rounds")
+
+    def _benchmark(
+        func: Callable,
+        *args,
+        setup: Callable[[], Any] | None = None,
+        name: str | None = None,
+        ops: int | None = None,
+        **kwargs,
+    ):
+        name = name or request.node.name
+        times = []
+        result = None
+        for _ in range(rounds):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            times.append(time.perf_counter() - start)
+        median = statistics.median(times)
+        benchmark_results[name] = {
+            "rounds": rounds,
+            "min": min(times),
+            "median": median,
+            "mean": statistics.fmean(times),
+        }
+        if ops is not None:
+            benchmark_results[name]["ops_per_second"] = ops / median
+
+        if (baseline := benchmark_baseline.get(name)) is not None:
+            threshold = baseline.get(
+                "threshold", request.config.getoption("--benchmark-threshold")
+            )
+            limit = baseline["median"] * (1 + threshold)
+            if median > limit:
+                pytest.fail(
+                    f"{name} regressed: median {median * 1000:.3f} ms > "
+                    f"{limit * 1000:.3f} ms (baseline "
+                    f"{baseline['median'] * 1000:.3f} ms + "
+                    f"{threshold:.0%})"
+                )
+        return result
+
+    return _benchmark
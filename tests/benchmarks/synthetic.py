@@ -0,0 +1,90 @@
+"""This file contains generators of synthetic data for benchmarks."""
+
+import csv
+import json
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from time_tracker.constants import HEADERS, ColumnHeaders
+
+TASK_WORDS = [
+    "planning",
+    "code review",
+    "client meeting",
+    "bug fix",
+    "deploy",
+    "docs",
+    "research",
+    "design, UX",
+    'estimate "phase 2"',
+    "support ticket #4821",
+    "refactor: billing, invoices",
+]
+
+
+def random_task(rng: random.Random) -> str:
+    """Make a task string like those the tracker writes: one to three
+    tasks, some holding commas or quotes, joined by ', '."""
+    return ", ".join(rng.sample(TASK_WORDS, rng.randint(1, 3)))
+
+
+def write_synthetic_csv(
+    path: str | Path,
+    n_rows: int,
+    seed: int = 0,
+    start: datetime = datetime(2021, 1, 4, 9),
+    years: int = 3,
+) -> Path:
+    """Write a tracker CSV of `n_rows` finished entries, spread evenly
+    over `years` years from `start`.
+
+    Args:
+        path (str | Path): The CSV to write.
+        n_rows (int): How many entries to write.
+        seed (int): Seed for the random tasks and durations.
+        start (datetime): Start of the first entry.
+        years (int): How many years the entries span.
+
+    Returns:
+        Path: The written CSV.
+    """
+    rng = random.Random(seed)
+    path = Path(path)
+    step = timedelta(days=365 * years) / max(n_rows, 1)
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=HEADERS)
+        writer.writeheader()
+        for i in range(n_rows):
+            entry_start = start + i * step
+            duration = rng.uniform(300, min(8 * 3600, step.total_seconds()))
+            writer.writerow(
+                {
+                    ColumnHeaders.START.value: entry_start.isoformat(),
+                    ColumnHeaders.END.value: (
+                        entry_start + timedelta(seconds=duration)
+                    ).isoformat(),
+                    ColumnHeaders.DURATION.value: f"{duration:.2f}",
+                    ColumnHeaders.TASK.value: random_task(rng),
+                }
+            )
+    return path
+
+
+def write_synthetic_client_config(path: str | Path, n_clients: int) -> Path:
+    """Write a client config with `n_clients` clients (client0, ...)."""
+    path = Path(path)
+    clients = {
+        f"client{i}": {
+            "name": f"Example Corporation {i}",
+            "project": "Awesome Project",
+            "address": f"{i} Made Up Lane\nNowhere, NS 00000",
+            "email": f"billing{i}@example.com",
+            "phone": "201-456-7890",
+            "rate": 100.0 + i,
+            "filename": f"client{i}.csv",
+        }
+        for i in range(n_clients)
+    }
+    path.write_text(json.dumps({"clients": clients}), encoding="utf-8")
+    return path
@@ -0,0 +1,242 @@
+"""Benchmarks of the tracker's hot paths. Run with
+`pytest tests/benchmarks --benchmark`."""
+
+import shutil
+
+import pytest
+
+from time_tracker.config import clear_config_cache, load_client_config
+from time_tracker.constants import SAMPLE_CLIENT_CONFIG_FILE, ColumnHeaders
+from time_tracker.reporting import clear_report_cache
+from time_tracker.storage import convert_entry_file
+from time_tracker.tracker import TimeTracker
+from time_tracker.utils import normalize_task_column, read_entries
+
+from .synthetic import (
+    random_task,
+    write_synthetic_client_config,
+    write_synthetic_csv,
+)
+
+
+@pytest.fixture(name="synthetic_csv", scope="module")
+def fixture_synthetic_csv(request, tmp_path_factory):
+    """A synthetic CSV spanning three years."""
+    path = tmp_path_factory.mktemp("benchmarks") / "synthetic.csv"
+    return write_synthetic_csv(
+        path, request.config.getoption("--benchmark-rows")
+    )
+
+
+@pytest.fixture(name="tracker")
+def fixture_tracker(tmp_path, synthetic_csv):
+    """A tracker over a copy of the synthetic CSV."""
+    shutil.copy(synthetic_csv, tmp_path / "synthetic.csv")
+    tracker = TimeTracker(
+        filename="synthetic.csv",
+        directory=tmp_path,
+        client_config_file=SAMPLE_CLIENT_CONFIG_FILE,
+        logger_filename=tmp_path / "benchmark.log",
+    )
+    yield tracker
+    tracker.logger_handler.close()
+
+
+def test_get_all_entries(benchmark, tracker, request):
+    """Benchmark reading the whole CSV."""
+    entries = benchmark(tracker.get_all_entries)
+    assert len(entries) == request.config.getoption("--benchmark-rows")
+
+
+def test_get_last_entry(benchmark, tracker):
+    """Benchmark reading the last entry."""
+    assert benchmark(tracker.get_last_entry)
+
+
+def test_track_start_stop(benchmark, tracker, synthetic_csv, capsys):
+    """Benchmark starting and then stopping a timer."""
+
+    def start_stop():
+        tracker.track("benchmark")
+        tracker.track()
+
+    benchmark(
+        start_stop,
+        setup=lambda: shutil.copy(synthetic_csv, tracker.filepath),
+    )
+    capsys.readouterr()
+
+
+def test_track_start_stop_binary(benchmark, tmp_path, synthetic_csv, capsys):
+    """Benchmark starting and then stopping a timer in a binary (.ttb)
+    copy of the synthetic CSV."""
+    binary = tmp_path / "synthetic.ttb"
+    convert_entry_file(synthetic_csv, binary)
+    tracker = TimeTracker(
+        filename=binary.name,
+        directory=tmp_path,
+        client_config_file=SAMPLE_CLIENT_CONFIG_FILE,
+        logger_filename=tmp_path / "benchmark.log",
+    )
+    original = binary.read_bytes()
+
+    def start_stop():
+        tracker.track("benchmark")
+        tracker.track()
+
+    benchmark(start_stop, setup=lambda: binary.write_bytes(original))
+    capsys.readouterr()
+    tracker.logger_handler.close()
+
+
+@pytest.mark.parametrize("fast", [False, True], ids=["dict_writer", "fast"])
+def test_append_rows(benchmark, tmp_path, fast):
+    """Benchmark appending 1000 single rows, with a DictWriter per row
+    (as safe_write_csv does) or with append_csv_row."""
+    tracker = TimeTracker(
+        filename="append.csv",
+        directory=tmp_path,
+        client_config_file=SAMPLE_CLIENT_CONFIG_FILE,
+        logger_filename=tmp_path / "benchmark.log",
+    )
+    row = {
+        ColumnHeaders.START.value: "2024-01-01T09:00:00.000000",
+        ColumnHeaders.END.value: "",
+        ColumnHeaders.DURATION.value: "",
+        ColumnHeaders.TASK.value: "planning, code review",
+    }
+
+    def append_rows():
+        for _ in range(1000):
+            if fast:
+                tracker.append_csv_row(row)
+            else:
+                tracker.safe_write_csv([row], mode="a")
+
+    benchmark(append_rows, setup=tracker.ensure_file_exists, ops=1000)
+    tracker.logger_handler.close()
+
+
+def test_import_entries(benchmark, tmp_path, synthetic_csv):
+    """Benchmark importing the synthetic CSV into an empty tracker."""
+    tracker = TimeTracker(
+        filename="import.csv",
+        directory=tmp_path,
+        client_config_file=SAMPLE_CLIENT_CONFIG_FILE,
+        logger_filename=tmp_path / "benchmark.log",
+    )
+    entries = list(read_entries(synthetic_csv))
+    benchmark(
+        tracker.import_entries,
+        entries,
+        setup=lambda: tracker.filepath.unlink(missing_ok=True),
+        ops=len(entries),
+    )
+    tracker.logger_handler.close()
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"filter_task": "planning"},
+        {"start_date": "2022-01-01", "end_date": "2022-12-31"},
+        {"split_tasks": True},
+    ],
+    ids=["no_filter", "task_filter", "date_filter", "split_tasks"],
+)
+@pytest.mark.parametrize("cached", [False, True], ids=["cold", "cached"])
+def test_generate_report(benchmark, tracker, filters, cached):
+    """Benchmark aggregating the CSV into a report, reading it (cold) or
+    reusing its indexed entries (cached, see load_report_entries)."""
+    totals, _ = benchmark(
+        tracker.generate_report,
+        setup=None if cached else clear_report_cache,
+        **filters,
+    )
+    assert totals
+
+
+@pytest.mark.parametrize("period", ["day", "week", "month"])
+@pytest.mark.parametrize("cached", [False, True], ids=["cold", "cached"])
+def test_generate_bucketed_report(benchmark, tracker, period, cached):
+    """Benchmark aggregating the CSV into hours per task and period (see
+    test_generate_report)."""
+    report = benchmark(
+        tracker.generate_bucketed_report,
+        period,
+        setup=None if cached else clear_report_cache,
+    )
+    assert report.periods
+
+
+def test_normalize_and_merge_tasks(benchmark):
+    """Benchmark normalizing and merging task strings."""
+    import random  # pylint: disable=import-outside-toplevel
+
+    rng = random.Random(0)
+    pairs = [(random_task(rng), random_task(rng)) for _ in range(10_000)]
+
+    def normalize_and_merge():
+        for start_tasks, end_tasks in pairs:
+            TimeTracker.merge_task_lists(
+                TimeTracker.normalize_tasks(start_tasks), end_tasks
+            )
+
+    benchmark(normalize_and_merge)
+
+
+def test_normalize_task_column(benchmark):
+    """Benchmark normalizing a column of 100k task strings."""
+    import random  # pylint: disable=import-outside-toplevel
+
+    rng = random.Random(0)
+    column = [random_task(rng) for _ in range(100_000)]
+    benchmark(normalize_task_column, column, ops=len(column))
+
+
+def test_normalize_entries(benchmark, tracker, synthetic_csv):
+    """Benchmark re-normalizing the tasks of the synthetic CSV."""
+    benchmark(
+        tracker.normalize_entries,
+        setup=lambda: shutil.copy(synthetic_csv, tracker.filepath),
+    )
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
+@pytest.mark.parametrize("cached", [False, True], ids=["cold", "warm"])
+def test_load_client_config(benchmark, tmp_path, cached, lazy):
+    """Benchmark loading a config of 2000 clients and using one."""
+    config_file = write_synthetic_client_config(
+        tmp_path / "clients.json", 2000
+    )
+
+    def load_one_client():
+        config = load_client_config(config_file, lazy=lazy)
+        return config.clients["client7"]
+
+    client = benchmark(
+        load_one_client, setup=None if cached else clear_config_cache
+    )
+    assert client.rate == 107.0
+
+
+@pytest.mark.parametrize("backend", ["latex", "pdf"])
+def test_generate_invoice(benchmark, tracker, tmp_path, mocker, backend):
+    """Benchmark generating an invoice, with pdflatex (and logo
+    conversion) stubbed out."""
+    mocker.patch("time_tracker.invoice.latex_backend.subprocess.run")
+    mocker.patch(
+        "time_tracker.tracker.prepare_logo_for_latex", return_value=None
+    )
+    mocker.patch(
+        "time_tracker.tracker.get_next_invoice_number", return_value=1
+    )
+    invoice_filename = tmp_path / "invoice.pdf"
+    benchmark(
+        tracker.generate_invoice,
+        invoice_filename=invoice_filename,
+        start_date="2022-01-01",
+        end_date="2022-12-31",
+        backend=backend,
+    )
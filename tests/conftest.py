@@ -4,12 +4,80 @@ import datetime
 import os
 import shutil
 import tempfile
+from pathlib import Path
 
 import pytest
 
+from time_tracker.config import clear_config_cache
 from time_tracker.constants import SAMPLE_CLIENT_CONFIG_FILE
+from time_tracker.reporting import clear_report_cache
 from time_tracker.tracker import TimeTracker
 
+BENCHMARK_DIR = Path(__file__).parent / "benchmarks"
+
+
+def pytest_addoption(parser):
+    """Add the options of the benchmark suite (tests/benchmarks)."""
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        help="Run the benchmarks in tests/benchmarks.",
+    )
+    group.addoption(
+        "--benchmark-rounds",
+        type=int,
+        default=5,
+        help="How many times to run each benchmark. Defaults to 5.",
+    )
+    group.addoption(
+        "--benchmark-rows",
+        type=int,
+        default=10_000,
+        help="Rows in the synthetic CSV. Defaults to 10,000.",
+    )
+    group.addoption(
+        "--benchmark-save",
+        default=None,
+        help=(
+            "JSON file to save the results to. Defaults to a timestamped "
+            "file in pytest's temporary directory."
+        ),
+    )
+    group.addoption(
+        "--benchmark-baseline",
+        default=str(BENCHMARK_DIR / "baseline.json"),
+        help=(
+            "JSON results (from --benchmark-save) to compare against, "
+            "if the file exists."
+        ),
+    )
+    group.addoption(
+        "--benchmark-threshold",
+        type=float,
+        default=0.25,
+        help=(
+            "Fail benchmarks whose median is slower than the baseline's "
+            "by more than this fraction. Defaults to 0.25."
+        ),
+    )
+
+
+@pytest.fixture(autouse=True)
+def fresh_config_cache():
+    """Keep validated configs from leaking between tests."""
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+@pytest.fixture(autouse=True)
+def fresh_report_cache():
+    """Keep report entries from leaking between tests."""
+    clear_report_cache()
+    yield
+    clear_report_cache()
+
 
 @pytest.fixture
 def mock_tracker(mocker):
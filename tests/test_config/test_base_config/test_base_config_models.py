@@ -1,8 +1,13 @@
 """This file has tests for base_config_models.py."""
 
+import phonenumbers
 import pytest
 
 from time_tracker.config import Party
+from time_tracker.config.base_config.base_config_models import (
+    normalize_email,
+    normalize_phone,
+)
 
 
 def test_party_invalid_address():
@@ -32,3 +37,29 @@ def test_party_invalid_phone():
             email="bob@example.com",
             phone="not a phone number",
         )
+
+
+def test_party_normalization_memoized(mocker):
+    """Test that phone numbers and emails are normalized once per raw
+    value."""
+    normalize_phone.cache_clear()
+    normalize_email.cache_clear()
+    spy = mocker.spy(phonenumbers, "parse")
+    for _ in range(3):
+        party = Party(
+            name="bob",
+            address="123 Fourth Ave\nFive City, Sixth State 00000",
+            email="bob@example.com",
+            phone="901-654-3210",
+        )
+        assert party.phone == "+1 901-654-3210"
+        assert party.email == "bob@example.com"
+    assert spy.call_count == 1
+    assert normalize_email.cache_info().hits == 2
+    with pytest.raises(ValueError):
+        Party(
+            name="bob",
+            address="123 Fourth Ave\nFive City, Sixth State 00000",
+            email="not an email",
+            phone="901-654-3210",
+        )
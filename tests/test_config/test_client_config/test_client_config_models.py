@@ -1,8 +1,17 @@
 """This file has tests for client_config_models.py."""
 
+import json
+
 import pytest
+from pydantic import ValidationError
 
-from time_tracker.config import Client
+from time_tracker.config import (
+    Client,
+    ClientConfig,
+    LazyClientConfig,
+    load_client_config,
+)
+from time_tracker.constants import SAMPLE_CLIENT_CONFIG_FILE
 
 
 def test_client_invalid_rate():
@@ -16,3 +25,76 @@ def test_client_invalid_rate():
             rate=-10,
             filename="file.csv",
         )
+
+
+CLIENT = {
+    "name": "bob",
+    "address": "123 Fourth Ave\nFive City, Sixth State, 00000",
+    "email": "bob@example.com",
+    "phone": "901-654-3210",
+    "rate": 10,
+    "filename": "file.csv",
+}
+
+
+def test_lazy_clients_validate_on_access(mocker):
+    """Test that LazyClients only validates the clients accessed."""
+    spy = mocker.spy(Client, "model_validate")
+    config = LazyClientConfig(
+        clients={"bob": CLIENT, "bad": CLIENT | {"rate": -1}}
+    )
+    assert "bad" in config.clients
+    assert list(config.clients) == ["bob", "bad"]
+    assert len(config.clients) == 2
+    assert spy.call_count == 0
+
+    bob = config.clients["bob"]
+    assert bob.phone == "+1 901-654-3210"
+    assert config.clients["bob"] is bob
+    assert spy.call_count == 1
+    with pytest.raises(ValidationError):
+        config.clients["bad"]  # pylint: disable=pointless-statement
+    with pytest.raises(KeyError):
+        config.clients["nobody"]  # pylint: disable=pointless-statement
+
+
+def test_lazy_clients_validate_all_reports_all_errors():
+    """Test that validate_all reports every invalid client at once."""
+    config = LazyClientConfig(
+        clients={
+            "bob": CLIENT,
+            "bad_rate": CLIENT | {"rate": -1},
+            "bad_phone": CLIENT | {"phone": "not a phone number"},
+        }
+    )
+    with pytest.raises(ValidationError) as exc_info:
+        config.validate_all()
+    locs = {error["loc"] for error in exc_info.value.errors()}
+    assert locs == {
+        ("clients", "bad_rate", "rate"),
+        ("clients", "bad_phone", "phone"),
+    }
+
+    valid = LazyClientConfig(clients={"bob": CLIENT}).validate_all()
+    assert valid == ClientConfig(clients={"bob": CLIENT})
+
+
+def test_lazy_client_config_ignores_extra_keys(tmp_path):
+    """Test that other top-level keys are ignored, as by ClientConfig."""
+    config_file = tmp_path / "clients.json"
+    config_file.write_text(
+        json.dumps({"version": 2, "clients": {"bob": CLIENT}})
+    )
+    lazy = load_client_config(config_file, lazy=True)
+    assert (
+        lazy.clients["bob"] == load_client_config(config_file).clients["bob"]
+    )
+
+
+def test_load_client_config_lazy():
+    """Test loading the sample config lazily."""
+    config = load_client_config(SAMPLE_CLIENT_CONFIG_FILE, lazy=True)
+    assert isinstance(config, LazyClientConfig)
+    eager = load_client_config(SAMPLE_CLIENT_CONFIG_FILE)
+    assert isinstance(eager, ClientConfig)
+    assert config.validate_all() == eager
@@ -0,0 +1,123 @@
+"""This file has tests for client_directory.py."""
+
+import json
+import os
+
+import pytest
+import yaml
+from pydantic import ValidationError
+
+from time_tracker.config import ShardedClientConfig, load_client_config
+from time_tracker.config.client_config import client_directory
+from time_tracker.config.client_config.client_directory import (
+    CLIENT_INDEX_FILENAME,
+    MTIME_RESOLUTION_NS,
+)
+from time_tracker.constants import SAMPLE_CLIENT_CONFIG_FILE
+
+CLIENTS = json.loads(SAMPLE_CLIENT_CONFIG_FILE.read_text())["clients"]
+CLIENT1 = "client1"
+CLIENT2 = "client2"
+
+
+@pytest.fixture(name="client_dir")
+def fixture_client_dir(tmp_path):
+    """A client config directory, with a JSON and a YAML client."""
+    client_dir = tmp_path / "clients"
+    client_dir.mkdir()
+    client = next(iter(CLIENTS.values()))
+    (client_dir / f"{CLIENT1}.json").write_text(json.dumps(client))
+    (client_dir / f"{CLIENT2}.yaml").write_text(
+        yaml.safe_dump(client | {"rate": 42.0})
+    )
+    (client_dir / "notes.txt").write_text("Not a client.")
+    return client_dir
+
+
+def test_load_client_directory(client_dir, mocker):
+    """Test that only the accessed client's file is loaded."""
+    spy = mocker.spy(json, "load")
+    config = load_client_config(client_dir)
+    assert isinstance(config, ShardedClientConfig)
+    assert list(config.clients) == [CLIENT1, CLIENT2]
+    assert spy.call_count == 0  # The index was just built.
+
+    assert config.clients[CLIENT2].rate == 42.0
+    assert spy.call_count == 0  # YAML.
+    assert config.clients[CLIENT1].rate == next(iter(CLIENTS.values()))["rate"]
+    assert spy.call_count == 1
+    with pytest.raises(KeyError):
+        config.clients["notes"]  # pylint: disable=pointless-statement
+
+
+def test_client_index_reused_until_files_change(client_dir, mocker):
+    """Test that the generated index is trusted until client files are
+    added, removed or changed, whatever the directory's mtime, while it's
+    too recent to be trusted."""
+    load_client_config(client_dir)
+    index_file = client_dir / CLIENT_INDEX_FILENAME
+    assert json.loads(index_file.read_text())["clients"] == {
+        CLIENT1: f"{CLIENT1}.json",
+        CLIENT2: f"{CLIENT2}.yaml",
+    }
+    spy = mocker.spy(client_directory, "build_client_index")
+    assert list(load_client_config(client_dir).clients) == [CLIENT1, CLIENT2]
+    assert spy.call_count == 0
+
+    # A change that leaves the directory's mtime as it was:
+    dir_stat = client_dir.stat()
+    (client_dir / f"{CLIENT1}.json").write_text(
+        json.dumps(next(iter(CLIENTS.values())) | {"rate": 7.0})
+    )
+    os.utime(client_dir, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+    load_client_config(client_dir)
+    assert spy.call_count == 1
+
+    (client_dir / f"{CLIENT2}.yaml").unlink()
+    os.utime(client_dir, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+    assert list(load_client_config(client_dir).clients) == [CLIENT1]
+    assert spy.call_count == 2
+    assert not list(client_dir.glob("*.tmp"))
+
+
+def test_client_index_trusts_old_directory_mtime(client_dir, mocker):
+    """Test that the client files aren't listed while the directory's
+    mtime is the one recorded in the index, once it's old enough."""
+    load_client_config(client_dir)
+    index_file = client_dir / CLIENT_INDEX_FILENAME
+    old = client_dir.stat().st_mtime_ns - 10 * MTIME_RESOLUTION_NS
+    os.utime(client_dir, ns=(old, old))
+    spy = mocker.spy(client_directory, "scan_client_files")
+    load_client_config(client_dir)
+    assert spy.call_count == 1
+    # Recorded in place, leaving the directory's mtime as it was:
+    assert json.loads(index_file.read_text())["directory_mtime_ns"] == old
+    assert client_dir.stat().st_mtime_ns == old
+
+    assert list(load_client_config(client_dir).clients) == [CLIENT1, CLIENT2]
+    assert spy.call_count == 1
+    (client_dir / "client3.json").write_text(
+        json.dumps(next(iter(CLIENTS.values())))
+    )
+    assert list(load_client_config(client_dir).clients) == [
+        CLIENT1,
+        CLIENT2,
+        "client3",
+    ]
+    assert spy.call_count == 2
+
+
+def test_client_directory_errors(client_dir):
+    """Test duplicate client files and aggregate validation errors."""
+    (client_dir / f"{CLIENT2}.yaml").write_text(
+        yaml.safe_dump(next(iter(CLIENTS.values())) | {"rate": -1})
+    )
+    with pytest.raises(ValidationError) as exc_info:
+        load_client_config(client_dir).validate_all()
+    assert [error["loc"] for error in exc_info.value.errors()] == [
+        ("clients", CLIENT2, "rate")
+    ]
+
+    (client_dir / f"{CLIENT2}.json").write_text("{}")
+    with pytest.raises(ValueError, match="more than one file"):
+        load_client_config(client_dir)
@@ -0,0 +1,94 @@
+"""This file contains tests for the config_cache module."""
+
+import json
+import os
+
+from time_tracker.config import (
+    ClientConfig,
+    Me,
+    clear_config_cache,
+    load_validated_config,
+)
+from time_tracker.config.config_cache import get_snapshot_path
+from time_tracker.constants import SAMPLE_CLIENT_CONFIG_FILE
+
+ME = {
+    "name": "Test User",
+    "address": "123 Test Ave\nCity",
+    "email": "test@example.com",
+    "phone": "301-555-1234",
+}
+
+
+def test_cache_reuses_validated_config(tmp_path, mocker):
+    """Test that an unchanged file isn't re-read or revalidated."""
+    me_file = tmp_path / "me.json"
+    me_file.write_text(json.dumps(ME))
+    spy = mocker.spy(json, "load")
+
+    first = load_validated_config(me_file, Me, snapshot_dir=None)
+    second = load_validated_config(str(me_file), Me, snapshot_dir=None)
+    assert first is second
+    assert spy.call_count == 1
+
+
+def test_cache_reloads_changed_file(tmp_path):
+    """Test that a changed file (mtime or size) is reloaded."""
+    me_file = tmp_path / "me.json"
+    me_file.write_text(json.dumps(ME))
+    first = load_validated_config(me_file, Me, snapshot_dir=None)
+
+    me_file.write_text(json.dumps(ME | {"name": "Other User"}))
+    second = load_validated_config(me_file, Me, snapshot_dir=None)
+    assert second.name == "Other User"
+
+    # Same size, but a different mtime:
+    me_file.write_text(json.dumps(ME | {"name": "Other Usex"}))
+    stat = me_file.stat()
+    os.utime(me_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    third = load_validated_config(me_file, Me, snapshot_dir=None)
+    assert third.name == "Other Usex"
+    assert first is not third
+
+
+def test_cache_snapshot_skips_validation(tmp_path, mocker):
+    """Test that a snapshot is used by a 'new process' (empty cache)."""
+    snapshot_dir = tmp_path / "snapshots"
+    config = load_validated_config(
+        SAMPLE_CLIENT_CONFIG_FILE, ClientConfig, snapshot_dir=snapshot_dir
+    )
+    snapshot = get_snapshot_path(
+        SAMPLE_CLIENT_CONFIG_FILE.resolve(), ClientConfig, snapshot_dir
+    )
+    assert snapshot.exists()
+
+    clear_config_cache()
+    spy = mocker.spy(json, "load")
+    loaded = load_validated_config(
+        SAMPLE_CLIENT_CONFIG_FILE, ClientConfig, snapshot_dir=snapshot_dir
+    )
+    assert spy.call_count == 0
+    assert loaded == config
+
+
+def test_cache_ignores_stale_or_corrupt_snapshot(tmp_path):
+    """Test that snapshots of other file versions, or corrupt ones,
+    aren't used."""
+    snapshot_dir = tmp_path / "snapshots"
+    me_file = tmp_path / "me.json"
+    me_file.write_text(json.dumps(ME))
+    load_validated_config(me_file, Me, snapshot_dir=snapshot_dir)
+
+    clear_config_cache()
+    me_file.write_text(json.dumps(ME | {"name": "Changed User"}))
+    assert (
+        load_validated_config(me_file, Me, snapshot_dir=snapshot_dir).name
+        == "Changed User"
+    )
+
+    clear_config_cache()
+    get_snapshot_path(me_file.resolve(), Me, snapshot_dir).write_bytes(b"x")
+    assert (
+        load_validated_config(me_file, Me, snapshot_dir=snapshot_dir).name
+        == "Changed User"
+    )
@@ -2,7 +2,10 @@
 
 import json
 
-from time_tracker.config import get_next_invoice_number
+from time_tracker.config import (
+    get_next_invoice_number,
+    peek_next_invoice_number,
+)
 
 
 def test_get_next_invoice_number_with_valid_file(tmp_path):
@@ -60,3 +63,13 @@ def test_get_next_invoice_number_with_nonexistent_path_uses_default(
     assert result == two
 
     assert json.loads(dummy_default.read_text())["last_invoice_number"] == two
+
+
+def test_peek_next_invoice_number_does_not_consume(tmp_path):
+    """Test that peeking at the next invoice number leaves the file as-is."""
+    file = tmp_path / "invoice_state.json"
+    file.write_text(json.dumps({"last_invoice_number": 41}))
+
+    assert peek_next_invoice_number(counter_file=file) == 42
+    assert peek_next_invoice_number(counter_file=file) == 42
+    assert json.loads(file.read_text())["last_invoice_number"] == 41
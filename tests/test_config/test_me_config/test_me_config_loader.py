@@ -8,6 +8,8 @@ import pytest
 from time_tracker.config import Me
 from time_tracker.config.me_config.me_config_loader import (
     check_svg_support,
+    convert_svg_to_pdf,
+    get_logo_cache_path,
     load_me_config,
     prepare_logo_for_latex,
 )
@@ -163,3 +165,68 @@ def test_prepare_logo_for_latex_unsupported_extension(tmp_path):
         prepare_logo_for_latex(bad_logo, latex_dir)
 
     assert UNSUPPORTED_FILE_TYPE in str(excinfo.value)
+
+
+def test_get_logo_cache_path_keyed_by_contents(tmp_path):
+    """Test that the logo cache path changes with the logo contents."""
+    logo_path = tmp_path / "logo.svg"
+    logo_path.write_text("<svg>1</svg>")
+    first = get_logo_cache_path(logo_path, tmp_path / "cache")
+    assert first == get_logo_cache_path(logo_path, tmp_path / "cache")
+    assert first.suffix == ".pdf"
+    assert first.name.startswith("logo-")
+    logo_path.write_text("<svg>2</svg>")
+    assert get_logo_cache_path(logo_path, tmp_path / "cache") != first
+
+
+def test_convert_svg_to_pdf(tmp_path, mocker):
+    """Test convert_svg_to_pdf with rsvg-convert."""
+    src = tmp_path / "logo.svg"
+    src.write_text("<svg/>")
+    dst = tmp_path / "cache" / "logo.pdf"
+    mocker.patch(
+        "time_tracker.config.me_config.me_config_loader.check_svg_support",
+        return_value="rsvg-convert",
+    )
+
+    def fake_run(cmd, **kwargs):  # pylint: disable=unused-argument
+        """Fake a conversion by writing the output file."""
+        Path(cmd[cmd.index("-o") + 1]).write_text("%PDF", encoding="utf-8")
+
+    mock_run = mocker.patch(
+        "time_tracker.config.me_config.me_config_loader.subprocess.run",
+        side_effect=fake_run,
+    )
+    assert convert_svg_to_pdf(src, dst) == dst
+    assert dst.read_text() == "%PDF"
+    mock_run.assert_called_once()
+    assert not list(dst.parent.glob("*.tmp.pdf"))
+
+
+def test_prepare_logo_for_latex_uses_cached_pdf(tmp_path, mocker):
+    """Test that a cached PDF logo is used without re-conversion."""
+    latex_dir = tmp_path / "latex"
+    latex_dir.mkdir()
+    cache_dir = tmp_path / "cache"
+    logo_path = tmp_path / "logo.svg"
+    logo_path.write_text("fake svg data")
+
+    def fake_convert(src, dst):  # pylint: disable=unused-argument
+        """Fake a conversion by writing the output file."""
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        dst.write_text("%PDF")
+        return dst
+
+    mock_convert = mocker.patch(
+        "time_tracker.config.me_config.me_config_loader.convert_svg_to_pdf",
+        side_effect=fake_convert,
+    )
+    mock_check = mocker.patch(
+        "time_tracker.config.me_config.me_config_loader.check_svg_support"
+    )
+    first = prepare_logo_for_latex(logo_path, latex_dir, cache_dir=cache_dir)
+    second = prepare_logo_for_latex(logo_path, latex_dir, cache_dir=cache_dir)
+    assert first == second
+    assert first.endswith(".pdf")
+    mock_convert.assert_called_once()
+    mock_check.assert_not_called()
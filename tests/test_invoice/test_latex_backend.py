@@ -0,0 +1,57 @@
+"""This file contains tests for the LaTeX invoice backend."""
+
+from time_tracker.invoice import LatexInvoiceBackend
+
+TEX = "\\documentclass{article}\n\\begin{document}\nHi\n\\end{document}\n"
+
+
+def test_render_writes_tex_and_compiles(tmp_path, mocker):
+    """Test that rendering writes the .tex file and compiles it."""
+    template = tmp_path / "template.tex.jinja2"
+    template.write_text("Invoice ((( invoice_number ))): ((( total )))")
+    mock_run = mocker.patch(
+        "time_tracker.invoice.latex_backend.subprocess.run"
+    )
+    logger = mocker.Mock()
+    backend = LatexInvoiceBackend(logger, template)
+
+    backend.render({"invoice_number": 7, "total": 1.5}, tmp_path / "inv.pdf")
+    assert (tmp_path / "inv.tex").read_text() == "Invoice 7: 1.5"
+    assert mock_run.call_args.args[0][-1] == "inv.tex"
+    logger.info.assert_called_once_with(
+        f"✅ Invoice created: {tmp_path / 'inv.pdf'}"
+    )
+
+
+def test_compile_latex_with_precompiled_preamble(tmp_path, mocker):
+    """Test compiling against a precompiled preamble format."""
+    tex_path = tmp_path / "invoice.tex"
+    tex_path.write_text(TEX)
+    mock_format = mocker.patch(
+        "time_tracker.invoice.latex_backend.ensure_preamble_format",
+        return_value="fmt",
+    )
+    mock_run = mocker.patch(
+        "time_tracker.invoice.latex_backend.subprocess.run"
+    )
+    backend = LatexInvoiceBackend(
+        mocker.Mock(), tmp_path / "template.tex", precompile_preamble=True
+    )
+
+    backend.compile_latex(tex_path)
+    mock_format.assert_called_once_with("\\documentclass{article}\n", tmp_path)
+    cmd = mock_run.call_args.args[0]
+    assert "-fmt=fmt" in cmd
+    assert "-jobname=invoice" in cmd
+    assert cmd[-1] == "invoice.body.tex"
+    assert (
+        (tmp_path / "invoice.body.tex")
+        .read_text()
+        .startswith("\\begin{document}")
+    )
+
+    # Falls back to a full compile if the format can't be built:
+    mock_format.side_effect = FileNotFoundError("pdflatex")
+    backend.compile_latex(tex_path)
+    assert mock_run.call_args.args[0][-1] == "invoice.tex"
+    backend.logger.warning.assert_called_once()
@@ -0,0 +1,149 @@
+"""This file contains tests for the native PDF invoice backend."""
+
+import zlib
+
+import pytest
+
+from time_tracker.config import Client, Me
+from time_tracker.invoice import PdfInvoiceBackend
+from time_tracker.invoice.pdf_backend import wrap_text
+
+from .test_pdf_writer import make_png
+
+
+def make_context(me, items):
+    """Make an invoice context."""
+    return {
+        "client": Client(
+            name="Example Corporation",
+            project="Awesome Project",
+            address="123 Made Up Lane\nNowhere, NS 00000",
+            email="billing@example.com",
+            phone="201-456-7890",
+            rate=200.0,
+            filename="client1.csv",
+        ),
+        "me": me,
+        "items": items,
+        "total": sum(item["total"] for item in items),
+        "date": "01/31/2025",
+        "start_date": "01/01/2025",
+        "end_date": "01/31/2025",
+        "invoice_number": 1043,
+    }
+
+
+def page_text(pdf_bytes):
+    """Decompress all content streams of a PDF written by PdfDocument."""
+    text = b""
+    for part in pdf_bytes.split(b"/Filter /FlateDecode /Length ")[1:]:
+        length = int(part.split(b" ", 1)[0])
+        start = part.index(b"stream\n") + len(b"stream\n")
+        text += zlib.decompress(part[start : start + length])
+    return text
+
+
+def test_wrap_text():
+    """Test wrapping text to a width."""
+    lines = wrap_text("alpha beta gamma delta", 60)
+    assert len(lines) > 1
+    assert " ".join(lines) == "alpha beta gamma delta"
+    assert wrap_text("", 60) == [""]
+
+
+def test_render(tmp_path, mocker):
+    """Test rendering an invoice PDF with a PNG logo."""
+    logo = tmp_path / "logo.png"
+    logo.write_bytes(make_png(8, 4))
+    me = Me(
+        company_name="My Company, LLC",
+        name="My Name",
+        address="123 Science Lane\nSuite 42\nNowhere, NS 00000",
+        email="info@mycompany.com",
+        phone="901-654-3210",
+        logo_path=str(logo),
+    )
+    items = [
+        {"task": "dev", "hours": 1.5, "rate": 200.0, "total": 300.0},
+        {"task": "review, docs", "hours": 2.0, "rate": 200.0, "total": 400.0},
+    ]
+    logger = mocker.Mock()
+
+    PdfInvoiceBackend(logger).render(
+        make_context(me, items), tmp_path / "invoice.pdf"
+    )
+    data = (tmp_path / "invoice.pdf").read_bytes()
+    assert data.startswith(b"%PDF")
+    assert b"/Subtype /Image" in data
+    text = page_text(data)
+    for expected in (
+        b"(My Company, LLC)",
+        b"(Example Corporation)",
+        b"(1043)",
+        b"(01/01/2025-01/31/2025)",
+        b"(review, docs)",
+        b"(300.00)",
+        b"(Total Due)",
+        b"($ 700.00)",
+    ):
+        assert expected in text
+    logger.info.assert_called_once_with(
+        f"✅ Invoice created: {tmp_path / 'invoice.pdf'}"
+    )
+
+
+def test_render_many_items_adds_pages(tmp_path, mocker):
+    """Test that long tables continue onto new pages, and unsupported
+    logos are skipped with a warning."""
+    logo = tmp_path / "logo.svg"
+    logo.write_text("<svg/>")
+    me = Me(
+        name="My Name",
+        address="1 Lane\nTown",
+        email="me@example.com",
+        phone="901-654-3210",
+        logo_path=str(logo),
+    )
+    items = [
+        {"task": f"task {i}", "hours": 1.0, "rate": 1.0, "total": 1.0}
+        for i in range(80)
+    ]
+    logger = mocker.Mock()
+
+    PdfInvoiceBackend(logger).render(
+        make_context(me, items), tmp_path / "invoice.pdf"
+    )
+    data = (tmp_path / "invoice.pdf").read_bytes()
+    assert b"/Count 2" in data or b"/Count 3" in data
+    assert b"(task 79)" in page_text(data)
+    logger.warning.assert_called_once()
+
+
+@pytest.mark.parametrize("logo_bytes", [None, b"\x89PNG\r\n\x1a\n\x00"])
+def test_render_skips_unreadable_logo(tmp_path, mocker, logo_bytes):
+    """Test that a missing or corrupt logo is skipped with a warning,
+    rather than failing the invoice."""
+    logo = tmp_path / "logo.png"
+    logo.write_bytes(make_png(8, 4))
+    me = Me(
+        name="My Name",
+        address="1 Lane\nTown",
+        email="me@example.com",
+        phone="901-654-3210",
+        logo_path=str(logo),
+    )
+    # Removed (or replaced) since the config was loaded:
+    logo.unlink()
+    if logo_bytes is not None:
+        logo.write_bytes(logo_bytes)
+    logger = mocker.Mock()
+    items = [{"task": "dev", "hours": 1.0, "rate": 1.0, "total": 1.0}]
+
+    PdfInvoiceBackend(logger).render(
+        make_context(me, items), tmp_path / "invoice.pdf"
+    )
+    data = (tmp_path / "invoice.pdf").read_bytes()
+    assert b"/Subtype /Image" not in data
+    assert b"(My Name)" in page_text(data)
+    logger.warning.assert_called_once()
+    assert "skipping it" in logger.warning.call_args.args[0]
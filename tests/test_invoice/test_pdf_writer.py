@@ -0,0 +1,103 @@
+"""This file contains tests for the minimal PDF writer."""
+
+import struct
+import zlib
+
+from time_tracker.invoice.pdf_writer import (
+    PdfDocument,
+    escape_text,
+    load_image,
+    text_width,
+)
+
+
+def make_png(width, height, color_type=2):
+    """Make a minimal PNG image."""
+
+    def chunk(kind, data):
+        return (
+            struct.pack(">I", len(data))
+            + kind
+            + data
+            + struct.pack(">I", zlib.crc32(kind + data))
+        )
+
+    channels = {0: 1, 2: 3, 6: 4}[color_type]
+    raw = b"".join(
+        b"\x00" + b"\x80" * (width * channels) for _ in range(height)
+    )
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(
+            b"IHDR",
+            struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0),
+        )
+        + chunk(b"IDAT", zlib.compress(raw))
+        + chunk(b"IEND", b"")
+    )
+
+
+def test_text_width():
+    """Test Helvetica text widths."""
+    assert text_width("0", 10) == 5.56
+    assert text_width("i", 10) < text_width("i", 10, bold=True)
+    assert text_width("", 10) == 0
+
+
+def test_escape_text():
+    """Test escaping of PDF string delimiters."""
+    assert escape_text("a (b) \\ c") == b"a \\(b\\) \\\\ c"
+
+
+def test_load_png(tmp_path):
+    """Test loading RGB PNGs, and skipping PNGs with transparency."""
+    png = tmp_path / "logo.png"
+    png.write_bytes(make_png(4, 2))
+    image = load_image(png)
+    assert (image.width, image.height) == (4, 2)
+    assert image.colorspace == "DeviceRGB"
+    assert "/Columns 4" in image.decode_parms
+
+    png.write_bytes(make_png(4, 2, color_type=6))
+    assert load_image(png) is None
+
+
+def test_load_jpeg(tmp_path):
+    """Test reading a JPEG's frame header."""
+    jpeg = tmp_path / "logo.jpg"
+    jpeg.write_bytes(
+        b"\xff\xd8"
+        + b"\xff\xe0"
+        + struct.pack(">H", 4)
+        + b"\x00\x00"
+        + b"\xff\xc0"
+        + struct.pack(">HBHHB", 11, 8, 20, 30, 3)
+        + b"\x00" * 9
+    )
+    image = load_image(jpeg)
+    assert (image.width, image.height) == (30, 20)
+    assert image.colorspace == "DeviceRGB"
+    assert image.filters == "DCTDecode"
+
+
+def test_document_structure(tmp_path):
+    """Test that the document has a consistent cross-reference table."""
+    doc = PdfDocument()
+    page = doc.add_page()
+    page.text(72, 700, "Hello (world)", bold=True)
+    page.line(72, 690, 540, 690)
+    doc.add_page().text(72, 700, "Page 2")
+    path = tmp_path / "out.pdf"
+    doc.save(path)
+
+    data = path.read_bytes()
+    assert data.startswith(b"%PDF-1.4")
+    assert data.rstrip().endswith(b"%%EOF")
+    assert b"/Count 2" in data
+    startxref = int(data.rsplit(b"startxref\n", 1)[1].split(b"\n")[0])
+    assert data[startxref:].startswith(b"xref")
+    offsets = data[startxref:].split(b"\n")[3:]
+    for num, line in enumerate(offsets, start=1):
+        if not line.endswith(b" n "):
+            break
+        assert data[int(line[:10]) :].startswith(f"{num} 0 obj".encode())
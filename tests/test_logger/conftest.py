@@ -5,10 +5,19 @@ from pathlib import Path
 
 import pytest
 
+from time_tracker import settings
 from time_tracker.logger import LoggerMixin
 from time_tracker.logger.logger import DebugCategory
 
 
+@pytest.fixture(autouse=True)
+def per_instance_log_files(mocker):
+    """Give each logger created without a filename its own timestamped
+    file, rather than the shared `log_file` of the default settings."""
+    mocker.patch.object(settings, "log_file", None)
+    mocker.patch.object(settings, "log_max_bytes", 0)
+
+
 @pytest.fixture
 def test_class():
     """Fixture to create a test class using the LoggerMixin class."""
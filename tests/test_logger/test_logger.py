@@ -1,13 +1,16 @@
 """This file contains tests for the LoggerMixin class."""
 
+import json
 import logging
+import logging.handlers
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 
 from time_tracker import settings
-from time_tracker.logger import LoggerMixin
-from time_tracker.logger.logger import DebugCategoryNameFilter
+from time_tracker.logger import LoggerMixin, timed_span
+from time_tracker.logger.logger import DebugCategory, DebugCategoryNameFilter
 
 TEST_TEXT = "Some test text."
 
@@ -190,3 +193,134 @@ def test_logger_duplication_guard():
         handler.close()
     if os.path.exists(test_class.logger_filename):
         os.remove(test_class.logger_filename)
+
+
+def test_queue_logger(tmp_path):
+    """Test that queued records from many threads are all written once
+    the queue is stopped."""
+
+    class QueueTestClass(
+        LoggerMixin
+    ):  # pylint: disable=too-few-public-methods
+        """A test class that logs through the queue."""
+
+    logfile = tmp_path / "queue.log"
+    test_class = QueueTestClass(logger_filename=logfile, use_queue=True)
+    assert isinstance(
+        test_class.logger.handlers[0], logging.handlers.QueueHandler
+    )
+
+    def log_many(thread: int):
+        for i in range(100):
+            test_class.logger.warning("thread %d message %d", thread, i)
+
+    threads = [threading.Thread(target=log_many, args=(t,)) for t in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    LoggerMixin.stop_log_queue()
+
+    lines = logfile.read_text(encoding="utf8").splitlines()
+    assert len(lines) == 400
+    assert "thread 3 message 99" in "\n".join(lines)
+    assert "test_logger.py:" in lines[0]
+    test_class.logger_handler.close()
+
+
+def test_caller_info_only_captured_for_trace(mocker, tmp_path):
+    """Test that the caller's frame is only looked up when TRACE messages
+    would be logged."""
+
+    class QuietClass(LoggerMixin):  # pylint: disable=too-few-public-methods
+        """A test class that inherits LoggerMixin."""
+
+    class TraceClass(LoggerMixin):  # pylint: disable=too-few-public-methods
+        """Another test class that inherits LoggerMixin."""
+
+    spy = mocker.spy(LoggerMixin, "_get_caller_info")
+    quiet = QuietClass(logger_filename=tmp_path / "quiet.log", verbosity=4)
+    assert spy.call_count == 0
+    mocker.stopall()
+
+    trace = TraceClass(logger_filename=tmp_path / "trace.log", verbosity=5)
+    with open(trace.logger_filename, "r", encoding="utf8") as f:
+        lines = f.readlines()
+    assert "Called from: " in lines[1]
+    assert "test_logger.py" in lines[1]
+    assert "in test_caller_info_only_captured_for_trace" in lines[1]
+    quiet.logger_handler.close()
+    trace.logger_handler.close()
+
+
+def test_shared_log_file(mocker, tmp_path):
+    """Test that loggers without a filename share the `log_file` setting,
+    rotated by size."""
+    logfile = tmp_path / "shared.log"
+    mocker.patch.object(settings, "log_file", str(logfile))
+    mocker.patch.object(settings, "log_max_bytes", 200)
+    mocker.patch.object(settings, "log_backup_count", 1)
+
+    class FirstClass(LoggerMixin):  # pylint: disable=too-few-public-methods
+        """A test class that inherits LoggerMixin."""
+
+    class SecondClass(LoggerMixin):  # pylint: disable=too-few-public-methods
+        """Another test class that inherits LoggerMixin."""
+
+    first, second = FirstClass(), SecondClass()
+    assert first.logger_filename == second.logger_filename == logfile
+    assert isinstance(
+        first.logger.handlers[0], logging.handlers.RotatingFileHandler
+    )
+    for _ in range(5):
+        second.logger.error(TEST_TEXT)
+    assert logfile.is_file()
+    assert Path(f"{logfile}.1").is_file()
+    assert not Path(f"{logfile}.2").exists()
+    first.logger_handler.close()
+
+
+def test_json_format_and_timed_span(tmp_path):
+    """Test JSON log lines, including debug categories and span timings."""
+
+    class JsonClass(LoggerMixin):  # pylint: disable=too-few-public-methods
+        """A test class that logs JSON."""
+
+    logfile = tmp_path / "json.log"
+    test_class = JsonClass(
+        logger_filename=logfile, verbosity=3, json_format=True
+    )
+    logger = test_class.logger
+    logger.debug_with_category(TEST_TEXT, category=DebugCategory.MODERATE)
+    with logger.timed("work") as span:
+        span["rows"] = 3
+        sum(range(1000))
+    with timed_span(logger, "skipped", category=DebugCategory.VERBOSE):
+        pass
+    test_class.logger_handler.close()
+
+    records = [
+        json.loads(line)
+        for line in logfile.read_text(encoding="utf8").splitlines()
+    ]
+    assert len(records) == 2
+    assert records[0]["message"] == TEST_TEXT
+    assert records[0]["debug_category"] == DebugCategory.MODERATE
+    assert records[0]["debug_cat_name"] == "[MODERATE]"
+    assert records[0]["funcName"] == "test_json_format_and_timed_span"
+
+    span_record = records[1]
+    assert span_record["span"] == "work"
+    assert span_record["rows"] == 3
+    assert span_record["wall_ms"] >= 0 and span_record["cpu_ms"] >= 0
+    assert span_record["debug_cat_name"] == "[DETAILED]"
+    assert span_record["funcName"] == "test_json_format_and_timed_span"
+    assert span_record["message"].startswith("⏱️ work: ")
+
+
+def test_timed_span_with_plain_mock(mocker):
+    """Test that timed_span works with mocked loggers."""
+    logger = mocker.Mock()
+    with timed_span(logger, "read_csv"):
+        pass
+    assert logger.log.call_args.kwargs["extra"]["span"] == "read_csv"
@@ -0,0 +1,111 @@
+"""This file contains tests for the buckets module."""
+
+import io
+import json
+from datetime import date, datetime
+
+import pytest
+
+from time_tracker.constants import Period
+from time_tracker.reporting import (
+    BucketedReport,
+    bucket_entries,
+    bucket_label,
+    bucket_start,
+    check_period,
+    split_into_buckets,
+)
+
+
+@pytest.mark.parametrize(
+    "period, start, label",
+    [
+        ("day", date(2024, 12, 31), "2024-12-31"),
+        ("week", date(2024, 12, 30), "2025-W01"),
+        ("month", date(2024, 12, 1), "2024-12"),
+    ],
+)
+def test_buckets(period, start, label):
+    """Test the first days and labels of buckets."""
+    assert bucket_start(date(2024, 12, 31), period) == start
+    assert bucket_label(start, period) == label
+
+
+def test_split_into_buckets():
+    """Test splitting entries across buckets, proportionally."""
+    start = datetime(2024, 1, 1, 22)
+    end = datetime(2024, 1, 3, 1)
+    assert list(split_into_buckets(start, end, 2700.0, "day")) == [
+        (date(2024, 1, 1), 200.0),
+        (date(2024, 1, 2), 2400.0),
+        (date(2024, 1, 3), 100.0),
+    ]
+    assert list(split_into_buckets(start, end, 2700.0, "week")) == [
+        (date(2024, 1, 1), 2700.0)
+    ]
+    assert list(
+        split_into_buckets(
+            datetime(2024, 1, 31, 23), datetime(2024, 2, 1, 1), 7200, "month"
+        )
+    ) == [(date(2024, 1, 1), 3600.0), (date(2024, 2, 1), 3600.0)]
+    # Zero-length entries (e.g., date-only ones) go to their start's bucket:
+    assert list(split_into_buckets(start, start, 60.0, "day")) == [
+        (date(2024, 1, 1), 60.0)
+    ]
+
+
+def test_bucket_entries():
+    """Test totaling entries per task IDs and bucket."""
+    entries = [
+        ((1,), 7200.0, datetime(2024, 1, 1, 23), datetime(2024, 1, 2, 1)),
+        ((1,), 600.0, datetime(2024, 1, 2, 9), datetime(2024, 1, 2, 9, 10)),
+        ((1, 2), 60.0, datetime(2024, 1, 2, 9), datetime(2024, 1, 2, 9, 1)),
+    ]
+    assert bucket_entries(entries, Period.DAY) == {
+        (1,): {date(2024, 1, 1): 3600.0, date(2024, 1, 2): 4200.0},
+        (1, 2): {date(2024, 1, 2): 60.0},
+    }
+
+
+def test_bucketed_report(tmp_path):
+    """Test building and exporting a report, with empty periods filled
+    in."""
+    report = BucketedReport.from_totals(
+        "month",
+        {
+            "a": {date(2024, 1, 1): 3600.0, date(2024, 3, 1): 1800.0},
+            "b": {date(2024, 3, 1): 7200.0},
+        },
+    )
+    assert report.periods == ["2024-01", "2024-02", "2024-03"]
+    assert report.hours == [[1.0, 0.0, 0.5], [0.0, 0.0, 2.0]]
+    assert report.totals() == [1.0, 0.0, 2.5]
+
+    f = io.StringIO()
+    report.write_csv(f)
+    assert f.getvalue().splitlines() == [
+        "task,2024-01,2024-02,2024-03",
+        "a,1.00,0.00,0.50",
+        "b,0.00,0.00,2.00",
+        "Total,1.00,0.00,2.50",
+    ]
+    report.save(tmp_path / "report.json")
+    assert json.loads((tmp_path / "report.json").read_text()) == {
+        "period": "month",
+        "periods": ["2024-01", "2024-02", "2024-03"],
+        "hours": {"a": [1.0, 0.0, 0.5], "b": [0.0, 0.0, 2.0]},
+        "total": [1.0, 0.0, 2.5],
+    }
+    report.save(tmp_path / "report.csv")
+    assert (tmp_path / "report.csv").read_text().startswith("task,2024-01")
+
+    with pytest.raises(ValueError, match="Invalid period"):
+        BucketedReport.from_totals("year", {})
+
+
+def test_check_period():
+    """Test that periods are checked by their Period values."""
+    assert check_period("week") is Period.WEEK
+    assert check_period(Period.MONTH) is Period.MONTH
+    with pytest.raises(ValueError, match="Valid periods: day, week, month"):
+        check_period("Week")
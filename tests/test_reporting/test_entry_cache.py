@@ -0,0 +1,78 @@
+"""This file contains tests for the entry_cache module."""
+
+import os
+
+import pytest
+
+from time_tracker.constants import HEADERS
+from time_tracker.reporting import clear_report_cache, load_report_entries
+
+ROWS = [
+    dict(zip(HEADERS, row))
+    for row in (
+        ("2024-01-02T09:00:00", "2024-01-02T10:00:00", "3600.00", "b"),
+        ("2024-01-01T09:00:00", "2024-01-01T09:30:00", "1800.00", "a"),
+        ("2024-01-03T09:00:00", "", "", "running"),
+    )
+]
+
+
+@pytest.fixture(name="entry_file")
+def fixture_entry_file(tmp_path):
+    """An entry file (whose contents the tests don't read)."""
+    path = tmp_path / "entries.csv"
+    path.write_text("entries")
+    return path
+
+
+class Reader:  # pylint: disable=too-few-public-methods
+    """Counts the reads of an entry file."""
+
+    def __init__(self):
+        self.reads = 0
+
+    def __call__(self):
+        self.reads += 1
+        return ROWS
+
+
+def test_load_report_entries(entry_file):
+    """Test that entries are indexed, in start order, without open
+    ones."""
+    entries = load_report_entries(entry_file, Reader())
+    assert entries.index.positions == [1, 0]
+    assert entries.tasks == ["a", "b"]
+    assert entries.durations == [1800.0, 3600.0]
+    assert entries.rows == len(ROWS)
+
+
+def test_reused_while_unchanged(entry_file):
+    """Test that entries are only read again when the file changes."""
+    read = Reader()
+    first = load_report_entries(entry_file, read, snapshot_dir=None)
+    assert load_report_entries(entry_file, read, snapshot_dir=None) is first
+    assert read.reads == 1
+    entry_file.write_text("more entries")
+    load_report_entries(entry_file, read, snapshot_dir=None)
+    assert read.reads == 2
+    # Same size, but a different mtime:
+    stat = entry_file.stat()
+    os.utime(entry_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    load_report_entries(entry_file, read, snapshot_dir=None)
+    assert read.reads == 3
+
+
+def test_snapshot(entry_file, tmp_path):
+    """Test that snapshots let other processes skip reading the file."""
+    snapshot_dir = tmp_path / "cache"
+    read = Reader()
+    first = load_report_entries(entry_file, read, snapshot_dir)
+    assert len(list(snapshot_dir.iterdir())) == 1
+    clear_report_cache()  # As in a new process.
+    again = load_report_entries(entry_file, read, snapshot_dir)
+    assert read.reads == 1
+    assert again.index.positions == first.index.positions
+    entry_file.write_text("more entries")
+    clear_report_cache()
+    load_report_entries(entry_file, read, snapshot_dir)
+    assert read.reads == 2
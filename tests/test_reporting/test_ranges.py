@@ -0,0 +1,85 @@
+"""This file contains tests for the ranges module."""
+
+from datetime import date, datetime
+
+from time_tracker.reporting import IntervalIndex, clip_interval, day_range
+
+
+def dt(day: int, hour: int = 0) -> datetime:
+    """A datetime in January 2024."""
+    return datetime(2024, 1, day, hour)
+
+
+def test_day_range():
+    """Test the half-open range of date filters."""
+    assert day_range(date(2024, 1, 1), date(2024, 1, 31)) == (
+        dt(1),
+        datetime(2024, 2, 1),
+    )
+    assert day_range() == (None, None)
+
+
+def test_clip_interval():
+    """Test clipping entries to a range, proportionally."""
+    lo, hi = dt(2), dt(3)
+    assert clip_interval(dt(1, 22), dt(2, 2), 1440.0, lo, hi) == (
+        lo,
+        dt(2, 2),
+        720.0,
+    )
+    assert clip_interval(dt(2, 22), dt(3, 2), 1440.0, lo, hi) == (
+        dt(2, 22),
+        hi,
+        720.0,
+    )
+    assert clip_interval(dt(2, 1), dt(2, 2), 3599.0, lo, hi) == (
+        dt(2, 1),
+        dt(2, 2),
+        3599.0,
+    )
+    assert clip_interval(dt(1), dt(4), 100.0, None, None)[2] == 100.0
+
+
+def test_interval_index():
+    """Test finding the entries overlapping ranges."""
+    entries = [
+        {"start": "2024-01-05T09:00:00", "end": "2024-01-05T10:00:00"},
+        {"start": "2024-01-01T22:00:00", "end": "2024-01-03T02:00:00"},
+        {"start": "2024-01-03T09:00:00", "end": ""},  # Running.
+        {"start": "2024-01-04", "end": "2024-01-04"},  # Empty.
+        {"start": "2024-01-03T12:00:00+02:00", "end": "2024-01-03T13:00"},
+    ]
+    index = IntervalIndex.from_entries(entries)
+    assert len(index) == 4
+    assert index.positions == [1, 4, 3, 0]
+
+    def overlapping(lo, hi):
+        return [index.positions[i] for i in index.overlapping(lo, hi)]
+
+    assert overlapping(None, None) == [1, 4, 3, 0]
+    assert overlapping(dt(3), dt(4)) == [1, 4]
+    assert overlapping(dt(3, 2), dt(4)) == [4]
+    assert overlapping(dt(4), dt(5)) == [3]
+    assert overlapping(dt(5), None) == [0]
+    assert overlapping(None, dt(1)) == []
+
+
+def test_interval_index_long_span():
+    """Test that a very long entry is still found, without widening the
+    bisection window of the others."""
+    intervals = [(day, dt(day, 9), dt(day, 10)) for day in range(1, 31)] + [
+        (0, dt(1, 12), dt(31))
+    ]
+    index = IntervalIndex(intervals)
+    assert index.max_span.total_seconds() == 3600
+    assert [index.positions[i] for i in index.long] == [0]
+
+    def overlapping(lo, hi):
+        return [index.positions[i] for i in index.overlapping(lo, hi)]
+
+    assert overlapping(dt(20), dt(21)) == [0, 20]
+    assert overlapping(dt(20, 11), dt(21)) == [0]
+    assert overlapping(None, dt(1, 10)) == [1]
+    assert overlapping(dt(31), None) == []
+    # Every interval is found by a full scan:
+    assert sorted(overlapping(None, None)) == list(range(31))
@@ -1,14 +1,16 @@
 """Test the CLI app."""
 
+import json
 import os
 import shutil
 import tempfile
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from time_tracker.constants import SAMPLE_CLIENT_CONFIG_FILE
-from time_tracker.run import app
+from time_tracker.run import ACTION_HANDLERS, app
 from time_tracker.tracker import TimeTracker
 
 CURRENTLY_TRACKING = "Currently tracking task:"
@@ -265,6 +267,58 @@ def test_cli_report_with_task_filter(  # pylint: disable=unused-argument
     shutil.rmtree(temp_dir)
 
 
+def test_cli_preview(mock_tracker_logger):  # pylint: disable=unused-argument
+    """Test the invoice preview action."""
+    temp_dir = create_temp_env()
+    test_file = "preview.csv"
+    args = [
+        "--filename",
+        test_file,
+        "--directory",
+        temp_dir,
+        "--client-config",
+        str(SAMPLE_CLIENT_CONFIG_FILE),
+    ]
+    runner.invoke(app, ["--action", "track", "--task", "A"] + args)
+    runner.invoke(app, ["--action", "track"] + args)
+
+    result = runner.invoke(app, ["--action", "preview"] + args)
+    assert result.exit_code == 0
+    preview = json.loads(result.output)
+    assert preview["client"] == "client1"
+    assert [item["task"] for item in preview["items"]] == ["A"]
+    assert "tex" in preview
+
+    shutil.rmtree(temp_dir)
+
+
+def test_cli_unknown_backend(  # pylint: disable=unused-argument
+    mock_tracker_logger,
+):
+    """Test that an unknown invoice backend is rejected as a bad option."""
+    temp_dir = create_temp_env()
+    result = runner.invoke(
+        app,
+        [
+            "--action",
+            "invoice",
+            "--backend",
+            "bob",
+            "--filename",
+            "backend.csv",
+            "--directory",
+            temp_dir,
+            "--client-config",
+            str(SAMPLE_CLIENT_CONFIG_FILE),
+        ],
+    )
+    assert result.exit_code == 2  # Usage error, rather than a traceback.
+    assert "Invalid value for '--backend'" in result.output
+    assert not (Path(temp_dir) / "backend.csv").exists()
+
+    shutil.rmtree(temp_dir)
+
+
 def test_cli_invalid_date_filter(  # pylint: disable=unused-argument
     mock_tracker_logger,
 ):
@@ -359,6 +413,7 @@ def test_main_actions(mocker):
     mock_tracker.report = mocker.Mock()
     mock_tracker.generate_invoice = mocker.Mock()
     mock_tracker.init_config = mocker.Mock()
+    mock_tracker.preview_invoice = mocker.Mock(return_value={})
     mocker.patch("time_tracker.run.TimeTracker", return_value=mock_tracker)
     from time_tracker.run import (  # pylint: disable=import-outside-toplevel
         main,
@@ -372,5 +427,172 @@ def test_main_actions(mocker):
     mock_tracker.report.assert_called_once()
     main(action=mock_tracker.actions.INVOICE.value)
     mock_tracker.generate_invoice.assert_called_once()
+    main(action=mock_tracker.actions.PREVIEW.value)
+    mock_tracker.preview_invoice.assert_called_once()
+    main(action=mock_tracker.actions.NORMALIZE.value)
+    mock_tracker.normalize_entries.assert_called_once()
     main(action=mock_tracker.actions.INNITIALIZE.value)
     mock_tracker.init_config.assert_called_once()
+
+
+def test_action_handlers():
+    """Test that every tracker action has a handler."""
+    assert set(ACTION_HANDLERS) == set(TimeTracker.TrackerActions)
+
+
+@pytest.mark.usefixtures("mock_tracker_logger")
+def test_cli_profile(mocker, tmp_path):
+    """Test that --profile profiles the action."""
+    mocker.patch("time_tracker.run.DEFAULT_PROFILE_DIR", tmp_path)
+    temp_dir = create_temp_env()
+    args = [
+        "--filename",
+        "profile.csv",
+        "--directory",
+        temp_dir,
+        "--client-config",
+        str(SAMPLE_CLIENT_CONFIG_FILE),
+    ]
+    result = runner.invoke(app, ["--action", "status", "--profile"] + args)
+    assert result.exit_code == 0
+    assert "Profile written to" in result.output
+    assert len(list(tmp_path.glob("*-status.prof"))) == 1
+    shutil.rmtree(temp_dir)
+
+
+@pytest.mark.usefixtures("mock_tracker_logger")
+def test_cli_import(tmp_path):
+    """Test importing entries from a JSON lines file."""
+    temp_dir = create_temp_env()
+    import_file = tmp_path / "history.jsonl"
+    import_file.write_text(
+        '{"start": "2024-01-01T09:00:00", "end": "2024-01-01T10:00:00", '
+        '"task": "planning and design"}\n'
+    )
+    args = [
+        "--action",
+        "import",
+        "--filename",
+        "import.csv",
+        "--directory",
+        temp_dir,
+        "--client-config",
+        str(SAMPLE_CLIENT_CONFIG_FILE),
+    ]
+    result = runner.invoke(app, args)
+    assert result.exit_code != 0  # No --import-file.
+
+    result = runner.invoke(app, args + ["--import-file", str(import_file)])
+    assert result.exit_code == 0
+    assert "Imported 1 entries" in result.output
+    lines = (Path(temp_dir) / "import.csv").read_text().splitlines()
+    assert lines[-1] == (
+        "2024-01-01T09:00:00,2024-01-01T10:00:00,3600.00," '"planning, design"'
+    )
+    shutil.rmtree(temp_dir)
+
+
+@pytest.mark.usefixtures("mock_tracker_logger")
+def test_cli_sort():
+    """Test the sort action."""
+    temp_dir = create_temp_env()
+    path = Path(temp_dir) / "sort.csv"
+    path.write_text(
+        "start,end,duration (s),task\r\n"
+        "2024-01-02T09:00:00,2024-01-02T10:00:00,3600.00,b\r\n"
+        "2024-01-01T09:00:00,2024-01-01T10:00:00,3600.00,a\r\n"
+    )
+    result = runner.invoke(
+        app,
+        [
+            "--action",
+            "sort",
+            "--fix-overlaps",
+            "--filename",
+            "sort.csv",
+            "--directory",
+            temp_dir,
+            "--client-config",
+            str(SAMPLE_CLIENT_CONFIG_FILE),
+        ],
+    )
+    assert result.exit_code == 0
+    assert json.loads(result.output)["was_sorted"] is False
+    assert path.read_text().splitlines()[1].endswith(",a")
+    shutil.rmtree(temp_dir)
+
+
+@pytest.mark.usefixtures("mock_tracker_logger")
+def test_cli_convert():
+    """Test converting a client's file to the binary format and back."""
+    temp_dir = create_temp_env()
+    path = Path(temp_dir) / "convert.csv"
+    path.write_text(
+        "start,end,duration (s),task\r\n"
+        "2024-01-01T09:00:00,2024-01-01T10:00:00,3600.00,a\r\n"
+    )
+    args = [
+        "--action",
+        "convert",
+        "--directory",
+        temp_dir,
+        "--client-config",
+        str(SAMPLE_CLIENT_CONFIG_FILE),
+    ]
+    result = runner.invoke(app, args + ["--filename", "convert.csv"])
+    assert result.exit_code != 0  # No --convert-to.
+
+    binary = Path(temp_dir) / "convert.ttb"
+    result = runner.invoke(
+        app,
+        args + ["--filename", "convert.csv", "--convert-to", str(binary)],
+    )
+    assert result.exit_code == 0
+    assert "Converted 1 entries" in result.output
+
+    back = Path(temp_dir) / "back.csv"
+    result = runner.invoke(
+        app,
+        args + ["--filename", "convert.ttb", "--convert-to", str(back)],
+    )
+    assert result.exit_code == 0
+    assert back.read_bytes() == path.read_bytes()
+    shutil.rmtree(temp_dir)
+
+
+@pytest.mark.usefixtures("mock_tracker_logger")
+def test_cli_bucketed_report():
+    """Test the report action with a period."""
+    temp_dir = create_temp_env()
+    (Path(temp_dir) / "buckets.csv").write_text(
+        "start,end,duration (s),task\r\n"
+        "2024-01-01T09:00:00,2024-01-01T10:00:00,3600.00,a\r\n"
+    )
+    args = [
+        "--action",
+        "report",
+        "--filename",
+        "buckets.csv",
+        "--directory",
+        temp_dir,
+        "--client-config",
+        str(SAMPLE_CLIENT_CONFIG_FILE),
+    ]
+    result = runner.invoke(app, args + ["--period", "day"])
+    assert result.exit_code == 0
+    assert result.output.splitlines()[:2] == ["task,2024-01-01", "a,1.00"]
+
+    report_file = Path(temp_dir) / "report.json"
+    result = runner.invoke(app, args + ["--report-file", str(report_file)])
+    assert result.exit_code != 0  # No --period.
+    result = runner.invoke(
+        app,
+        args + ["--period", "month", "--report-file", str(report_file)],
+    )
+    assert result.exit_code == 0
+    assert json.loads(report_file.read_text())["hours"] == {"a": [1.0]}
+
+    result = runner.invoke(app, args + ["--period", "fortnight"])
+    assert result.exit_code == 2  # Usage error, listing the periods.
+    assert "Invalid value for '--period'" in result.output
+    shutil.rmtree(temp_dir)
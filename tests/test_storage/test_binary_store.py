@@ -0,0 +1,169 @@
+"""This file contains tests for the binary_store module."""
+
+import csv
+
+import pytest
+
+from time_tracker.constants import HEADERS
+from time_tracker.storage import BinaryEntryStore, convert_entry_file
+from time_tracker.storage.binary_store import NONE, RECORD_SIZE, TaskDictionary
+
+ENTRIES = [
+    dict(
+        zip(
+            HEADERS,
+            [
+                "2024-01-01T09:00:00",
+                "2024-01-01T10:00:00.250000",
+                "3600.25",
+                "planning, design",
+            ],
+        )
+    ),
+    dict(zip(HEADERS, ["2024-01-02", "2024-01-03", "86400.00", ""])),
+    dict(zip(HEADERS, ["1969-12-31T23:59:59", "", "", 'ünïcödé, "quoted"'])),
+]
+
+
+@pytest.fixture(name="store")
+def fixture_store(tmp_path):
+    """A fixture binary store with entries."""
+    store = BinaryEntryStore(tmp_path / "entries.ttb")
+    store.append(ENTRIES)
+    return store
+
+
+def test_roundtrip(store):
+    """Test that entries are read back as they were written."""
+    assert list(store.entries()) == ENTRIES
+    assert len(store) == len(ENTRIES)
+    assert store.path.stat().st_size == (len(ENTRIES) + 1) * RECORD_SIZE
+    assert store.last_entry() == ENTRIES[-1]
+    # Tasks are stored once:
+    store.append(ENTRIES)
+    assert len(store.task_dictionary.path.read_text().splitlines()) == 3
+
+
+def test_empty_store(tmp_path):
+    """Test a store without entries."""
+    store = BinaryEntryStore(tmp_path / "empty.ttb")
+    store.ensure_exists()
+    assert not list(store.entries())
+    assert store.last_entry() is None
+    with pytest.raises(ValueError, match="no entries"):
+        store.close_last("2024-01-01T10:00:00", "1.00")
+
+
+def test_close_last(store):
+    """Test that closing the last entry only overwrites its end, duration
+    and task."""
+    before = store.path.read_bytes()
+    store.close_last("2024-01-01T00:00:01", "1.50", task="done")
+    after = store.path.read_bytes()
+    assert len(after) == len(before)
+    changed = [i for i, (a, b) in enumerate(zip(before, after)) if a != b]
+    assert min(changed) >= len(before) - RECORD_SIZE + 8
+    assert max(changed) < len(before) - RECORD_SIZE + 28
+    assert store.last_entry() == dict(
+        zip(
+            HEADERS,
+            ["1969-12-31T23:59:59", "2024-01-01T00:00:01", "1.50", "done"],
+        )
+    )
+    with pytest.raises(ValueError, match="must be a datetime"):
+        store.close_last("2024-01-01", "1.00")
+
+
+def test_close_last_closed(store):
+    """Test that a closed last entry isn't overwritten (e.g., by a stray
+    stop)."""
+    store.close_last("2024-01-01T00:00:01", "1.50")
+    before = store.path.read_bytes()
+    with pytest.raises(ValueError, match="already closed"):
+        store.close_last("2024-01-02T00:00:00", "2.00")
+    assert store.path.read_bytes() == before
+
+
+def test_torn_record(store):
+    """Test that a partial record at the end of the file (e.g., from an
+    interrupted append) is ignored by readers, and truncated by the next
+    append."""
+    whole = store.path.read_bytes()
+    with store.path.open("ab") as f:
+        f.write(b"\x01" * (RECORD_SIZE // 2))
+    with pytest.warns(RuntimeWarning, match="partial record"):
+        assert list(store.entries()) == ENTRIES
+    with pytest.warns(RuntimeWarning, match="partial record"):
+        assert store.last_entry() == ENTRIES[-1]
+    with pytest.warns(RuntimeWarning, match="Truncated a partial record"):
+        store.append(ENTRIES[:1])
+    assert store.path.read_bytes()[: len(whole)] == whole
+    assert list(store.entries()) == ENTRIES + ENTRIES[:1]
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        (HEADERS[0], "2024-01-01T09:00:00+01:00"),
+        (HEADERS[0], "2024-01-01 09:00:00"),
+        (HEADERS[0], ""),
+        (HEADERS[1], "20240101"),
+        (HEADERS[2], "12"),
+        (HEADERS[2], "1.234"),
+    ],
+)
+def test_rejects_lossy_values(tmp_path, field, value):
+    """Test that values that wouldn't be read back as written are
+    rejected, and nothing is written."""
+    store = BinaryEntryStore(tmp_path / "entries.ttb")
+    with pytest.raises(ValueError):
+        store.append(ENTRIES + [{**ENTRIES[0], field: value}])
+    assert not store.path.exists()
+
+
+def test_read_array(store):
+    """Test reading the records as a numpy array."""
+    np = pytest.importorskip("numpy")
+    array = store.read_array()
+    assert len(array) == len(ENTRIES)
+    assert array["duration"].tolist() == [360025, 8640000, NONE]
+    assert array["end"][-1] == NONE
+    assert array["start"][-1] == -1_000_000
+    assert np.all(array["end"][:2] > array["start"][:2])
+    tasks = store.task_dictionary
+    assert [tasks.get_task(i) for i in array["task"]] == [
+        entry[HEADERS[-1]] for entry in ENTRIES
+    ]
+
+
+def test_header_checked(tmp_path):
+    """Test that files without the header are rejected."""
+    path = tmp_path / "entries.ttb"
+    path.write_text("start,end,duration (s),task\r\n")
+    with pytest.raises(ValueError, match="isn't a binary entry file"):
+        list(BinaryEntryStore(path).entries())
+
+
+def test_task_dictionary_shared(tmp_path):
+    """Test that tasks added by another dictionary (e.g., process) are
+    found rather than added again."""
+    first = TaskDictionary(tmp_path / "tasks")
+    second = TaskDictionary(tmp_path / "tasks")
+    assert first.get_id("a") == 0
+    assert second.get_id("b") == 1
+    assert first.get_id("b") == 1
+    assert second.get_task(0) == "a"
+
+
+def test_convert_entry_file(tmp_path, store):
+    """Test converting between CSV and binary files, losslessly."""
+    csv_path = tmp_path / "entries.csv"
+    assert convert_entry_file(store.path, csv_path) == len(ENTRIES)
+    with csv_path.open(newline="", encoding="utf-8") as f:
+        assert list(csv.DictReader(f)) == ENTRIES
+
+    back = tmp_path / "back.ttb"
+    assert convert_entry_file(csv_path, back) == len(ENTRIES)
+    assert list(BinaryEntryStore(back).entries()) == ENTRIES
+    assert convert_entry_file(back, tmp_path / "again.csv") == len(ENTRIES)
+    assert (tmp_path / "again.csv").read_bytes() == csv_path.read_bytes()
@@ -0,0 +1,75 @@
+"""This file contains tests for the task_registry module."""
+
+from time_tracker.storage import (
+    TaskDictionary,
+    TaskRegistry,
+    task_registry_path,
+)
+from time_tracker.utils import split_task_names
+
+
+def make_registry(tmp_path):
+    """Make a registry for an entry file in tmp_path."""
+    return TaskRegistry(
+        TaskDictionary(task_registry_path(tmp_path / "entries.csv")),
+        split_task_names,
+    )
+
+
+def test_register_and_intern(tmp_path):
+    """Test that task strings are interned by their tasks' IDs."""
+    registry = make_registry(tmp_path)
+    assert registry.path == tmp_path / "entries.csv.task_ids"
+    assert registry.register("a, b") == (0, 1)
+    assert registry.intern("b and a, b") == (1, 0)
+    assert registry.join((1, 0)) == "b, a"
+    assert registry.path.read_text().splitlines() == ['"a"', '"b"']
+
+    # IDs are stable across registries (e.g., processes):
+    other = make_registry(tmp_path)
+    assert other.register("c, a") == (2, 0)
+    registry.refresh()
+    assert registry.intern("c") == (2,)
+
+
+def test_intern_doesnt_write(tmp_path):
+    """Test that interning unregistered tasks gives them temporary IDs,
+    without writing the registry."""
+    registry = make_registry(tmp_path)
+    registry.register("a")
+    before = registry.path.read_bytes()
+    ids = registry.intern("a, new")
+    assert ids[0] == 0
+    assert ids[1] < 0
+    assert registry.join(ids) == "a, new"
+    assert registry.intern("new") == ids[1:]
+    assert registry.path.read_bytes() == before
+
+    # Registering replaces the temporary IDs:
+    assert registry.register("a, new") == (0, 1)
+    assert registry.intern("a, new") == (0, 1)
+
+
+def test_persist(tmp_path):
+    """Test registering the tasks that have temporary IDs."""
+    registry = make_registry(tmp_path)
+    registry.register("a")
+    assert registry.intern("b, a")[0] < 0
+    registry.persist()
+    assert registry.path.read_text().splitlines() == ['"a"', '"b"']
+    assert registry.intern("b, a") == (1, 0)
+    assert registry.intern("c")[0] < 0
+
+
+def test_lookup_isnt_persisted(tmp_path):
+    """Test that looked up tasks (e.g., filters) are only registered if
+    they're also interned."""
+    registry = make_registry(tmp_path)
+    registry.register("a")
+    typo = registry.lookup("a, typo")
+    assert typo[0] == 0
+    assert typo[1] < 0
+    assert registry.intern("typo") == typo[1:]  # The same temporary ID.
+    assert registry.lookup("b")[0] < 0
+    registry.persist()
+    assert registry.path.read_text().splitlines() == ['"a"', '"typo"']
@@ -1,16 +1,21 @@
 """This file contains tests for the TimeTracker class."""
 
 import csv
+import json
 import os
 import tempfile
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from subprocess import CalledProcessError
 
 import pytest
 
 from time_tracker import TimeTracker
-from time_tracker.constants import HEADERS, ColumnHeaders
+from time_tracker.constants import (
+    HEADERS,
+    SAMPLE_CLIENT_CONFIG_FILE,
+    ColumnHeaders,
+)
 
 INVALID_DATE_FORMAT = "Invalid date format"
 NO_ENTRIES = "No matching entries"
@@ -270,6 +275,26 @@ def test_client_not_in_client_config(capsys):
     assert tracker.filepath == Path(temp_dir) / filename
 
 
+def test_client_config_directory(tmp_path):
+    """Tests a tracker using a client config directory."""
+    client_dir = tmp_path / "clients"
+    client_dir.mkdir()
+    client = json.loads(SAMPLE_CLIENT_CONFIG_FILE.read_text())["clients"][
+        "client1"
+    ]
+    (client_dir / "acme.json").write_text(
+        json.dumps(client | {"filename": "acme.csv"})
+    )
+    tracker = TimeTracker(
+        directory=tmp_path,
+        client="acme",
+        client_config_file=client_dir,
+        logger_filename=tmp_path / "log.log",
+    )
+    assert tracker.filepath == tmp_path / "acme.csv"
+    assert tracker.client_config.clients["acme"].rate == client["rate"]
+
+
 def test_generate_invoice(
     tmp_path, mocker, mock_tracker_logger
 ):  # pylint: disable=unused-argument,too-many-locals
@@ -308,7 +333,9 @@ def test_generate_invoice(
     mock_logger = mocker.Mock()
     tracker.logger = mock_logger
 
-    mock_run = mocker.patch("time_tracker.tracker.subprocess.run")
+    mock_run = mocker.patch(
+        "time_tracker.invoice.latex_backend.subprocess.run"
+    )
 
     # Run invoice generator:
     tracker.generate_invoice()
@@ -354,7 +381,9 @@ def test_generate_invoice(
         """Mock error"""
         raise error
 
-    mocker.patch("time_tracker.tracker.subprocess.run", mock_error)
+    mocker.patch(
+        "time_tracker.invoice.latex_backend.subprocess.run", mock_error
+    )
     tracker.generate_invoice(invoice_filename=tex_filename)
     assert (
         mocker.call("❌ Failed to compile LaTeX invoice: %s", error)
@@ -433,3 +462,437 @@ def test_init_config(
     assert dest_template.read_text() == template
     assert dest_me.read_text() == empty_dict_str
     assert dest_state.read_text() == empty_dict_str
+
+
+def test_generate_invoice_pdf_backend(
+    tmp_path, mocker, mock_tracker_logger
+):  # pylint: disable=unused-argument
+    """Test generate_invoice with the native PDF backend."""
+    mocker.patch(
+        "time_tracker.tracker.get_next_invoice_number", return_value=999
+    )
+    mock_logo = mocker.patch("time_tracker.tracker.prepare_logo_for_latex")
+    mock_run = mocker.patch(
+        "time_tracker.invoice.latex_backend.subprocess.run"
+    )
+    tracker = TimeTracker(directory=tmp_path)
+    tracker.logger = mocker.Mock()
+    tracker.generate_report = mocker.Mock(
+        return_value=({"dev": 3600}, [datetime(2023, 1, 1)] * 2)
+    )
+
+    invoice_filename = tmp_path / "invoice.pdf"
+    tracker.generate_invoice(invoice_filename=invoice_filename, backend="pdf")
+    assert invoice_filename.read_bytes().startswith(b"%PDF")
+    assert not invoice_filename.with_suffix(".tex").exists()
+    mock_logo.assert_not_called()
+    mock_run.assert_not_called()
+    assert tracker.counters["render_ms"] > 0
+    assert tracker.counters["pdflatex_ms"] == 0
+
+    with pytest.raises(ValueError):
+        tracker.generate_invoice(
+            invoice_filename=invoice_filename, backend="bogus"
+        )
+
+
+def test_preview_invoice(tmp_path, temp_tracker):
+    """Test that previewing an invoice doesn't consume an invoice number
+    or write any files."""
+    tracker = temp_tracker
+    manual_entries(tracker)
+    state_file = tmp_path / "invoice_state.json"
+    state_file.write_text('{"last_invoice_number": 10}')
+    files_before = sorted(tracker.filepath.parent.rglob("*"))
+
+    preview = tracker.preview_invoice(invoice_state_file=state_file)
+    assert preview["invoice_number"] == 11
+    assert state_file.read_text() == '{"last_invoice_number": 10}'
+    assert sorted(item["task"] for item in preview["items"]) == ["A", "B"]
+    assert preview["total"] == pytest.approx(
+        sum(item["total"] for item in preview["items"])
+    )
+    assert "\\begin{document}" in preview["tex"]
+    assert "11" in preview["tex"]
+    assert sorted(tracker.filepath.parent.rglob("*")) == files_before
+
+
+def test_counters(temp_tracker):
+    """Test that counters are collected per action."""
+    tracker = temp_tracker
+    manual_entries(tracker)
+    size = tracker.filepath.stat().st_size
+    rows = len(tracker.get_all_entries())
+
+    tracker.report()
+    assert tracker.counters["rows_parsed"] == rows
+    assert tracker.counters["bytes_read"] == size
+    tracker.status()
+    assert tracker.counters["rows_parsed"] == rows
+    # The unchanged file's entries are reused (see load_report_entries):
+    tracker.preview_invoice()
+    assert tracker.counters["rows_parsed"] == 0
+    assert tracker.counters["render_ms"] > 0
+    manual_entries(tracker)
+    tracker.preview_invoice()
+    assert tracker.counters["rows_parsed"] == len(tracker.get_all_entries())
+
+
+def test_import_entries(temp_tracker):
+    """Test importing a batch of entries, including another tracker's
+    rows with extra columns."""
+    tracker = temp_tracker
+    imported = tracker.import_entries(
+        [
+            {
+                ColumnHeaders.START.value: "2024-01-01T09:00:00",
+                ColumnHeaders.END.value: "2024-01-01T09:30:00",
+                ColumnHeaders.DURATION.value: "12",  # Recomputed.
+                ColumnHeaders.TASK.value: "planning and design, planning",
+                "billed": "yes",
+            },
+            {ColumnHeaders.START.value: "2024-01-02", "task": "open"},
+        ]
+    )
+    assert imported == 2
+    assert tracker.counters["rows_imported"] == 2
+    assert tracker.get_all_entries() == [
+        {
+            ColumnHeaders.START.value: "2024-01-01T09:00:00",
+            ColumnHeaders.END.value: "2024-01-01T09:30:00",
+            ColumnHeaders.DURATION.value: "1800.00",
+            ColumnHeaders.TASK.value: "planning, design",
+        },
+        {
+            ColumnHeaders.START.value: "2024-01-02",
+            ColumnHeaders.END.value: "",
+            ColumnHeaders.DURATION.value: "",
+            ColumnHeaders.TASK.value: "open",
+        },
+    ]
+
+
+def test_import_entries_invalid(temp_tracker):
+    """Test that nothing is imported if any entry is invalid."""
+    tracker = temp_tracker
+    before = tracker.filepath.read_bytes()
+    entries = [
+        {
+            ColumnHeaders.START.value: "2024-01-01T09:00:00",
+            ColumnHeaders.END.value: "2024-01-01T10:00:00",
+        },
+        {ColumnHeaders.START.value: "yesterday"},
+        {
+            ColumnHeaders.START.value: "2024-01-02T09:00:00",
+            ColumnHeaders.END.value: "2024-01-01T09:00:00",
+        },
+        {ColumnHeaders.TASK.value: "no start"},
+    ]
+    with pytest.raises(ValueError, match="3 invalid entries") as exc_info:
+        tracker.import_entries(entries, max_errors=2)
+    message = str(exc_info.value)
+    assert "Entry 2:" in message and "Entry 3:" in message
+    assert "Entry 4:" not in message and "1 more" in message
+    assert tracker.filepath.read_bytes() == before
+
+
+def test_import_entries_open_not_last(temp_tracker):
+    """Test that only the last imported entry can be open."""
+    tracker = temp_tracker
+    before = tracker.filepath.read_bytes()
+    entries = [
+        {ColumnHeaders.START.value: "2024-01-01T09:00:00"},
+        {
+            ColumnHeaders.START.value: "2024-01-02T09:00:00",
+            ColumnHeaders.END.value: "2024-01-02T10:00:00",
+        },
+    ]
+    with pytest.raises(ValueError, match="Entry 1: Missing end"):
+        tracker.import_entries(entries)
+    assert tracker.filepath.read_bytes() == before
+
+
+def test_import_entries_while_running(temp_tracker, capsys):
+    """Test that nothing is imported while the timer is running, which
+    would leave the open entry in the middle of the file."""
+    tracker = temp_tracker
+    tracker.track("running")
+    capsys.readouterr()
+    before = tracker.filepath.read_bytes()
+    with pytest.raises(ValueError, match="timer is running"):
+        tracker.import_entries(
+            [
+                {
+                    ColumnHeaders.START.value: "2024-01-01T09:00:00",
+                    ColumnHeaders.END.value: "2024-01-01T10:00:00",
+                }
+            ]
+        )
+    assert tracker.filepath.read_bytes() == before
+    tracker.status()
+    assert "running" in capsys.readouterr().out
+
+
+def write_entries(tracker, rows):
+    """Write (start, end, task) entries to the tracker's file."""
+    tracker.safe_write_csv(
+        {
+            ColumnHeaders.START.value: start,
+            ColumnHeaders.END.value: end,
+            ColumnHeaders.DURATION.value: "",
+            ColumnHeaders.TASK.value: task,
+        }
+        for start, end, task in rows
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [2, 100_000])
+def test_sort_entries(temp_tracker, chunk_size):
+    """Test sorting, deduplicating and reporting overlaps."""
+    tracker = temp_tracker
+    rows = [
+        ("2024-01-02T09:00:00", "2024-01-02T10:00:00", "b"),
+        ("2024-01-01T09:00:00", "2024-01-01T10:00:00", "a"),
+        ("2024-01-02T09:00:00", "2024-01-02T10:00:00", "b"),
+        ("2024-01-02T09:30:00", "2024-01-02T11:00:00", "c"),
+        ("2024-01-03T09:00:00", "", "open"),
+    ]
+    write_entries(tracker, rows)
+    report = tracker.sort_entries(chunk_size=chunk_size)
+    assert report["rows_read"] == 5
+    assert report["rows_written"] == 4
+    assert report["duplicates"] == 1
+    assert report["overlaps"] == 1
+    assert report["overlaps_fixed"] == 0
+    assert not report["was_sorted"]
+    assert len(report["overlap_examples"]) == 1
+    assert [
+        entry[ColumnHeaders.TASK.value] for entry in tracker.get_all_entries()
+    ] == ["a", "b", "c", "open"]
+
+    report = tracker.sort_entries(fix_overlaps=True, chunk_size=chunk_size)
+    assert report["was_sorted"]
+    assert report["overlaps_fixed"] == 1
+    fixed = tracker.get_all_entries()[2]
+    assert fixed[ColumnHeaders.START.value] == "2024-01-02T10:00:00"
+    assert fixed[ColumnHeaders.DURATION.value] == "3600.00"
+    assert tracker.sort_entries()["overlaps"] == 0
+
+
+def test_sort_entries_contained_overlap_and_invalid(temp_tracker):
+    """Test that fully overlapped entries are dropped when fixing, and
+    that an invalid start leaves the file untouched."""
+    tracker = temp_tracker
+    write_entries(
+        tracker,
+        [
+            ("2024-01-01T09:00:00", "2024-01-01T12:00:00", "a"),
+            ("2024-01-01T10:00:00", "2024-01-01T11:00:00", "b"),
+        ],
+    )
+    report = tracker.sort_entries(fix_overlaps=True)
+    assert report["rows_written"] == 1
+    assert len(tracker.get_all_entries()) == 1
+
+    write_entries(tracker, [("not a date", "", "a")])
+    before = tracker.filepath.read_bytes()
+    with pytest.raises(ValueError):
+        tracker.sort_entries()
+    assert tracker.filepath.read_bytes() == before
+    assert not list(tracker.filepath.parent.glob(".*.sorting"))
+
+
+def test_binary_entry_file(temp_tracker, capsys):
+    """Test tracking with a binary (.ttb) entry file."""
+    tracker = TimeTracker(
+        filename="test.ttb",
+        directory=temp_tracker.filepath.parent,
+        client_config_file=SAMPLE_CLIENT_CONFIG_FILE,
+    )
+    assert tracker.store is not None
+    assert not tracker.get_all_entries()
+
+    tracker.track(task="Work")
+    size = tracker.filepath.stat().st_size
+    tracker.track(task="more work")
+    assert tracker.filepath.stat().st_size == size  # Closed in place.
+    (entry,) = tracker.get_all_entries()
+    assert entry[ColumnHeaders.TASK.value] == "Work, more work"
+    assert float(entry[ColumnHeaders.DURATION.value]) >= 0
+    assert tracker.get_last_entry() == entry
+
+    assert tracker.import_entries(
+        [
+            {
+                ColumnHeaders.START.value: "2024-01-01T09:00:00",
+                ColumnHeaders.END.value: "2024-01-01T10:00:00",
+                ColumnHeaders.TASK.value: "Work",
+            }
+        ]
+    )
+    tracker.report(start_date="2024-01-01", end_date="2024-01-01")
+    assert "Work: 1.00 h" in capsys.readouterr().out
+    # Tasks are registered in the store's own task dictionary:
+    assert tracker.task_registry.dictionary is tracker.store.task_dictionary
+    tracker.report()  # Registers all the entries' tasks.
+    tasks_file = tracker.task_registry.path.read_bytes()
+    tracker.report(filter_task="typo")
+    assert tracker.task_registry.path.read_bytes() == tasks_file
+    with pytest.raises(ValueError, match="binary"):
+        tracker.sort_entries()
+
+
+def test_report_split_tasks(temp_tracker, capsys):
+    """Test reporting by combination of tasks, and split across tasks."""
+    tracker = temp_tracker
+    tracker.safe_write_csv(
+        dict(zip(HEADERS, row))
+        for row in [
+            ("2024-01-01T09:00:00", "2024-01-01T11:00:00", "7200", "a, b"),
+            ("2024-01-01T11:00:00", "2024-01-01T12:00:00", "3600", "b and a"),
+            ("2024-01-01T12:00:00", "2024-01-01T13:00:00", "3600", "a,b"),
+            ("2024-01-01T13:00:00", "2024-01-01T14:00:00", "3600", "a"),
+            ("2024-01-01T14:00:00", "2024-01-01T15:00:00", "3600", ""),
+        ]
+    )
+    totals, _ = tracker.generate_report()
+    assert totals == {
+        "a, b": 10800.0,
+        "b, a": 3600.0,
+        "a": 3600.0,
+        "Unspecified": 3600.0,
+    }
+    totals, _ = tracker.generate_report(filter_task="a and b")
+    assert totals == {"a, b": 10800.0}
+
+    totals, _ = tracker.generate_report(split_tasks=True)
+    assert totals == {"a": 10800.0, "b": 7200.0, "Unspecified": 3600.0}
+    totals, _ = tracker.generate_report(filter_task="b", split_tasks=True)
+    assert totals == {"b": 7200.0}
+    # Generating reports (e.g., for previews) doesn't register tasks, and
+    # neither does tracking:
+    tracker.track("c and a")
+    tracker.track()
+    assert not tracker.task_registry.path.exists()
+
+    tracker.report(split_tasks=True)
+    assert "  b: 2.00 h" in capsys.readouterr().out
+    assert tracker.task_registry.path.read_text().splitlines() == [
+        '"a"',
+        '"b"',
+        '"Unspecified"',
+        '"c"',
+    ]
+    totals, _ = tracker.generate_report(split_tasks=True)
+    assert "c" in totals
+
+    # Filtering by tasks no entry has doesn't register them:
+    before = tracker.task_registry.path.read_bytes()
+    tracker.report(filter_task="typo")
+    tracker.report_buckets(filter_task="a, typo", split_tasks=True)
+    assert tracker.task_registry.path.read_bytes() == before
+
+
+@pytest.mark.parametrize("filename", ["test.csv", "test.ttb"])
+def test_normalize_entries(temp_tracker, filename):
+    """Test re-normalizing the tasks of a file, in chunks."""
+    tracker = TimeTracker(
+        filename=filename,
+        directory=temp_tracker.filepath.parent / "normalize",
+        client_config_file=SAMPLE_CLIENT_CONFIG_FILE,
+    )
+    tasks = ["a and b", "a, b", "", "b,b , c", "c"] * 3
+    rows = [
+        dict(
+            zip(
+                HEADERS,
+                [f"2024-01-01T0{i // 10}:0{i % 10}:00", "", "", task],
+            )
+        )
+        for i, task in enumerate(tasks)
+    ]
+    tracker.safe_write_csv(rows)
+    assert tracker.normalize_entries(chunk_size=4) == 6
+    assert tracker.counters["rows_parsed"] == len(tasks)
+    assert [
+        entry[ColumnHeaders.TASK.value] for entry in tracker.get_all_entries()
+    ] == ["a, b", "a, b", "", "b, c", "c"] * 3
+    assert tracker.normalize_entries() == 0
+    assert not list(tracker.filepath.parent.glob(".*"))
+
+
+def test_generate_bucketed_report(temp_tracker, capsys, tmp_path):
+    """Test a report of hours per task and day, matching daily reports."""
+    tracker = temp_tracker
+    tracker.safe_write_csv(
+        dict(zip(HEADERS, row))
+        for row in [
+            ("2024-01-01T09:00:00", "2024-01-01T11:00:00", "7200", "a"),
+            ("2024-01-01T23:00:00", "2024-01-02T01:00:00", "7200", "a, b"),
+            ("2024-01-04T09:00:00", "2024-01-04T10:00:00", "3600", "b"),
+        ]
+    )
+    report = tracker.generate_bucketed_report("day")
+    assert report.periods == [
+        "2024-01-01",
+        "2024-01-02",
+        "2024-01-03",
+        "2024-01-04",
+    ]
+    assert report.tasks == ["a", "a, b", "b"]
+    assert report.hours == [
+        [2.0, 0.0, 0.0, 0.0],
+        [1.0, 1.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ]
+    report = tracker.generate_bucketed_report(
+        "week", filter_task="b", split_tasks=True
+    )
+    assert report.periods == ["2024-W01"]
+    assert report.hours == [[2.0]]
+    with pytest.raises(ValueError, match="Invalid period"):
+        tracker.generate_bucketed_report("year")
+
+    tracker.report_buckets("day", start_date="2024-01-04")
+    assert capsys.readouterr().out.splitlines() == [
+        "task,2024-01-04",
+        "b,1.00",
+        "Total,1.00",
+    ]
+    tracker.report_buckets("day", start_date="2024-02-01")
+    assert NO_ENTRIES in capsys.readouterr().out
+    tracker.report_buckets("month", report_file=tmp_path / "report.json")
+    assert json.loads((tmp_path / "report.json").read_text())["total"] == [5.0]
+
+
+def test_report_clips_entries_to_dates(temp_tracker, capsys):
+    """Test that date-filtered reports only count the time of entries
+    within the dates, and that running timers are skipped."""
+    tracker = temp_tracker
+    tracker.safe_write_csv(
+        dict(zip(HEADERS, row))
+        for row in [
+            ("2024-01-31T22:00:00", "2024-02-01T02:00:00", "14400", "batch"),
+            ("2024-01-15T09:00:00", "2024-01-15T10:00:00", "3600", "a"),
+            ("2024-02-29T23:00:00", "2024-03-01T00:00:00", "3600", "a"),
+            ("2024-03-01T09:00:00", "", "", "running"),
+        ]
+    )
+    totals, dates = tracker.generate_report(
+        start_date="2024-02-01", end_date="2024-02-29"
+    )
+    assert totals == {"batch": 7200.0, "a": 3600.0}
+    assert dates == (date(2024, 2, 1), date(2024, 2, 29))
+    totals, _ = tracker.generate_report(
+        start_date="2024-01-01", end_date="2024-01-31"
+    )
+    assert totals == {"a": 3600.0, "batch": 7200.0}
+    totals, _ = tracker.generate_report()
+    assert totals == {"a": 7200.0, "batch": 14400.0}
+
+    # The index is rebuilt when the file changes:
+    tracker.track()
+    totals, _ = tracker.generate_report(start_date="2024-03-01")
+    assert set(totals) == {"running"}
+    tracker.report(start_date="2024-01-31", end_date="2024-01-31")
+    assert "batch: 2.00 h" in capsys.readouterr().out
@@ -0,0 +1,61 @@
+"""This file contains tests for the csv_append module."""
+
+import csv
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from time_tracker.constants import HEADERS
+from time_tracker.utils import append_csv_row, format_csv_row
+
+ROWS = [
+    dict(zip(HEADERS, ["2024-01-01T09:00:00", "", "", "planning"])),
+    dict(zip(HEADERS, ["a,b", 'say "hi"', "line\nbreak", "cr\r"])),
+    dict(zip(HEADERS, [" padded ", None, 1.5, 'a"b,c'])),
+    {HEADERS[0]: "missing fields"},
+    {HEADERS[-1]: "ünïcödé, tasks"},
+]
+
+
+@pytest.mark.parametrize("row", ROWS)
+def test_format_matches_dict_writer(row):
+    """Test that rows are formatted exactly as csv.DictWriter does."""
+    expected = io.StringIO()
+    csv.DictWriter(
+        expected, fieldnames=HEADERS, quoting=csv.QUOTE_MINIMAL
+    ).writerow(row)
+    assert format_csv_row(row, HEADERS) == expected.getvalue()
+
+
+def test_format_single_empty_field():
+    """Test that a lone empty field is quoted, as csv.writer does."""
+    assert format_csv_row({"a": ""}, ["a"]) == '""\r\n'
+
+
+def test_format_extra_fields():
+    """Test that fields missing from the fieldnames are rejected."""
+    with pytest.raises(ValueError):
+        format_csv_row({"unknown": 1}, HEADERS)
+
+
+def test_append_csv_row(tmp_path):
+    """Test that appended rows read back as written, including under
+    concurrent appends."""
+    path = tmp_path / "data.csv"
+    with path.open("w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerow(HEADERS)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(
+            executor.map(
+                lambda row: append_csv_row(path, row, HEADERS), ROWS * 50
+            )
+        )
+
+    with path.open("r", newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == len(ROWS) * 50
+    expected = [
+        {key: str(row.get(key) or "") for key in HEADERS} for row in ROWS
+    ]
+    assert all(row in expected for row in rows)
@@ -0,0 +1,39 @@
+"""This file contains tests for the external_sort function."""
+
+import random
+
+import pytest
+
+from time_tracker.utils import external_sort
+
+FIELDNAMES = ["key", "order"]
+
+
+@pytest.mark.parametrize(
+    "chunk_size,max_fan_in",
+    [(1000, 64), (7, 64), (7, 2), (1, 3)],
+    ids=["in_memory", "one_pass", "multi_pass", "tiny_chunks"],
+)
+def test_external_sort(tmp_path, chunk_size, max_fan_in):
+    """Test that rows are sorted stably, whether or not they're spilled
+    to disk, and that temporary files are removed."""
+    rng = random.Random(0)
+    rows = [
+        {"key": str(rng.randrange(20)), "order": str(i)} for i in range(100)
+    ]
+
+    def key(row):
+        return int(row["key"])
+
+    result = list(
+        external_sort(
+            iter(rows),
+            key,
+            FIELDNAMES,
+            chunk_size=chunk_size,
+            tmp_dir=tmp_path,
+            max_fan_in=max_fan_in,
+        )
+    )
+    assert result == sorted(rows, key=key)
+    assert not list(tmp_path.iterdir())
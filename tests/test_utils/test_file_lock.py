@@ -0,0 +1,42 @@
+"""This file contains tests for the file_lock module."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from time_tracker.utils import append_locked, locked_file
+
+
+def test_append_locked_creates_and_appends(tmp_path):
+    """Test that append_locked creates a missing file, and appends to it."""
+    path = tmp_path / "data.bin"
+    append_locked(path, b"first\n")
+    append_locked(path, b"second\n")
+    assert path.read_bytes() == b"first\nsecond\n"
+
+
+def test_append_locked_concurrent(tmp_path):
+    """Test that concurrent appends don't interleave, nor land inside a
+    batch written under the lock."""
+    path = tmp_path / "data.txt"
+    lines = [f"{i:04d}".encode() * 64 + b"\n" for i in range(200)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        with locked_file(path) as f:
+            futures = [
+                executor.submit(append_locked, path, line) for line in lines
+            ]
+            f.write("batch\n" * 50)
+        for future in futures:
+            future.result()
+    written = path.read_bytes().splitlines(keepends=True)
+    assert written[:50] == [b"batch\n"] * 50
+    assert sorted(written[50:]) == lines
+
+
+def test_append_locked_align(tmp_path):
+    """Test that append_locked truncates a partial record before
+    appending, given the records' size."""
+    path = tmp_path / "records"
+    path.write_bytes(b"abcdef")
+    assert append_locked(path, b"ghij", align=4) == 2
+    assert path.read_bytes() == b"abcdghij"
+    assert append_locked(path, b"klmn", align=4) == 0
+    assert path.read_bytes() == b"abcdghijklmn"
@@ -1,5 +1,6 @@
 """This file contains tests for the function get_unique_file."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from time_tracker.utils import get_unique_filename
@@ -97,3 +98,56 @@ def test_work_with_path_object(temp_dir):
     result = get_unique_filename(path_obj, logger_filename=logger_filename)
     assert isinstance(result, Path)
     assert result.name == THING_1_TEXT
+
+
+def test_claim_new_file(temp_dir):
+    """Tests that claiming a free name creates it."""
+    out_path = temp_dir / "result.txt"
+    logger_filename = temp_dir / "log.log"
+    result = get_unique_filename(
+        out_path, logger_filename=logger_filename, claim=True
+    )
+    assert result == out_path
+    assert result.exists()
+
+
+def test_claim_after_highest_existing(temp_dir):
+    """Tests that claiming skips past the highest existing version,
+    without filling gaps."""
+    for name in ("result.txt", RESULT_1_TEXT, "result (4).txt", "other.txt"):
+        (temp_dir / name).write_text("dummy")
+    logger_filename = temp_dir / "log.log"
+    result = get_unique_filename(
+        temp_dir / RESULT_1_TEXT, logger_filename=logger_filename, claim=True
+    )
+    assert result.name == RESULT_5_TEXT
+    assert result.read_text(encoding="utf-8") == ""
+
+
+def test_claim_numbered_name_above_existing(temp_dir):
+    """Tests that a requested numbered name is kept if it's newer than
+    the existing versions."""
+    (temp_dir / "result.txt").write_text("dummy")
+    logger_filename = temp_dir / "log.log"
+    result = get_unique_filename(
+        temp_dir / RESULT_5_TEXT, logger_filename=logger_filename, claim=True
+    )
+    assert result.name == RESULT_5_TEXT
+
+
+def test_claim_concurrently(temp_dir):
+    """Tests that concurrent callers all get different files."""
+    logger_filename = temp_dir / "log.log"
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda _: get_unique_filename(
+                    temp_dir / "out" / "result.txt",
+                    logger_filename=logger_filename,
+                    claim=True,
+                ),
+                range(32),
+            )
+        )
+    assert len(set(results)) == len(results)
+    assert all(result.exists() for result in results)
@@ -0,0 +1,83 @@
+"""This file contains tests for the latex_format module."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from time_tracker.utils import ensure_preamble_format, split_preamble
+
+PREAMBLE = "\\documentclass{article}\n\\usepackage{array}\n"
+BODY = "\\begin{document}\nHi\n\\end{document}\n"
+
+
+def test_split_preamble():
+    """Tests splitting LaTeX source at \\begin{document}."""
+    preamble, body = split_preamble(PREAMBLE + BODY)
+    assert preamble == PREAMBLE
+    assert body == BODY
+
+
+def test_split_preamble_no_document():
+    """Tests that source without a document body raises."""
+    with pytest.raises(ValueError):
+        split_preamble(PREAMBLE)
+
+
+def test_ensure_preamble_format_builds_once(temp_dir, mocker):
+    """Tests that the format is only built when the preamble changes."""
+
+    def fake_run(cmd, cwd, **kwargs):  # pylint: disable=unused-argument
+        """Fake pdflatex -ini by writing the format file."""
+        name = next(c for c in cmd if c.startswith("-jobname="))
+        (Path(cwd) / f"{name.split('=', 1)[1]}.fmt").write_text("fmt")
+
+    mock_run = mocker.patch(
+        "time_tracker.utils.latex_format.subprocess.run",
+        side_effect=fake_run,
+    )
+    name = ensure_preamble_format(PREAMBLE, temp_dir)
+    assert (temp_dir / f"{name}.fmt").exists()
+    assert (temp_dir / f"{name}.tex").read_text().endswith("\\dump\n")
+    assert ensure_preamble_format(PREAMBLE, temp_dir) == name
+    mock_run.assert_called_once()
+
+    # A changed preamble gets a new format, and the stale one is removed:
+    new_name = ensure_preamble_format(PREAMBLE + "% changed\n", temp_dir)
+    assert new_name != name
+    assert mock_run.call_count == 2
+    assert not (temp_dir / f"{name}.fmt").exists()
+    assert (temp_dir / f"{new_name}.fmt").exists()
+
+
+def test_ensure_preamble_format_concurrent(temp_dir, mocker):
+    """Tests that concurrent runs build a format once, under a temporary
+    name, and only remove stale formats once it's in place."""
+    stale = temp_dir / "preamble-0123456789abcdef.fmt"
+    stale.write_text("old fmt")
+
+    def fake_run(cmd, cwd, **kwargs):  # pylint: disable=unused-argument
+        """Fake a slow pdflatex -ini, checking what's in place."""
+        jobname = next(c for c in cmd if c.startswith("-jobname="))
+        jobname = jobname.split("=", 1)[1]
+        assert not (Path(cwd) / f"{jobname.rsplit('.', 1)[0]}.fmt").exists()
+        assert stale.exists()
+        time.sleep(0.1)
+        (Path(cwd) / f"{jobname}.fmt").write_text("fmt")
+
+    mock_run = mocker.patch(
+        "time_tracker.utils.latex_format.subprocess.run",
+        side_effect=fake_run,
+    )
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        names = list(
+            executor.map(
+                lambda _: ensure_preamble_format(PREAMBLE, temp_dir), range(4)
+            )
+        )
+    assert len(set(names)) == 1
+    mock_run.assert_called_once()
+    assert [path.name for path in temp_dir.glob("*.fmt")] == [
+        f"{names[0]}.fmt"
+    ]
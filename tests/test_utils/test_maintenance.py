@@ -0,0 +1,124 @@
+"""This file contains tests for the maintenance module."""
+
+from datetime import datetime
+
+import pytest
+
+from time_tracker.constants import HEADERS
+from time_tracker.utils.maintenance import (
+    clean_sorted_rows,
+    new_sort_report,
+    normalize_rows,
+    replacing_file,
+    sort_entry_rows,
+    trim_start,
+    validate_entries,
+    validate_entry,
+)
+
+
+def make_row(start, end="", task="a", duration=""):
+    """An entry row."""
+    return dict(zip(HEADERS, [start, end, duration, task]))
+
+
+def test_validate_entry():
+    """Test that entries are reduced to HEADERS, with recomputed
+    durations and normalized tasks."""
+    entry = make_row("2024-01-01T09:00:00", "2024-01-01T09:30:00", "a and b")
+    assert validate_entry(entry | {"extra": "x"}) == make_row(
+        "2024-01-01T09:00:00", "2024-01-01T09:30:00", "a, b", "1800.00"
+    )
+    assert validate_entry(entry, normalize_task=False) == make_row(
+        "2024-01-01T09:00:00", "2024-01-01T09:30:00", "a and b", "1800.00"
+    )
+    with pytest.raises(ValueError, match="before start"):
+        validate_entry(make_row("2024-01-02", "2024-01-01"))
+
+
+def test_validate_entries_open_last():
+    """Test that only the last entry of a batch can be open."""
+    closed = make_row("2024-01-01", "2024-01-02")
+    assert validate_entries([closed, make_row("2024-01-03")])
+    with pytest.raises(ValueError, match="Entry 1: Missing end"):
+        validate_entries([make_row("2024-01-03"), closed])
+
+
+def test_trim_start():
+    """Test starting an overlapping entry later, or dropping it."""
+    entry = make_row("2024-01-01T09:00:00", "2024-01-01T10:00:00")
+    end = datetime.fromisoformat("2024-01-01T10:00:00")
+    assert trim_start(
+        entry, datetime.fromisoformat("2024-01-01T09:30:00"), end
+    ) == make_row(
+        "2024-01-01T09:30:00", "2024-01-01T10:00:00", duration="1800.00"
+    )
+    assert trim_start(entry, end, end) is None
+
+
+@pytest.mark.parametrize("fix_overlaps", [False, True])
+def test_clean_sorted_rows(fix_overlaps):
+    """Test dropping duplicates, and reporting (or fixing) overlaps."""
+    rows = [
+        make_row("2024-01-01T09:00:00", "2024-01-01T11:00:00"),
+        make_row("2024-01-01T09:00:00", "2024-01-01T11:00:00"),
+        make_row("2024-01-01T09:30:00", "2024-01-01T10:00:00", "inside"),
+        make_row("2024-01-01T10:30:00", "2024-01-01T12:00:00", "after"),
+        make_row("2024-01-01T13:00:00"),
+    ]
+    report = new_sort_report()
+    cleaned = list(
+        clean_sorted_rows(rows, report, fix_overlaps, max_examples=1)
+    )
+    assert report["duplicates"] == 1
+    assert report["overlaps"] == 2
+    assert len(report["overlap_examples"]) == 1
+    if fix_overlaps:
+        assert report["overlaps_fixed"] == 2
+        assert cleaned == [
+            rows[0],
+            make_row(
+                "2024-01-01T11:00:00",
+                "2024-01-01T12:00:00",
+                "after",
+                "3600.00",
+            ),
+            rows[-1],
+        ]
+    else:
+        assert cleaned == [rows[0], *rows[2:]]
+    assert report["rows_written"] == len(cleaned)
+
+
+def test_sort_entry_rows():
+    """Test sorting rows, checking whether they were sorted."""
+    rows = [make_row("2024-01-02"), make_row("2024-01-01", "2024-01-01")]
+    report = new_sort_report()
+    assert list(sort_entry_rows(rows, report, chunk_size=1)) == rows[::-1]
+    assert report["rows_read"] == len(rows)
+    assert not report["was_sorted"]
+
+
+def test_normalize_rows():
+    """Test normalizing tasks a chunk at a time, counting the changes."""
+    rows = [make_row("2024-01-01", task=task) for task in ("a and b", "c")]
+    counts = {"read": 0, "changed": 0}
+    normalized = list(normalize_rows(rows, counts, chunk_size=1))
+    assert [entry[HEADERS[-1]] for entry in normalized] == ["a, b", "c"]
+    assert counts == {"read": 2, "changed": 1}
+
+
+def test_replacing_file(tmp_path):
+    """Test that the file is only replaced if the block succeeds."""
+    path = tmp_path / "entries.csv"
+    path.write_text("old")
+    with pytest.raises(RuntimeError):
+        with replacing_file(path, "test") as tmp:
+            tmp.write_text("partial")
+            raise RuntimeError
+    assert path.read_text() == "old"
+    assert list(tmp_path.iterdir()) == [path]
+    with replacing_file(path, "test") as tmp:
+        tmp.write_text("new")
+    assert path.read_text() == "new"
+    assert list(tmp_path.iterdir()) == [path]
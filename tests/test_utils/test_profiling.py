@@ -0,0 +1,23 @@
+"""This file contains tests for the profiling helper."""
+
+import pstats
+
+from time_tracker.utils import profile_call
+
+
+def test_profile_call(tmp_path, mocker):
+    """Test that the call's result is returned, and its stats saved and
+    summarized."""
+    logger = mocker.Mock()
+    prof_path = tmp_path / "profiles" / "test.prof"
+
+    def work():
+        return sum(range(100))
+
+    assert profile_call(work, logger, prof_path, top=5) == 4950
+    assert prof_path.is_file()
+    stats = pstats.Stats(str(prof_path))
+    assert any(func[2] == "work" for func in stats.stats)  # type: ignore
+    args = logger.info.call_args.args
+    assert args[1:3] == (prof_path, 5)
+    assert "work" in args[3]
@@ -0,0 +1,31 @@
+"""This file contains tests for the read_entries function."""
+
+import pytest
+
+from time_tracker.utils import read_entries
+
+
+def test_read_csv(tmp_path):
+    """Test reading entries from a CSV file."""
+    path = tmp_path / "entries.csv"
+    path.write_text('start,end,task\r\n2024-01-01,,"a, b"\r\n')
+    assert list(read_entries(path)) == [
+        {"start": "2024-01-01", "end": "", "task": "a, b"}
+    ]
+
+
+def test_read_json_lines(tmp_path):
+    """Test reading entries from a JSON lines file."""
+    path = tmp_path / "entries.jsonl"
+    path.write_text('{"start": "2024-01-01"}\n\n{"start": "2024-01-02"}\n')
+    assert [entry["start"] for entry in read_entries(path)] == [
+        "2024-01-01",
+        "2024-01-02",
+    ]
+
+    path.write_text('{"start": "2024-01-01"}\n[1, 2]\n')
+    with pytest.raises(ValueError, match=":2: Expected an object"):
+        list(read_entries(path))
+    path.write_text("{not json}\n")
+    with pytest.raises(ValueError, match=":1:"):
+        list(read_entries(path))
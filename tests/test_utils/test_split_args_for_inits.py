@@ -1,16 +1,21 @@
 """This file contains tests for the functions, classes, and decorators
 in the split_args_for_inits module."""  # pylint: disable=too-many-lines
 
+import ast
 import builtins
 import dis
 import inspect
 
+import pytest
+
 from time_tracker.utils import (
     LEFTOVERS,
     SplitInitMixin,
     apply_split_inits,
     auto_split_init,
+    compiled_split_init,
     split_args_for_inits_strict_kwargs,
+    split_init_mixin,
 )
 
 # _find_calling_class_from_init_old,; apply_split_inits_old,
@@ -19,12 +24,27 @@ from time_tracker.utils.split_args_for_inits import (  # pylint: disable=unused-
     apply_dis_bytecode_routing,
     apply_type_heuristic_routing,
     call_init_chain_respecting_super,
+    clear_introspection_caches,
     find_safe_kwargs_targets,
+    find_super_chains,
+    parse_source_file,
     share_missing_params_across_parents,
     uses_super,
 )
 
 
+@pytest.fixture(autouse=True, params=["dynamic", "compiled"])
+def split_init_mode(request, monkeypatch):
+    """Run every test with both the dynamic and the compiled (generated)
+    routing, which must behave the same."""
+    monkeypatch.setattr(
+        split_init_mixin,
+        "COMPILE_SPLIT_INITS",
+        request.param == "compiled",
+    )
+    return request.param
+
+
 class Test_FullTests:  # pylint:disable=invalid-name
     """Tests of the full integration."""
 
@@ -568,6 +588,53 @@ class Test_apply_dis_bytecode_routing:  # pylint: disable=invalid-name
             orig_getsourcefile,
         )
 
+    @staticmethod
+    def test_ancestor_inits_scanned():
+        """Keys read by an ancestor's __init__ are routed to the base."""
+
+        class Grandparent:  # pylint: disable=too-few-public-methods
+            """Class reading a key from kwargs."""
+
+            def __init__(self, **kwargs):
+                self.key = kwargs.get("deep_key")
+
+        class Parent(Grandparent):  # pylint: disable=too-few-public-methods
+            """Class reading another key from kwargs."""
+
+            def __init__(self, **kwargs):
+                self.other = kwargs.get("other_key")
+                super().__init__(**kwargs)
+
+        class Child(Parent):  # pylint: disable=too-few-public-methods
+            """Wrapper class around Parent."""
+
+        remaining = {"deep_key": 1, "other_key": 2, "unknown": 3}
+        routing = {Parent: {"args": [], "kwargs": {}}}
+        apply_dis_bytecode_routing(Child, remaining, routing)
+        assert routing[Parent]["kwargs"] == {"deep_key": 1, "other_key": 2}
+        assert remaining == {"unknown": 3}
+
+    @staticmethod
+    def test_bytecode_scanned_once(mocker):
+        """Each __init__ is disassembled only once."""
+        clear_introspection_caches()
+
+        class Parent:  # pylint: disable=too-few-public-methods
+            """Class reading a key from kwargs."""
+
+            def __init__(self, **kwargs):
+                self.key = kwargs.get("key")
+
+        class Child(Parent):  # pylint: disable=too-few-public-methods
+            """Wrapper class around Parent."""
+
+        spy = mocker.spy(dis, "get_instructions")
+        for _ in range(3):
+            routing = {Parent: {"args": [], "kwargs": {}}}
+            apply_dis_bytecode_routing(Child, {"key": 1}, routing)
+            assert routing[Parent]["kwargs"] == {"key": 1}
+        assert spy.call_count == 1
+
 
 class Test_split_args_for_inits:  # pylint: disable=invalid-name
     """Tests for split_args_for_inits"""
@@ -1612,6 +1679,227 @@ class Test_Alphabet:  # pylint: disable=invalid-name
         # assert n_inst._init_leftovers["kwargs"] == kwargs  # pylint: disable=protected-access
 
 
+class Test_introspection_caches:  # pylint: disable=invalid-name
+    """Tests for the per-class and per-function introspection caches."""
+
+    class A:  # pylint: disable=too-few-public-methods
+        """Class accepting one positional arg."""
+
+        def __init__(self, a):
+            self.a = a
+
+    class B:  # pylint: disable=too-few-public-methods
+        """Class accepting variable kwargs."""
+
+        def __init__(self, b=0, **kwargs):
+            self.b = b
+            self.b_kwargs = kwargs
+            super().__init__()
+
+    def test_introspection_once_per_class(self, mocker):
+        """Test that signatures are computed once per class, not per
+        instantiation."""
+
+        class C(SplitInitMixin, self.A, self.B):
+            """Class using the mixin."""
+
+        clear_introspection_caches()
+        spy = mocker.spy(inspect, "signature")
+        first = C(1, b=2, extra=3)
+        calls = spy.call_count
+        assert calls > 0
+        for _ in range(5):
+            c = C(1, b=2, extra=3)
+        assert spy.call_count == calls
+        assert (c.a, c.b) == (first.a, first.b) == (1, 2)
+        assert c.b_kwargs == first.b_kwargs == {"extra": 3}
+
+    def test_cache_invalidated_when_init_replaced(self):
+        """Test that replacing an __init__ in the MRO drops cached plans."""
+
+        class Parent:  # pylint: disable=too-few-public-methods
+            """Parent class."""
+
+            def __init__(self, x=0):
+                self.x = x
+
+        class Child(Parent):  # pylint: disable=too-few-public-methods
+            """Child class."""
+
+        split = split_args_for_inits_strict_kwargs(Child, (), {"y": 1})
+        assert split[LEFTOVERS]["kwargs"] == {"y": 1}
+
+        def new_init(self, y=0):
+            self.y = y
+
+        Parent.__init__ = new_init  # type: ignore[method-assign]
+        split = split_args_for_inits_strict_kwargs(Child, (), {"y": 1})
+        assert split[Parent]["kwargs"] == {"y": 1}
+        assert not split[LEFTOVERS]["kwargs"]
+
+    def test_cached_results_are_copies(self):
+        """Test that callers can't modify cached results."""
+
+        class C(self.A, self.B):  # pylint: disable=too-few-public-methods
+            """Class with two parents."""
+
+        targets = find_safe_kwargs_targets(C)
+        targets.add(int)
+        assert int not in find_safe_kwargs_targets(C)
+        chains = find_super_chains(C)
+        chains[0].append(int)
+        assert int not in find_super_chains(C)[0]
+
+
+class Test_uses_super_caching:  # pylint: disable=invalid-name
+    """Tests for the caching and fallbacks of uses_super."""
+
+    class WithSuper:  # pylint: disable=too-few-public-methods
+        """Class whose __init__ calls super()."""
+
+        def __init__(self):
+            super().__init__()
+            self.initialized = True
+
+    class WithoutSuper:  # pylint: disable=too-few-public-methods
+        """Class whose __init__ doesn't call super()."""
+
+        def __init__(self):  # pylint: disable=super-init-not-called
+            pass
+
+    def test_source_parsed_once(self, mocker):
+        """Test that a source file is parsed once for all its classes."""
+        clear_introspection_caches()
+        spy = mocker.spy(ast, "parse")
+        assert uses_super(self.WithSuper)
+        assert not uses_super(self.WithoutSuper)
+        assert uses_super(self.WithSuper)
+        assert spy.call_count == 1
+
+    def test_source_reparsed_when_changed(self, tmp_path, mocker):
+        """Test that a changed source file is parsed again."""
+        source = tmp_path / "module.py"
+        source.write_text("x = 1\n")
+        spy = mocker.spy(ast, "parse")
+        parse_source_file(str(source))
+        parse_source_file(str(source))
+        assert spy.call_count == 1
+        source.write_text("x = 12\n")
+        parse_source_file(str(source))
+        assert spy.call_count == 2
+
+    @pytest.mark.parametrize(
+        "getsourcefile",
+        [lambda cls: None, lambda cls: "/no/such/app.pyz/module.py"],
+        ids=["pyc_only", "zipapp"],
+    )
+    def test_bytecode_fallback(self, monkeypatch, getsourcefile):
+        """Test that bytecode is checked when source isn't available."""
+        clear_introspection_caches()
+        monkeypatch.setattr("inspect.getsourcefile", getsourcefile)
+        assert uses_super(self.WithSuper)
+        assert not uses_super(self.WithoutSuper)
+        clear_introspection_caches()
+
+
+class Test_compiled_split_init:  # pylint: disable=invalid-name
+    """Tests for the compiled (generated) split __init__."""
+
+    class A:  # pylint: disable=too-few-public-methods
+        """Class accepting one positional arg."""
+
+        def __init__(self, a):
+            self.a = a
+
+    class B:  # pylint: disable=too-few-public-methods
+        """Class accepting variable kwargs."""
+
+        def __init__(self, b=0, **kwargs):
+            self.b = b
+            self.b_kwargs = kwargs
+            super().__init__()
+
+    class C:  # pylint: disable=too-few-public-methods
+        """Class accepting a keyword-only arg."""
+
+        def __init__(self, c=None, *, d=1):
+            self.c = c
+            self.d = d
+
+    @pytest.mark.parametrize(
+        "args, kwargs",
+        [
+            ((1,), {}),
+            ((1,), {"b": 2}),
+            ((1, 2), {"d": 3}),
+            ((), {"a": 1, "c": 2, "d": 3, "extra": 4}),
+            ((1,), {"not-an-identifier": 2, "class": 3}),
+        ],
+    )
+    def test_compiled_matches_dynamic(self, args, kwargs):
+        """Test that compiled routing matches the dynamic routing."""
+
+        class X(SplitInitMixin, self.A, self.B, self.C):
+            """Class using the mixin."""
+
+        @auto_split_init
+        class Y(
+            self.A, self.B, self.C
+        ):  # pylint: disable=too-few-public-methods
+            """Class using the dynamic decorator."""
+
+            def __init__(self, *args, **kwargs):
+                self.own = (args, kwargs)
+
+        @auto_split_init(compiled=True)
+        class Z(
+            self.A, self.B, self.C
+        ):  # pylint: disable=too-few-public-methods
+            """Class using the compiled decorator."""
+
+            def __init__(self, *args, **kwargs):
+                self.own = (args, kwargs)
+
+        X.split_init_compiled = False
+        dynamic = vars(X(*args, **kwargs))
+        X.split_init_compiled = True
+        compiled = vars(X(*args, **kwargs))
+        assert compiled == dynamic
+        assert vars(Z(*args, **kwargs)) == vars(Y(*args, **kwargs))
+
+    def test_compiled_once_per_call_shape(self, mocker):
+        """Test that routing is generated once per class and call shape,
+        and again when an __init__ is replaced."""
+        spy = mocker.spy(compiled_split_init, "_compile_split_init")
+
+        class Parent:  # pylint: disable=too-few-public-methods
+            """Parent class."""
+
+            def __init__(self, a):
+                self.a = a
+
+        class X(SplitInitMixin, Parent, self.B):
+            """Class using the mixin."""
+
+            split_init_compiled = True
+
+        for value in range(3):
+            x = X(value, b=value)
+            assert (x.a, x.b) == (value, value)
+        assert spy.call_count == 1
+        X(1)
+        X(1, extra=2)
+        assert spy.call_count == 3
+
+        def new_init(self, a, b=0):
+            self.a = (a, b)
+
+        Parent.__init__ = new_init  # type: ignore[method-assign]
+        x = X(1, b=2)
+        assert spy.call_count == 4
+        assert x.a == (1, 2)
+
+
 # if __name__ == "__main__":
 #     test_split_args_for_inits_strict_kwargs()
 #     test_split_init_mixin()
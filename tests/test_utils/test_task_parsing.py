@@ -0,0 +1,48 @@
+"""This file contains tests for the task_parsing module."""
+
+import pytest
+
+from time_tracker.utils import (
+    merge_task_lists,
+    normalize_task_column,
+    normalize_tasks,
+    split_task_names,
+)
+
+TASKS = [
+    ("planning", "planning"),
+    ("  planning ", "planning"),
+    ("", ""),
+    (" , ", ""),
+    ("planning and design", "planning, design"),
+    ("planning,design , planning", "planning, design"),
+    ("planning\tand\ndesign and review", "planning, design, review"),
+    ("brand design", "brand design"),
+    ("sandbox and android", "sandbox, android"),
+    ("and", "and"),
+    ("a and  and b", "a, and b"),
+]
+
+
+@pytest.mark.parametrize("task_str, expected", TASKS)
+def test_normalize_tasks(task_str, expected):
+    """Test normalizing task strings, with and without separators."""
+    assert normalize_tasks(task_str) == expected
+    assert split_task_names(task_str) == tuple(
+        task for task in expected.split(", ") if task
+    )
+
+
+def test_normalize_task_column():
+    """Test that a column is normalized as by normalize_tasks."""
+    column = [task_str for task_str, _ in TASKS] * 3 + [None]
+    assert normalize_task_column(iter(column)) == [
+        expected for _, expected in TASKS
+    ] * 3 + [""]
+
+
+def test_merge_task_lists():
+    """Test merging comma-separated task lists."""
+    assert merge_task_lists("a, b", "b,c, ,a") == "a, b, c"
+    assert merge_task_lists("", "") == ""
+    assert merge_task_lists("a and b", "") == "a and b"